@@ -1,11 +1,70 @@
 import json
+import sqlite3
+import asyncio
+import heapq
+import mmap
+import struct
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from web3 import Web3
+from web3.exceptions import ContractLogicError
 from hexbytes import HexBytes
-from collections import deque
+from collections import deque, OrderedDict
+from copy import copy
+from threading import Lock
+from time import monotonic, perf_counter
+from functools import lru_cache
+from itertools import count, groupby
+
+# NumPy è richiesto unicamente dal motore di ricerca vettoriale (vedi ArrayProofGraph)
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 NULL_PRINCIPAL = "0x0000000000000000000000000000000000000000"
 NULL_ROLENAME = "0x0000"
 MAX_WEIGHT = 100
+# Numero massimo di ruoli le cui credenziali sono lette con una singola chiamata aggregata al contratto
+DEFAULT_BATCH_SIZE = 64
+# Numero massimo di letture contemporaneamente in corso durante una ricerca asincrona
+DEFAULT_CONCURRENCY = 8
+# Numero massimo complessivo di identificativi delle dimostrazioni verificate con una singola chiamata verifyProofs,
+# così che ciascuna chiamata resti entro il limite di gas imposto dal nodo alle eth_call
+DEFAULT_VERIFY_BATCH_LENGTH = 512
+# Numero massimo di espressioni mantenute nella cache delle espressioni internate
+EXPRESSION_CACHE_SIZE = 1 << 16
+# Numero massimo di risultati e validità in secondi della cache delle ricerche
+DEFAULT_SEARCH_CACHE_SIZE = 32
+DEFAULT_SEARCH_CACHE_TTL = 60
+# Numero di ruoli di partenza assegnati a ciascun processo per volta dalla ricerca parallela
+DEFAULT_PARALLEL_CHUNK_SIZE = 16
+
+# Modalità di propagazione delle soluzioni nel ProofGraph
+RECURSIVE_PROPAGATION = 'recursive'
+PRIORITY_PROPAGATION = 'priority'
+
+# Obiettivi di selezione delle soluzioni per ciascun membro del ruolo di partenza
+WEIGHT_OBJECTIVE = 'weight'
+LENGTH_OBJECTIVE = 'length'
+PARETO_OBJECTIVE = 'pareto'
+
+# Estremi superiori (in secondi) degli intervalli degli istogrammi di latenza delle letture di SearchStats
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5)
+
+# Operazioni sulle credenziali notificate dagli eventi CredentialChanged, come definite dal contratto on-chain
+CREDENTIAL_NEW_ROLE = 0
+CREDENTIAL_ADDED = 1
+CREDENTIAL_REMOVED = 2
+CREDENTIAL_UPDATED = 3
+
+# Numero massimo di blocchi interessati da ciascuna richiesta eth_getLogs
+DEFAULT_LOG_BLOCK_RANGE = 2000
+
+# Valore delle celle prive di soluzione nelle matrici del motore di ricerca vettoriale
+ARRAY_NO_SOLUTION = -1.0
+# Predecessori delle soluzioni del motore di ricerca vettoriale non derivanti da un arco tra nodi
+ARRAY_MEMBER_PRED = -1
+ARRAY_INTERSECTION_PRED = -2
 
 """
 ------------------------------------------------------------------------------------
@@ -13,6 +72,18 @@ ESPRESSIONI
 ------------------------------------------------------------------------------------
 """
 
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def internExpression(exprType, *fields):
+    """
+    Restituisce l'istanza canonica dell'espressione di tipo exprType avente i campi forniti.
+    Le ultime EXPRESSION_CACHE_SIZE espressioni richieste sono mantenute in cache, così che l'identificativo
+    e l'hash di ciascuna di esse siano calcolati una sola volta
+    """
+    expr = object.__new__(exprType)
+    expr.build(*fields)
+    return expr
+
+
 class Expression:
     """
     Interfaccia per una generica espressione.
@@ -20,17 +91,29 @@ class Expression:
     Ogni espressione deve essere inizializzata con un identificativo,
     sulla cui base è definito l'operatore di uguaglianza tra espressioni.
     La generazione di tale identificativo varia a seconda del tipo di espressione
-    e corrisponde allo stesso metodo utilizzato da parte del contratto on-chain
+    e corrisponde allo stesso metodo utilizzato da parte del contratto on-chain.
+
+    Le espressioni sono immutabili ed internate tramite internExpression():
+    ogni sottoclasse inizializza i propri campi nel metodo build() anziché nel costruttore
     """
 
-    def __init__(self, id):
+    __slots__ = ('id', 'hashValue')
+
+    def __new__(cls, *fields):
+        return internExpression(cls, *fields)
+
+    def setId(self, id):
         self.id = id
+        self.hashValue = hash(Web3.toInt(id))
 
     def __hash__(self):
-        return Web3.toInt(self.id)
+        return self.hashValue
 
     def __eq__(self, other):
-        return self.id == other.id
+        return self is other or self.id == other.id
+
+    def __reduce__(self):
+        return (type(self), tuple(self))
 
 
 class SMExpression(Expression):
@@ -38,11 +121,13 @@ class SMExpression(Expression):
     Record di dati rappresentante una role expression per una credenziale Simple Member
     """
 
-    def __init__(self, member):
+    __slots__ = ('member',)
+
+    def build(self, member):
         b = bytes(HexBytes(member))
         # L'identificativo di una simple member è l'indirizzo del membro stesso
         # seguito da una sequenza di zeri
-        super().__init__(HexBytes(b.ljust(32, b'\x00')))
+        self.setId(HexBytes(b.ljust(32, b'\x00')))
         self.member = member
 
     def __iter__(self):
@@ -55,9 +140,11 @@ class SIExpression(Expression):
     o un assigned role di una qualsiasi credenziale
     """
     
-    def __init__(self, principal, roleName):
+    __slots__ = ('principal', 'roleName')
+
+    def build(self, principal, roleName):
         # L'identificativo di una simple inclusion è generata applicando la funzione di hashing sui propri dati
-        super().__init__(Web3.solidityKeccak(['address', 'bytes2', 'address', 'bytes2'], [principal, roleName, NULL_PRINCIPAL, NULL_ROLENAME]))
+        self.setId(Web3.solidityKeccak(['address', 'bytes2', 'address', 'bytes2'], [principal, roleName, NULL_PRINCIPAL, NULL_ROLENAME]))
         self.principal = principal
         self.roleName = roleName
 
@@ -70,9 +157,11 @@ class LIExpression(Expression):
     Record di dati rappresentante una role expression per una credenziale Linked Inclusion
     """
 
-    def __init__(self, principal, roleNameA, roleNameB):
+    __slots__ = ('principal', 'roleNameA', 'roleNameB')
+
+    def build(self, principal, roleNameA, roleNameB):
         # L'identificativo di una linked inclusion è generato applicando la funzione di hashing sui propri dati
-        super().__init__(Web3.solidityKeccak(['address', 'bytes2', 'address', 'bytes2'], [principal, roleNameA, NULL_PRINCIPAL, roleNameB]))
+        self.setId(Web3.solidityKeccak(['address', 'bytes2', 'address', 'bytes2'], [principal, roleNameA, NULL_PRINCIPAL, roleNameB]))
         self.principal = principal
         self.roleNameA = roleNameA
         self.roleNameB = roleNameB
@@ -86,12 +175,14 @@ class IIExpression(Expression):
     Record di dati rappresentante una role expression per una credenziale Intersection Inclusion
     """
 
-    def __init__(self, principalA, roleNameA, principalB, roleNameB):
+    __slots__ = ('principalA', 'roleNameA', 'principalB', 'roleNameB')
+
+    def build(self, principalA, roleNameA, principalB, roleNameB):
         # L'identificativo di una intersection inclusion è generato applicando la funzione di hashing sui propri dati
         # i quali sono anzitutto ordinati in modo da considerare equivalenti le espressioni P1.r1 ∩ P2.r2 e P2.r2 ∩ P1.r1
         if ((HexBytes(principalB) > HexBytes(principalA)) or (HexBytes(principalA) == HexBytes(principalB) and HexBytes(roleNameB) > HexBytes(roleNameA))):
             principalA, roleNameA, principalB, roleNameB = principalB, roleNameB, principalA, roleNameA
-        super().__init__(Web3.solidityKeccak(['address', 'bytes2', 'address', 'bytes2'], [principalA, roleNameA, principalB, roleNameB]))
+        self.setId(Web3.solidityKeccak(['address', 'bytes2', 'address', 'bytes2'], [principalA, roleNameA, principalB, roleNameB]))
         self.principalA = principalA
         self.roleNameA = roleNameA
         self.principalB = principalB
@@ -101,27 +192,186 @@ class IIExpression(Expression):
         yield from [self.principalA, self.roleNameA, self.principalB, self.roleNameB]
 
 
+class Credential:
+    """
+    Record di dati rappresentante una credenziale registrata sul contratto DART.
+
+    principal: l'indirizzo del principal che ha emesso la credenziale
+    roleName: il rolename dell'assigned role della credenziale
+    expr: la role expression (SM/SI/LI/II)Expression della credenziale
+    weight: il valore di fiducia associato alla credenziale
+    """
+
+    __slots__ = ('principal', 'roleName', 'expr', 'weight')
+
+    def __init__(self, principal, roleName, expr, weight):
+        self.principal = principal
+        self.roleName = roleName
+        self.expr = expr
+        self.weight = weight
+
+    @property
+    def role(self):
+        """
+        L'assigned role SIExpression della credenziale
+        """
+        return SIExpression(self.principal, self.roleName)
+
+
+class CredentialDelta:
+    """
+    Record di dati rappresentante un'alterazione delle credenziali registrate sul contratto DART,
+    ricavata da un evento CredentialChanged.
+
+    operation: l'operazione eseguita, tra
+               - CREDENTIAL_NEW_ROLE: creazione del ruolo credential.role (credential.expr è None)
+               - CREDENTIAL_ADDED: inserimento della credenziale, o aumento del suo valore di fiducia
+               - CREDENTIAL_REMOVED: rimozione della credenziale (credential.weight è None)
+               - CREDENTIAL_UPDATED: modifica del valore di fiducia della credenziale
+    credential: la Credential interessata, con il nuovo valore di fiducia
+    blockNumber: il numero del blocco in cui è avvenuta l'alterazione
+    """
+
+    __slots__ = ('operation', 'credential', 'blockNumber')
+
+    def __init__(self, operation, credential, blockNumber):
+        self.operation = operation
+        self.credential = credential
+        self.blockNumber = blockNumber
+
+
 """
 ------------------------------------------------------------------------------------
 ADT DI SUPPORTO PER ALGORITMO DI RICERCA
 ------------------------------------------------------------------------------------
 """
 
+class ProofPath:
+    """
+    Sequenza persistente ed immutabile di ProofEdge(s), rappresentata come albero binario di concatenazioni.
+
+    Le concatenazioni non copiano le sequenze concatenate ma le condividono strutturalmente,
+    richiedendo tempo e memoria costanti; la sequenza degli archi è ottenuta solamente quando necessario
+    iterando sul path, ad esempio per la costruzione della dimostrazione di una soluzione.
+
+    edge: l'arco rappresentato, per i path costituiti da un singolo arco
+    left, right: i due path concatenati, per i path costituiti da più archi
+    length: il numero di archi del path
+    """
+
+    __slots__ = ('edge', 'left', 'right', 'length')
+
+    def __init__(self, edge = None, left = None, right = None):
+        self.edge = edge
+        self.left = left
+        self.right = right
+        if edge is not None:
+            self.length = 1
+        elif left is not None:
+            self.length = left.length + right.length
+        else:
+            self.length = 0
+
+    def concat(self, other):
+        # Restituisci il path costituito dagli archi del path seguiti da quelli di other
+        if self.length == 0:
+            return other
+        if other.length == 0:
+            return self
+        return ProofPath(left=self, right=other)
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        # Visita iterativamente l'albero di concatenazioni, evitando la ricorsione su path molto lunghi
+        stack = [self]
+        while len(stack) != 0:
+            path = stack.pop()
+            if path.edge is not None:
+                yield path.edge
+            elif path.left is not None:
+                stack.append(path.right)
+                stack.append(path.left)
+
+
+EMPTY_PATH = ProofPath()
+
+
 class Solution:
     """
     Record di dati rappresentante una soluzione posseduta da un ProofNode.
 
     member: l'indirizzo del principal oggetto della soluzione
     weight: il valore di fiducia associato alla soluzione
-    path: sequenza di ProofEdge(s) attraversati dalla soluzione per giungere al ProofNode in possesso della soluzione stessa
+    path: ProofPath dei ProofEdge(s) attraversati dalla soluzione per giungere al ProofNode in possesso della soluzione stessa
     reqStackSize: dimensione della stack sufficiente affinché la soluzione possa essere verificata on-chain
+    proofLength: numero di credenziali che costituiscono la dimostrazione on-chain della soluzione (vedi compileProof())
+    hops: numero di passaggi di fiducia attraversati dalla soluzione, ovvero di deleghe lungo la catena che collega
+          il principal del ProofNode in possesso della soluzione al membro oggetto (vedi ProofEdge.signedHops)
     """
 
-    def __init__(self, member, weight, path = [], reqStackSize = 1):
+    __slots__ = ('member', 'weight', 'path', 'reqStackSize', 'proofLength', 'hops')
+
+    def __init__(self, member, weight, path = EMPTY_PATH, reqStackSize = 1, proofLength = 0, hops = 0):
         self.member = member
         self.weight = weight
         self.path = path
         self.reqStackSize = reqStackSize
+        self.proofLength = proofLength
+        self.hops = hops
+
+
+def intersectSolutions(solution, otherSolution):
+    """
+    Restituisce la soluzione risultante dall'intersezione di due soluzioni con medesimo membro oggetto:
+    il valore di fiducia è il minimo tra i due, il path è la concatenazione dei due path ponendo prima
+    quello con reqStackSize maggiore, e reqStackSize è sufficiente a verificare on-chain tale concatenazione.
+    I passaggi di fiducia sono il massimo tra i due, poiché entrambe le catene sono richieste
+    """
+    if solution.reqStackSize > otherSolution.reqStackSize:
+        outputPath = solution.path.concat(otherSolution.path)
+        outputReqStackSize = solution.reqStackSize
+    elif solution.reqStackSize < otherSolution.reqStackSize:
+        outputPath = otherSolution.path.concat(solution.path)
+        outputReqStackSize = otherSolution.reqStackSize
+    else:
+        outputPath = solution.path.concat(otherSolution.path)
+        outputReqStackSize = solution.reqStackSize + 1
+
+    return Solution(solution.member, min(solution.weight, otherSolution.weight), outputPath, outputReqStackSize,
+                    solution.proofLength + otherSolution.proofLength, max(solution.hops, otherSolution.hops))
+
+
+def dominates(solution, otherSolution):
+    """
+    Restituisce True se solution non è peggiore di otherSolution in alcuno dei criteri
+    valore di fiducia, lunghezza della dimostrazione e dimensione della stack richiesta
+    """
+    return (solution.weight >= otherSolution.weight and solution.proofLength <= otherSolution.proofLength
+            and solution.reqStackSize <= otherSolution.reqStackSize)
+
+
+def selectSolutions(fronts, objective, minWeight = 0):
+    """
+    Seleziona, per ciascun membro, le soluzioni del relativo fronte di Pareto con valore di fiducia
+    non inferiore a minWeight che meglio soddisfano l'obiettivo objective:
+    - LENGTH_OBJECTIVE: la soluzione con dimostrazione più corta (a parità, con valore di fiducia maggiore)
+    - PARETO_OBJECTIVE: la lista delle soluzioni del fronte, ordinate per valore di fiducia decrescente
+    I membri privi di soluzioni con valore di fiducia sufficiente sono omessi
+    """
+    selected = {}
+    for member, front in fronts.items():
+        candidates = [solution for solution in front if solution.weight >= minWeight]
+        if len(candidates) == 0:
+            continue
+        if objective == LENGTH_OBJECTIVE:
+            selected[member] = min(candidates, key=lambda solution: (solution.proofLength, -solution.weight, solution.reqStackSize))
+        elif objective == PARETO_OBJECTIVE:
+            selected[member] = sorted(candidates, key=lambda solution: (-solution.weight, solution.proofLength, solution.reqStackSize))
+        else:
+            raise ValueError("unknown objective: " + str(objective))
+    return selected
 
 
 class Monitor:
@@ -133,6 +383,8 @@ class Monitor:
     - proofGraph: il ProofGraph in cui inserire eventuali nuovi nodi o archi
     - dart: l'istanza di interfacciamento al contratto dart on-chain su cui è eseguita la ricerca
     - notify(): metodo per notificare al monitor una nuova soluzione
+    - retract(): metodo per scartare le soluzioni memorizzate dal monitor non più valide
+    - rederive(): metodo per rigenerare le soluzioni inviate al destNode a partire da quelle di un nodo sorgente
     """
 
     def __init__(self, destNode, proofGraph, dart):
@@ -143,6 +395,13 @@ class Monitor:
     def notify(self, solution, fromNode):
         pass
 
+    def retract(self, isInvalid):
+        pass
+
+    def rederive(self, fromNode):
+        for solution in list(fromNode.solutions.values()):
+            self.notify(solution, fromNode)
+
 
 class LinkingMonitor(Monitor):
     """
@@ -161,10 +420,32 @@ class LinkingMonitor(Monitor):
         # Aggiungi, se non presente, un nuovo nodo rappresentante l'espressione (solution.member).r2
         # ed un arco tra di esso e P.r1.r2 pesato con lo stesso valore di fiducia di solution
 
+        # Se il ProofGraph prevede la risoluzione differita dei ruoli linkati, la verifica di esistenza
+        # del nuovo ruolo è rimandata accodando la richiesta tra i collegamenti in sospeso del grafo
+
+        if self.proofGraph.stats is not None:
+            self.proofGraph.stats.linkingNotifications += 1
         linkedRole = SIExpression(solution.member, self.destNode.expr.roleNameB)
-        if self.dart.exprExists(linkedRole):
-            self.proofGraph.addNode(linkedRole)
-            self.proofGraph.addEdge(linkedRole, self.destNode.expr, solution.weight, solution)
+        if self.proofGraph.pendingLinks is not None:
+            self.proofGraph.pendingLinks.append((self, linkedRole, solution))
+        elif self.proofGraph.exprExists(linkedRole):
+            self.link(linkedRole, solution)
+        else:
+            self.proofGraph.addMissingLink(self, linkedRole, solution)
+
+    def link(self, linkedRole, solution):
+        # Collega il ruolo linkedRole, di cui è stata verificata l'esistenza, al nodo destinazione
+        self.proofGraph.addNode(linkedRole, self.destNode, solution.weight, hops=solution.hops)
+        self.proofGraph.addEdge(linkedRole, self.destNode.expr, solution.weight, solution)
+
+    def rederive(self, fromNode):
+        # Rigenera i soli collegamenti assenti, o presenti con un valore di fiducia minore della relativa soluzione di P.r1
+        for solution in list(fromNode.solutions.values()):
+            linkedRole = SIExpression(solution.member, self.destNode.expr.roleNameB)
+            linkedRoleNode = self.proofGraph.nodes.get(linkedRole)
+            if (linkedRoleNode is None or self.destNode not in linkedRoleNode.outEdges
+                    or linkedRoleNode.outEdges[self.destNode].weight < solution.weight):
+                self.notify(solution, fromNode)
 
 
 class IntersectionMonitor(Monitor):
@@ -174,12 +455,17 @@ class IntersectionMonitor(Monitor):
     Una IntersectionMonitor per gestire credenziali Intersection Inclusion A.a <- P1.r1 ∩ P2.r2:
     - ha come nodo destinazione destNode il ProofNode rappresentante l'espressione A.a
     - viene notificato alla ricezione di nuove soluzioni da parte dei ProofNode rappresentanti le espressioni P1.r1 e P2.r2
+
+    Se il ProofGraph prevede l'intersezione in blocco (vedi ProofGraph.flushJoins()), nelle ricerche con WEIGHT_OBJECTIVE
+    il monitor non memorizza le soluzioni notificate, ma solamente i membri le cui soluzioni sono nuove o migliorate
+    in changedMembers: questi sono intersecati in blocco con le soluzioni possedute dai due nodi tramite flush()
     """
 
     def __init__(self, destNode, proofGraph, dart):
         super().__init__(destNode, proofGraph, dart)
         self.solutionsA = {}
         self.solutionsB = {}
+        self.changedMembers = set()
         self.roleA = SIExpression(destNode.expr.principalA, destNode.expr.roleNameA)
         self.roleB = SIExpression(destNode.expr.principalB, destNode.expr.roleNameB)
     
@@ -193,6 +479,8 @@ class IntersectionMonitor(Monitor):
         # - come path una concatenazione dei paths delle due soluzioni, ponendo prima la più corta
         # - una reqStackSize sufficiente a verificare on-chain la sequenza di credenziali rappresentata dalla suddetta concatenazione dei path
 
+        if self.proofGraph.stats is not None:
+            self.proofGraph.stats.intersectionNotifications += 1
         if fromNode.expr == self.roleA:
             solutions = self.solutionsA
             otherSolutions = self.solutionsB
@@ -202,25 +490,76 @@ class IntersectionMonitor(Monitor):
         else:
             return
 
-        if solution.member not in solutions or solutions[solution.member].weight < solution.weight:
+        # Nella ricerca multi-obiettivo sono memorizzate, per ciascun membro, tutte le soluzioni notificate
+        # e ciascuna di esse è intersecata con tutte quelle dell'altro insieme
+        if self.destNode.fronts is not None:
+            solutions.setdefault(solution.member, []).append(solution)
+            for otherSolution in otherSolutions.get(solution.member, []):
+                self.join(solution, otherSolution)
+        elif self.proofGraph.pendingJoins is not None:
+            self.changedMembers.add(solution.member)
+            self.proofGraph.pendingJoins[self] = None
+        elif solution.member not in solutions or solutions[solution.member].weight < solution.weight:
             solutions[solution.member] = solution
             if solution.member in otherSolutions:
-                
-                otherSolution = otherSolutions[solution.member]
-                outputWeight = min(solution.weight, otherSolution.weight)
+                self.join(solution, otherSolutions[solution.member])
+
+    def join(self, solution, otherSolution):
+        # Invia al destNode la soluzione risultante dall'intersezione di due soluzioni con medesimo membro oggetto
+        outputWeight = min(solution.weight, otherSolution.weight)
+        if (outputWeight < self.proofGraph.minWeight
+                or not self.proofGraph.withinDepth(max(solution.hops, otherSolution.hops))):
+            if self.proofGraph.stats is not None:
+                self.proofGraph.stats.solutionsPruned += 1
+            return
+
+        self.destNode.addSolution(intersectSolutions(solution, otherSolution))
+
+    def retract(self, isInvalid):
+        # Scarta le soluzioni memorizzate non più valide
+        for solutions in (self.solutionsA, self.solutionsB):
+            for member in [member for member, solution in solutions.items() if isInvalid(solution)]:
+                del solutions[member]
+
+    def rederive(self, fromNode):
+        # Invia nuovamente al destNode l'intersezione di tutte le coppie di soluzioni memorizzate con medesimo membro oggetto;
+        # nell'intersezione in blocco, tutti i membri del nodo sorgente sono considerati da intersecare nuovamente
+        if self.destNode.fronts is None and self.proofGraph.pendingJoins is not None:
+            self.changedMembers.update(fromNode.solutions.keys())
+            self.proofGraph.pendingJoins[self] = None
+            return
+        for member in list(self.solutionsA.keys() & self.solutionsB.keys()):
+            self.join(self.solutionsA[member], self.solutionsB[member])
+
+    def flush(self):
+        # Intersezione in blocco: interseca i membri con soluzioni nuove o migliorate dall'ultima intersezione
+        # con gli insiemi dei membri dei due nodi intersecati, inviando al destNode, in ordine di membro,
+        # l'intersezione delle soluzioni possedute dai due nodi per ciascun membro comune.
+        # Come in notify(), le soluzioni di un ruolo intersecato con sé stesso non sono mai intersecate
+        changedMembers = self.changedMembers
+        self.changedMembers = set()
+        if self.roleA == self.roleB:
+            return
+        solutionsA = self.proofGraph.nodes[self.roleA].solutions
+        solutionsB = self.proofGraph.nodes[self.roleB].solutions
+        for member in sorted(changedMembers & solutionsA.keys() & solutionsB.keys()):
+            self.join(solutionsA[member], solutionsB[member])
+
+
+class CollectorMonitor(Monitor):
+    """
+    Monitor per raccogliere le soluzioni accettate da un nodo.
+
+    Un CollectorMonitor è associato al nodo stesso di cui raccoglie le soluzioni (destNode) e ne accoda
+    in solutions, nell'ordine di accettazione, ogni soluzione nuova o migliorata
+    """
 
-                if solution.reqStackSize > otherSolution.reqStackSize:
-                    outputPath = solution.path + otherSolution.path
-                    outputReqStackSize = solution.reqStackSize
-                elif solution.reqStackSize < otherSolution.reqStackSize:
-                    outputPath = otherSolution.path + solution.path
-                    outputReqStackSize = otherSolution.reqStackSize
-                else:
-                    outputPath = solution.path + otherSolution.path
-                    outputReqStackSize = solution.reqStackSize + 1
+    def __init__(self, destNode, proofGraph, dart):
+        super().__init__(destNode, proofGraph, dart)
+        self.solutions = deque()
 
-                intersectedSolution = Solution(solution.member, outputWeight, outputPath, outputReqStackSize)
-                self.destNode.addSolution(intersectedSolution)
+    def notify(self, solution, fromNode):
+        self.solutions.append(solution)
 
 
 class ProofEdge:
@@ -231,6 +570,11 @@ class ProofEdge:
     toNode: il nodo ProofNode destinazione
     weight: il peso associato all'arco
     supportSolution: eventuale soluzione che ha giustificato la generazione dell'arco
+    signedPath: il ProofPath accodato al path delle soluzioni che attraversano l'arco,
+                costituito dall'arco stesso e dall'eventuale path di supportSolution
+    signedProofLength: il numero di credenziali della dimostrazione on-chain corrispondenti a signedPath
+    signedHops: il numero di passaggi di fiducia aggiunti alle soluzioni che attraversano l'arco: uno per gli archi corrispondenti
+                ad una credenziale, eccetto le Linked Inclusion, i cui passaggi sono quelli di supportSolution degli archi di collegamento
     """
 
     def __init__(self, fromNode, toNode, weight, supportSolution = None):
@@ -238,12 +582,22 @@ class ProofEdge:
         self.toNode = toNode
         self.weight = weight
         self.supportSolution = supportSolution
+        self.signedPath = ProofPath(self)
+        # Gli archi entranti in nodi LIExpression non corrispondono a credenziali on-chain (vedi compileProof())
+        self.signedProofLength = 0 if isinstance(toNode.expr, LIExpression) else 1
+        self.signedHops = 0 if isinstance(fromNode.expr, LIExpression) else 1
+        if supportSolution != None:
+            self.signedPath = self.signedPath.concat(supportSolution.path)
+            self.signedProofLength += supportSolution.proofLength
+            self.signedHops = supportSolution.hops
 
     def sendSolution(self, solution):
         # Trasmetti una soluzione attraverso l'arco:
         # la soluzione viene anzitutto firmata con il metodo signSolution()
-        # quindi aggiunta alle soluzioni del nodo destinazione
-        self.toNode.addSolution(self.signSolution(solution))
+        # quindi aggiunta alle soluzioni del nodo destinazione, a meno che non sia stata scartata
+        signedSolution = self.signSolution(solution)
+        if signedSolution is not None:
+            self.toNode.addSolution(signedSolution)
 
     def signSolution(self, solution):
         # Firma una soluzione che attraversa l'arco. Una volta firmata, valgono le seguenti affermazioni:
@@ -251,18 +605,25 @@ class ProofEdge:
         # - al path della soluzione è stato accodato l'arco stesso
         # - se l'arco possiede una supportSolution, è stato accodato al path anche il path di supportSolution
         # - reqStackSize è stato aggiornato e reso sufficiente a verificare on-chain la sequenza di credenziali rappresentata dalla suddetta path
+        # La soluzione è scartata, restituendo None, se il suo valore di fiducia risulta inferiore al minWeight del ProofGraph:
+        # i valori di fiducia non crescono lungo la propagazione, dunque non potrebbe giungere accettabile al nodo di partenza.
+        # Analogamente è scartata se i suoi passaggi di fiducia eccedono il maxDepth del ProofGraph
         newWeight = (solution.weight * self.weight) / MAX_WEIGHT
+        newHops = solution.hops + self.signedHops
+        proofGraph = self.toNode.proofGraph
+        if proofGraph is not None and (newWeight < proofGraph.minWeight or not proofGraph.withinDepth(newHops)):
+            if proofGraph.stats is not None:
+                proofGraph.stats.solutionsPruned += 1
+            return None
+        newPath = solution.path.concat(self.signedPath)
         if self.supportSolution == None:
-            newPath = solution.path + [self]
+            newReqStackSize = solution.reqStackSize
+        elif solution.reqStackSize > self.supportSolution.reqStackSize:
             newReqStackSize = solution.reqStackSize
         else:
-            newPath = solution.path + [self] + self.supportSolution.path
-            if solution.reqStackSize > self.supportSolution.reqStackSize:
-                newReqStackSize = solution.reqStackSize
-            else:
-                newReqStackSize = self.supportSolution.reqStackSize + 1
+            newReqStackSize = self.supportSolution.reqStackSize + 1
         
-        return Solution(solution.member, newWeight, newPath, newReqStackSize)
+        return Solution(solution.member, newWeight, newPath, newReqStackSize, solution.proofLength + self.signedProofLength, newHops)
 
 
 class ProofNode:
@@ -274,29 +635,73 @@ class ProofNode:
     solutions: insieme delle soluzioni possedute dal nodo
     solutionsState: valore corrispondente ad un determinato stato di solutions, incrementato ad ogni alterazione di solutions
     monitors: insieme dei monitor a cui notificare l'inserimento di una nuova soluzione in solutions
+    proofGraph: il ProofGraph di appartenenza, che stabilisce la modalità di propagazione delle soluzioni
+    expanded: True se il nodo è già stato elaborato dal backward search algorithm
+    goal: nelle ricerche mirate, il membro di cui il nodo deve fornire le soluzioni (None se tutti i membri)
+    bound: nelle ricerche mirate o limitate, valore di fiducia massimo che una soluzione del nodo può avere una volta giunta al nodo di partenza
+    depth: nelle ricerche mirate o limitate, numero minimo di passaggi di fiducia (vedi Solution.hops) che una soluzione
+           del nodo accumula per giungere al nodo di partenza
+    children: nelle ricerche mirate o limitate, i nodi raggiunti a partire dal nodo, associati alla terna (peso, allMembers, passaggi)
+              con cui sono stati raggiunti
+    fronts: nelle ricerche multi-obiettivo o limitate da maxDepth, il fronte di Pareto delle soluzioni di ciascun membro (None altrimenti);
+            solutions mantiene in tal caso, per ciascun membro, la soluzione del fronte con valore di fiducia maggiore
     """
 
-    def __init__(self, expr):
+    def __init__(self, expr, proofGraph = None, goal = None, bound = MAX_WEIGHT, depth = 0):
         self.expr = expr
+        self.expanded = False
+        self.goal = goal
+        self.bound = bound
+        self.depth = depth
+        self.children = None
         self.outEdges = {}
         self.solutions = {}
         self.solutionsState = 0
         self.monitors = []
+        self.proofGraph = proofGraph
+        self.fronts = None if proofGraph is None or not proofGraph.paretoFronts else {}
 
     def addSolution(self, solution):
         # Richiede l'inserimento di solution tra le soluzioni solutions del nodo.
         # La soluzione è accettata solamente se tratta di un nuovo membro o possiede un valore di fiducia maggiore.
-        # Se accettata:
+        # Nella propagazione ricorsiva la soluzione è accettata immediatamente,
+        # mentre nella propagazione per priorità è inserita nella coda di priorità del ProofGraph.
+        # Nelle ricerche multi-obiettivo o limitate da maxDepth la soluzione è invece accettata se non dominata
+        # da alcuna soluzione del fronte di Pareto del membro (vedi improves())
+        if self.improves(solution):
+            if self.proofGraph is not None and self.proofGraph.propagation == PRIORITY_PROPAGATION:
+                self.proofGraph.scheduleSolution(self, solution)
+            else:
+                self.acceptSolution(solution)
+        elif self.proofGraph is not None and self.proofGraph.stats is not None:
+            self.proofGraph.stats.solutionsRejected += 1
+
+    def improves(self, solution):
+        # Restituisce True se solution tratta di un nuovo membro o possiede un valore di fiducia maggiore,
+        # o, in presenza dei fronti di Pareto, se non è dominata da alcuna soluzione del fronte del membro
+        if self.fronts is not None:
+            return not any(self.proofGraph.dominates(other, solution) for other in self.fronts.get(solution.member, ()))
+        return solution.member not in self.solutions or self.solutions[solution.member].weight < solution.weight
+
+    def acceptSolution(self, solution):
+        # Accetta solution tra le soluzioni solutions del nodo:
+        # - viene inserita nel fronte di Pareto del membro, da cui sono rimosse le soluzioni da essa dominate
         # - viene aggiornato il contatore di stato solutionsState
         # - viene trasmessa la soluzione attraverso tutti gli archi uscenti
         # - vengono notificati tutti i monitor della nuova soluzione
-        if solution.member not in self.solutions or self.solutions[solution.member].weight < solution.weight:
+        # I monitor possono aggiungere nuovi archi uscenti dal nodo, dunque è necessario operare su di una copia di outEdges
+        if self.fronts is not None:
+            front = self.fronts.get(solution.member, ())
+            self.fronts[solution.member] = [other for other in front if not self.proofGraph.dominates(solution, other)] + [solution]
+        if self.fronts is None or solution.member not in self.solutions or self.solutions[solution.member].weight < solution.weight:
             self.solutions[solution.member] = solution
-            self.solutionsState += 1
-            for monitor in self.monitors:
-                monitor.notify(solution, self)
-            for edge in self.outEdges.values():
-                edge.sendSolution(solution)
+        self.solutionsState += 1
+        if self.proofGraph is not None and self.proofGraph.stats is not None:
+            self.proofGraph.stats.solutionsAccepted += 1
+        for monitor in self.monitors:
+            monitor.notify(solution, self)
+        for edge in list(self.outEdges.values()):
+            edge.sendSolution(solution)
 
     def attachMonitor(self, monitor):
         # Associa un nuovo monitor al nodo.
@@ -307,12 +712,19 @@ class ProofNode:
         if len(self.solutions) != 0:
             while True:
                 currSolutionsState = self.solutionsState
-                solutionsList = list(self.solutions.values())
+                solutionsList = self.allSolutions()
                 for solution in solutionsList:
                     monitor.notify(solution, self)
                 if currSolutionsState == self.solutionsState:
                     break
 
+    def allSolutions(self):
+        # Restituisce la lista di tutte le soluzioni possedute dal nodo, comprese, nelle ricerche multi-obiettivo,
+        # tutte le soluzioni dei fronti di Pareto
+        if self.fronts is None:
+            return list(self.solutions.values())
+        return [solution for front in self.fronts.values() for solution in front]
+
 
 class ProofGraph:
     """
@@ -320,27 +732,167 @@ class ProofGraph:
 
     nodes: insieme dei nodi ProofGraph di cui il grafo è composto
     queue: coda di ProofNode(s) utilizzata da parte dal backward search algorithm per generare il grafo
+    dart: l'istanza di interfacciamento al contratto dart on-chain da cui leggere le credenziali
+    pendingLinks: se diverso da None, lista dei collegamenti (LinkingMonitor, ruolo linkato, soluzione)
+                  la cui verifica di esistenza del ruolo linkato è differita alla fine della frontiera corrente,
+                  dove è eseguita tramite letture aggregate exprsExist() (vedi resolvePendingLinks())
+    existence: esito delle verifiche di esistenza dei ruoli linkati già eseguite, indicizzato per ruolo,
+               così che ciascun ruolo sia verificato una sola volta per ricerca
+    propagation: modalità di propagazione delle soluzioni tra i nodi, tra
+                 - RECURSIVE_PROPAGATION: ogni soluzione accettata è trasmessa immediatamente e ricorsivamente
+                 - PRIORITY_PROPAGATION: le soluzioni sono accodate nella coda di priorità solutionsHeap
+                   ed accettate in ordine di valore di fiducia decrescente tramite propagate()
+    missingLinks: collegamenti (LinkingMonitor, soluzione) scartati poiché il relativo ruolo linkato non esisteva,
+                  indicizzati per ruolo linkato, da ripristinare qualora il ruolo acquisisca delle credenziali
+    goal: se diverso da None, il membro oggetto di una ricerca mirata. In tal caso ogni nodo mantiene il membro goal
+          di cui deve fornire le soluzioni ed il valore di fiducia massimo bound che queste possono raggiungere
+          al nodo di partenza, così da poter escludere i rami che non possono produrre o migliorare il membro cercato
+    stats: se diverso da None, la SearchStats in cui registrare le statistiche di elaborazione del grafo
+    objective: obiettivo di selezione delle soluzioni. Con WEIGHT_OBJECTIVE ogni nodo mantiene, per ciascun membro, la sola
+               soluzione con valore di fiducia maggiore; con gli altri obiettivi ogni nodo mantiene il fronte di Pareto delle
+               soluzioni di ciascun membro rispetto a valore di fiducia, lunghezza della dimostrazione e dimensione della stack,
+               ed ogni soluzione non dominata del ruolo linkato di una Linked Inclusion genera un proprio arco di collegamento.
+               La ricerca multi-obiettivo richiede la propagazione ricorsiva
+    minWeight: valore di fiducia minimo delle soluzioni di interesse. Le soluzioni con valore di fiducia inferiore sono scartate
+               ed i nodi che non possono fornire soluzioni con valore di fiducia sufficiente al nodo di partenza non sono elaborati
+    maxDepth: se diverso da None, numero massimo di passaggi di fiducia (vedi Solution.hops) delle soluzioni del nodo di partenza;
+              sono elaborati i soli nodi le cui soluzioni possono giungere al nodo di partenza entro tale limite (vedi ProofNode.depth),
+              e ciascun nodo mantiene il fronte di Pareto delle soluzioni di ciascun membro rispetto anche ai passaggi di fiducia,
+              poiché una soluzione con valore di fiducia minore ma meno passaggi potrebbe essere la sola a rispettare il limite
+    paretoFronts: True se i nodi mantengono i fronti di Pareto delle soluzioni, ovvero nelle ricerche multi-obiettivo o limitate da maxDepth
+    pendingJoins: se diverso da None, insieme ordinato degli IntersectionMonitor con membri da intersecare in blocco
+                  al termine della frontiera corrente (vedi flushJoins()), anziché alla notifica di ciascuna soluzione
     """
 
-    def __init__(self):
+    def __init__(self, dart=None, propagation=RECURSIVE_PROPAGATION, goal=None, stats=None, objective=WEIGHT_OBJECTIVE,
+                 minWeight=0, maxDepth=None, deferLinks=False, bulkJoins=False):
+        if propagation not in (RECURSIVE_PROPAGATION, PRIORITY_PROPAGATION):
+            raise ValueError("unknown propagation mode: " + str(propagation))
+        if objective not in (WEIGHT_OBJECTIVE, LENGTH_OBJECTIVE, PARETO_OBJECTIVE):
+            raise ValueError("unknown objective: " + str(objective))
+        if objective != WEIGHT_OBJECTIVE and (propagation != RECURSIVE_PROPAGATION or goal is not None):
+            raise ValueError("objective " + objective + " requires an exhaustive search with recursive propagation")
         self.nodes = {}
         self.queue = deque()
-
-    def addNode(self, expr):
+        self.dart = dart
+        self.pendingLinks = [] if deferLinks else None
+        self.pendingJoins = {} if bulkJoins else None
+        self.existence = {}
+        self.propagation = propagation
+        self.solutionsHeap = []
+        self.solutionsCounter = count()
+        self.missingLinks = {}
+        self.goal = goal
+        self.stats = stats
+        self.objective = objective
+        self.minWeight = minWeight
+        self.maxDepth = maxDepth
+        self.paretoFronts = objective != WEIGHT_OBJECTIVE or maxDepth is not None
+        # I valori bound e depth dei nodi sono mantenuti solamente nelle ricerche mirate o limitate
+        self.boundsTracking = goal is not None or minWeight > 0 or maxDepth is not None
+
+    def addNode(self, expr, parent = None, weight = MAX_WEIGHT, allMembers = False, hops = 1):
         # Richiede l'inserimento di nuovo nodo nel grafo.
         # Il nodo è accettato solamente se rappresentante una nuova espressione.
-        # A seguito dell'accettazione, è accodato nella coda di elaborazione del backward search algorithm
+        # A seguito dell'accettazione, è accodato nella coda di elaborazione del backward search algorithm.
+        # Nelle ricerche mirate o limitate, il nodo eredita da parent, il nodo a partire dal quale expr è stata raggiunta:
+        # - il membro goal, a meno che allMembers non richieda al nodo tutti i membri
+        # - il valore bound, aggravato dal peso weight del collegamento tra i due nodi
+        # - la profondità depth, incrementata dei passaggi di fiducia hops che separano minimo le soluzioni dei due nodi:
+        #   uno per le credenziali ed i ruoli linking, nessuno per le Linked Inclusion ed i ruoli intersecati,
+        #   quelli della soluzione di supporto per i ruoli linkati
+        # Un nodo che non può fornire soluzioni accettabili (vedi isAdmissible()) è inserito nel grafo ma non accodato;
+        # sarà accodato qualora raggiunto successivamente attraverso un collegamento migliore
+        if not self.boundsTracking:
+            if expr not in self.nodes:
+                newNode = ProofNode(expr, self)
+                self.nodes[expr] = newNode
+                self.queue.append(newNode)
+                return newNode
+            else:
+                return self.nodes[expr]
+
+        if parent is None:
+            goal = self.goal
+            bound = MAX_WEIGHT
+            depth = 0
+        else:
+            goal = None if allMembers else parent.goal
+            bound = (parent.bound * weight) / MAX_WEIGHT
+            depth = parent.depth + hops
+
         if expr not in self.nodes:
-            newNode = ProofNode(expr)
-            self.nodes[expr] = newNode
-            self.queue.append(newNode)
-            return newNode
+            node = ProofNode(expr, self, goal, bound, depth)
+            self.nodes[expr] = node
+            if parent is None or self.isAdmissible(node):
+                self.queue.append(node)
+        else:
+            node = self.nodes[expr]
+            self.widenNode(node, goal, bound, depth)
+        if parent is not None:
+            if parent.children is None:
+                parent.children = {}
+            child = parent.children.get(node)
+            if child is None:
+                parent.children[node] = (weight, allMembers, hops)
+            elif child[0] < weight or child[2] > hops:
+                parent.children[node] = (max(child[0], weight), child[1] or allMembers, min(child[2], hops))
+        return node
+
+    def isAdmissible(self, node):
+        # Restituisce True se il nodo può fornire soluzioni con valore di fiducia non inferiore a minWeight
+        # al nodo di partenza entro maxDepth passaggi di fiducia
+        return node.bound >= self.minWeight and (self.maxDepth is None or node.depth <= self.maxDepth)
+
+    def withinDepth(self, hops):
+        # Restituisce True se una soluzione con hops passaggi di fiducia rispetta il limite maxDepth.
+        # Il confronto non considera la profondità del nodo che la possiede, la quale potrebbe diminuire successivamente
+        # rendendo accettabili le soluzioni così scartate: i passaggi di fiducia invece non diminuiscono lungo la propagazione
+        return self.maxDepth is None or hops <= self.maxDepth
+
+    def dominates(self, solution, otherSolution):
+        # Restituisce True se, nei fronti di Pareto dei nodi, solution rende superflua otherSolution:
+        # con WEIGHT_OBJECTIVE è confrontato il solo valore di fiducia, altrimenti tutti i criteri di dominates(),
+        # ed in entrambi i casi, nelle ricerche limitate da maxDepth, anche i passaggi di fiducia
+        if self.objective == WEIGHT_OBJECTIVE:
+            dominant = solution.weight >= otherSolution.weight
         else:
-            return self.nodes[expr]
+            dominant = dominates(solution, otherSolution)
+        return dominant and (self.maxDepth is None or solution.hops <= otherSolution.hops)
+
+    def widenNode(self, node, goal, bound, depth):
+        # Estende, nelle ricerche mirate o limitate, il membro goal, il valore bound e la profondità depth
+        # di un nodo già presente nel grafo, propagando le estensioni ai nodi da esso raggiunti.
+        # Un nodo SIExpression già elaborato per un singolo membro ed esteso a tutti i membri è accodato nuovamente,
+        # così da leggerne i membri rimanenti; un nodo non ancora elaborato il cui bound aumenta o la cui profondità
+        # diminuisce è accodato nuovamente, così da aggiornarne la priorità di elaborazione o, se in precedenza escluso,
+        # da elaborarlo qualora sia divenuto ammissibile
+        stack = [(node, goal, bound, depth)]
+        while len(stack) != 0:
+            (node, goal, bound, depth) = stack.pop()
+            widened = node.goal is not None and node.goal != goal
+            raised = bound > node.bound
+            shortened = depth < node.depth
+            if not widened and not raised and not shortened:
+                continue
+            if widened:
+                node.goal = None
+                if node.expanded and isinstance(node.expr, SIExpression):
+                    node.expanded = False
+            if raised:
+                node.bound = bound
+            if shortened:
+                node.depth = depth
+            if not node.expanded and self.isAdmissible(node):
+                self.queue.append(node)
+            if node.children is not None:
+                for child, (weight, allMembers, hops) in node.children.items():
+                    stack.append((child, None if allMembers else node.goal, (node.bound * weight) / MAX_WEIGHT, node.depth + hops))
 
     def addEdge(self, fromExpr, toExpr, weight, supportSolution = None):
         # Richiede l'inserimento di un nuovo arco nel grafo.
         # L'arco è accettato solamente se non presente, o se presente con un valore di fiducia minore.
+        # Nelle ricerche multi-obiettivo gli archi di collegamento sono distinti anche per supportSolution.
         # L'inserimento di un nuovo arco comporta il trasferimento di eventuali soluzioni
         # dal nodo sorgente al nodo destinazione.
         # Quest'ultima operazione potrebbe comportare la ricezione di nuove soluzioni da parte del nodo sorgente,
@@ -349,195 +901,2732 @@ class ProofGraph:
             fromNode = self.nodes[fromExpr]
             toNode = self.nodes[toExpr]
             newEdge = ProofEdge(fromNode, toNode, weight, supportSolution)
-            if toNode not in fromNode.outEdges or fromNode.outEdges[toNode].weight < weight:
-                fromNode.outEdges[toNode] = newEdge
+            key = toNode if supportSolution is None or fromNode.fronts is None else (toNode, supportSolution)
+            if key not in fromNode.outEdges or fromNode.outEdges[key].weight < weight:
+                fromNode.outEdges[key] = newEdge
+                if self.stats is not None:
+                    self.stats.edgesAdded += 1
                 while True:
                     currSolutionsState = fromNode.solutionsState
-                    solutionsList = list(fromNode.solutions.values())
+                    solutionsList = fromNode.allSolutions()
                     for solution in solutionsList:
                         newEdge.sendSolution(solution)
                     if currSolutionsState == fromNode.solutionsState:
                         break
 
-"""
-------------------------------------------------------------------------------------
-DART
-------------------------------------------------------------------------------------
-"""
-
-class DART:
+    def exprExists(self, linkedRole):
+        # Verifica l'esistenza del ruolo linkedRole, leggendola dalla sorgente dart solamente se non già nota
+        exists = self.existence.get(linkedRole)
+        if exists is None:
+            exists = self.dart.exprExists(linkedRole)
+            self.existence[linkedRole] = exists
+        return exists
+
+    def hasPendingLinks(self):
+        # Restituisce True se vi sono collegamenti in sospeso da risolvere. I collegamenti possono essere richiesti
+        # anche durante la propagazione per priorità, successiva all'elaborazione della frontiera: in tal caso
+        # sono risolti dall'elaborazione della frontiera successiva, anche se vuota
+        return self.pendingLinks is not None and len(self.pendingLinks) != 0
+
+    def hasPendingJoins(self):
+        # Restituisce True se vi sono intersezioni in blocco in sospeso, richieste eventualmente anche
+        # durante la propagazione per priorità (vedi hasPendingLinks())
+        return self.pendingJoins is not None and len(self.pendingJoins) != 0
+
+    def flushJoins(self):
+        # Esegue le intersezioni in blocco in sospeso, nell'ordine in cui sono state richieste.
+        # Le soluzioni intersecate possono generare nuove soluzioni e dunque nuove intersezioni in sospeso
+        while len(self.pendingJoins) != 0:
+            monitors = list(self.pendingJoins)
+            self.pendingJoins.clear()
+            for monitor in monitors:
+                monitor.flush()
+
+    def unknownLinkedRoles(self):
+        # Restituisce, senza ripetizioni, i ruoli dei collegamenti in sospeso la cui esistenza non è ancora nota
+        return [linkedRole for linkedRole in dict.fromkeys(linkedRole for (_, linkedRole, _) in self.pendingLinks)
+                if linkedRole not in self.existence]
+
+    def linkPending(self):
+        # Completa i collegamenti in sospeso, i cui ruoli linkati hanno tutti esistenza nota,
+        # scartando quelli verso ruoli non esistenti
+        pendingLinks = self.pendingLinks
+        self.pendingLinks = []
+        for (monitor, linkedRole, solution) in pendingLinks:
+            if self.existence[linkedRole]:
+                monitor.link(linkedRole, solution)
+            else:
+                self.addMissingLink(monitor, linkedRole, solution)
+
+    def resolvePendingLinks(self, batchSize = DEFAULT_BATCH_SIZE):
+        # Risolve i collegamenti in sospeso, verificando l'esistenza dei ruoli linkati non ancora noti
+        # tramite una lettura aggregata exprsExist() ogni batchSize ruoli.
+        # Il collegamento di un ruolo linkato può generare nuove soluzioni e dunque nuovi collegamenti in sospeso
+        while len(self.pendingLinks) != 0:
+            linkedRoles = self.unknownLinkedRoles()
+            for i in range(0, len(linkedRoles), batchSize):
+                batch = linkedRoles[i:i+batchSize]
+                self.existence.update(zip(batch, self.dart.exprsExist(batch)))
+            self.linkPending()
+
+    def addMissingLink(self, monitor, linkedRole, solution):
+        # Registra un collegamento scartato poiché il ruolo linkedRole non risulta esistente
+        self.missingLinks.setdefault(linkedRole, []).append((monitor, solution))
+
+    def addCredential(self, credential):
+        # Inserisce nel grafo una nuova credenziale registrata successivamente alla sua costruzione.
+        # La credenziale è rilevante solamente se il suo assigned role è un nodo già elaborato del grafo:
+        # i nodi non ancora elaborati leggeranno la credenziale alla loro elaborazione,
+        # mentre i ruoli assenti dal grafo non contribuiscono alle soluzioni.
+        # Una credenziale rende esistente il proprio assigned role, dunque sono ripristinati
+        # gli eventuali collegamenti precedentemente scartati verso di esso.
+        # I nodi inseriti sono accodati, mentre le soluzioni sono propagate tramite i meccanismi usuali
+        role = credential.role
+        self.existence[role] = True
+        for (monitor, solution) in self.missingLinks.pop(role, []):
+            monitor.link(role, solution)
+
+        if role in self.nodes and self.nodes[role].expanded:
+            self.addNode(credential.expr, self.nodes[role], credential.weight,
+                         hops=0 if isinstance(credential.expr, LIExpression) else 1)
+            self.addEdge(credential.expr, role, credential.weight)
+
+    def removeCredentials(self, credentials):
+        # Rimuove dal grafo gli archi corrispondenti alle credenziali Credential fornite, revocate successivamente
+        # alla costruzione del grafo, quindi ripristina la correttezza delle soluzioni tramite retract()
+        removedEdges = set()
+        for credential in credentials:
+            role = credential.role
+            if role in self.nodes and credential.expr in self.nodes:
+                fromNode = self.nodes[credential.expr]
+                toNode = self.nodes[role]
+                if toNode in fromNode.outEdges:
+                    del fromNode.outEdges[toNode]
+                    removedEdges.add((fromNode, toNode))
+        if len(removedEdges) != 0:
+            self.retract(removedEdges)
+
+    def updateCredentials(self, credentials):
+        # Aggiorna il valore di fiducia degli archi corrispondenti alle credenziali Credential fornite.
+        # Le diminuzioni sono gestite come una rimozione seguita da un nuovo inserimento,
+        # mentre gli aumenti sono gestiti come un semplice inserimento
+        decreased = []
+        for credential in credentials:
+            role = credential.role
+            if role in self.nodes and credential.expr in self.nodes:
+                edge = self.nodes[credential.expr].outEdges.get(self.nodes[role])
+                if edge is not None and edge.weight > credential.weight:
+                    decreased.append(credential)
+        self.removeCredentials(decreased)
+        for credential in credentials:
+            self.addCredential(credential)
+
+    def retract(self, removedEdges):
+        # Ripristina la correttezza delle soluzioni a seguito della rimozione degli archi removedEdges,
+        # forniti come coppie (nodo sorgente, nodo destinazione), secondo lo schema delete and rederive.
+        # Una soluzione è non più valida se il suo path, comprensivo dei path delle soluzioni di supporto e
+        # delle soluzioni intersecate, attraversa un arco rimosso. Sono considerati unicamente i nodi interessati,
+        # ovvero quelli raggiungibili dalle destinazioni degli archi rimossi tramite archi uscenti o monitor:
+        # - fase di cancellazione: sono rimosse dai nodi interessati e dai relativi monitor le soluzioni non più valide,
+        #   assieme agli archi linkati entranti giustificati da soluzioni di supporto non più valide
+        # - fase di rigenerazione: le soluzioni dei nodi sorgente degli archi e dei monitor entranti nei nodi interessati
+        #   sono nuovamente trasmesse, così che ciascun nodo interessato recuperi le soluzioni ancora derivabili
+        def isInvalid(solution):
+            return any((edge.fromNode, edge.toNode) in removedEdges for edge in solution.path)
+
+        affected = set()
+        stack = [toNode for (_, toNode) in removedEdges]
+        while len(stack) != 0:
+            node = stack.pop()
+            if node not in affected:
+                affected.add(node)
+                stack.extend(node.outEdges.keys())
+                stack.extend(monitor.destNode for monitor in node.monitors)
+
+        for node in affected:
+            invalidMembers = [member for member, solution in node.solutions.items() if isInvalid(solution)]
+            for member in invalidMembers:
+                del node.solutions[member]
+            if len(invalidMembers) != 0:
+                node.solutionsState += 1
+
+        nodes = list(self.nodes.values())
+        monitors = {monitor for node in nodes for monitor in node.monitors if monitor.destNode in affected}
+        for monitor in monitors:
+            monitor.retract(isInvalid)
+        for node in nodes:
+            for edge in list(node.outEdges.values()):
+                if edge.toNode in affected and edge.supportSolution is not None and isInvalid(edge.supportSolution):
+                    del node.outEdges[edge.toNode]
+        for linkedRole in list(self.missingLinks.keys()):
+            self.missingLinks[linkedRole] = [(monitor, solution) for (monitor, solution) in self.missingLinks[linkedRole]
+                                             if not isInvalid(solution)]
+
+        for node in nodes:
+            for edge in list(node.outEdges.values()):
+                if edge.toNode in affected:
+                    for solution in list(node.solutions.values()):
+                        edge.sendSolution(solution)
+            for monitor in list(node.monitors):
+                if monitor in monitors:
+                    monitor.rederive(node)
+
+    def scheduleSolution(self, node, solution):
+        # Accoda solution, destinata al nodo node, nella coda di priorità delle soluzioni.
+        # A parità di valore di fiducia, le soluzioni sono estratte in ordine di inserimento
+        heapq.heappush(self.solutionsHeap, (-solution.weight, next(self.solutionsCounter), node, solution))
+
+    def propagate(self):
+        # Propagazione per priorità (Dijkstra sul semianello max-prodotto):
+        # estrai iterativamente la soluzione con valore di fiducia massimo e, se ancora migliore di quella
+        # posseduta dal nodo destinazione, accettala, accodando a sua volta le soluzioni da essa derivate.
+        # Poiché i pesi degli archi non superano MAX_WEIGHT, le soluzioni accodate durante la propagazione, comprese quelle
+        # trasmesse dagli archi di collegamento generati nel frattempo, non possono avere valore di fiducia maggiore di quella
+        # estratta, dunque nel corso di una singola propagazione ogni coppia (nodo, membro) è accettata al più una volta.
+        # Le ricerche alternano invece l'elaborazione delle frontiere alla propagazione: i nodi elaborati successivamente
+        # possono fornire soluzioni migliori per coppie già accettate, il cui valore è dunque definitivo solamente
+        # al termine della ricerca.
+        # In presenza dei fronti di Pareto, ogni soluzione accettata per una coppia (nodo, membro) ha invece meno passaggi
+        # di fiducia di tutte le precedenti, estratte con valore di fiducia non inferiore
+        while len(self.solutionsHeap) != 0:
+            (_, _, node, solution) = heapq.heappop(self.solutionsHeap)
+            if node.improves(solution):
+                node.acceptSolution(solution)
+            elif self.stats is not None:
+                self.stats.solutionsRejected += 1
+
+    def expandFrontier(self, batchSize = DEFAULT_BATCH_SIZE, maxNodes = None):
+        # Elabora tutti i nodi attualmente presenti nella coda (la frontiera corrente del backward search algorithm),
+        # o solamente i primi maxNodes se specificato, lasciando in coda i rimanenti.
+        # Le credenziali dei ruoli SIExpression della frontiera sono lette in blocco dalla sorgente dart,
+        # effettuando una lettura aggregata dei membri ed una delle inclusioni ogni batchSize ruoli;
+        # i nodi sono quindi elaborati nell'ordine in cui sono stati accodati.
+        # I nodi inseriti durante l'elaborazione costituiscono la frontiera successiva.
+        # I nodi accodati più volte sono elaborati una sola volta, mentre i nodi già elaborati sono ignorati
+        if maxNodes is None:
+            frontier = [node for node in dict.fromkeys(self.queue) if not node.expanded]
+            self.queue.clear()
+        else:
+            frontier = []
+            while len(self.queue) != 0 and len(frontier) < maxNodes:
+                node = self.queue.popleft()
+                if not node.expanded and node not in frontier:
+                    frontier.append(node)
+        self.expandNodes(frontier, batchSize)
+
+    def expandNodes(self, frontier, batchSize = DEFAULT_BATCH_SIZE):
+        # Elabora i nodi, non ancora elaborati, della lista frontier, leggendo le credenziali dei ruoli SIExpression
+        # con una lettura aggregata dei membri ed una delle inclusioni ogni batchSize ruoli (vedi expandFrontier()),
+        # quindi risolve i collegamenti e le intersezioni in sospeso
+        roles = [node.expr for node in frontier if isinstance(node.expr, SIExpression)]
+        credentials = {}
+        for i in range(0, len(roles), batchSize):
+            batch = roles[i:i+batchSize]
+            for role, members, inclusions in zip(batch, self.dart.getMembers(batch), self.dart.getInclusions(batch)):
+                credentials[role] = (members, inclusions)
+
+        for node in frontier:
+            if isinstance(node.expr, SIExpression):
+                self.expandNode(node, *credentials[node.expr])
+            else:
+                self.expandNode(node)
+
+        # I collegamenti possono generare nuove intersezioni in sospeso, e viceversa
+        while self.hasPendingLinks() or self.hasPendingJoins():
+            if self.hasPendingLinks():
+                self.resolvePendingLinks(batchSize)
+            if self.hasPendingJoins():
+                self.flushJoins()
+
+    async def expandFrontierAsync(self, executor, concurrency = DEFAULT_CONCURRENCY, batchSize = DEFAULT_BATCH_SIZE):
+        # Variante asincrona di expandFrontier().
+        # Le letture aggregate delle credenziali della frontiera, suddivise in gruppi di batchSize ruoli,
+        # sono eseguite contemporaneamente sui thread di executor, con al più concurrency letture in corso.
+        # L'elaborazione dei nodi avviene invece sequenzialmente sul thread dell'event loop, nello stesso ordine
+        # della variante sincrona; le verifiche di esistenza dei ruoli linkati sono differite tramite pendingLinks
+        # e risolte al termine dell'elaborazione della frontiera con letture aggregate di batchSize ruoli,
+        # anch'esse eseguite contemporaneamente
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def read(function, *args):
+            async with semaphore:
+                return await loop.run_in_executor(executor, function, *args)
+
+        frontier = [node for node in dict.fromkeys(self.queue) if not node.expanded]
+        self.queue.clear()
+
+        roles = [node.expr for node in frontier if isinstance(node.expr, SIExpression)]
+        batches = [roles[i:i+batchSize] for i in range(0, len(roles), batchSize)]
+        results = await asyncio.gather(*[read(self.dart.getMembers, batch) for batch in batches],
+                                       *[read(self.dart.getInclusions, batch) for batch in batches])
+        credentials = {}
+        for batch, members, inclusions in zip(batches, results[:len(batches)], results[len(batches):]):
+            for role, roleMembers, roleInclusions in zip(batch, members, inclusions):
+                credentials[role] = (roleMembers, roleInclusions)
+
+        for node in frontier:
+            if isinstance(node.expr, SIExpression):
+                self.expandNode(node, *credentials[node.expr])
+            else:
+                self.expandNode(node)
+
+        # Il collegamento di un ruolo linkato può generare nuove soluzioni e dunque nuovi collegamenti in sospeso
+        while len(self.pendingLinks) != 0:
+            linkedRoles = self.unknownLinkedRoles()
+            batches = [linkedRoles[i:i+batchSize] for i in range(0, len(linkedRoles), batchSize)]
+            results = await asyncio.gather(*[read(self.dart.exprsExist, batch) for batch in batches])
+            for batch, existing in zip(batches, results):
+                self.existence.update(zip(batch, existing))
+            self.linkPending()
+
+    def expandNode(self, node, members = None, inclusions = None):
+        # Elabora un nodo estratto dalla coda, inserendo nel grafo i nodi e gli archi da esso derivanti.
+        # Per i nodi SIExpression è possibile fornire le liste members ed inclusions di coppie (Expression, weight)
+        # già lette dalla sorgente dart; in caso contrario sono lette tramite una singola lettura aggregata
+        node.expanded = True
+        if self.stats is not None:
+            self.stats.nodeExpanded(node)
+
+        if isinstance(node.expr, SMExpression):
+            node.addSolution(Solution(node.expr.member, MAX_WEIGHT))
+
+        elif isinstance(node.expr, SIExpression):
+            # Un nodo che deve fornire le soluzioni di un solo membro legge unicamente la relativa credenziale Simple Member,
+            # o, se i membri sono già stati letti in blocco, considera solamente quest'ultima
+            if members is None and node.goal is not None:
+                memberWeight = self.dart.getMemberWeight(node.expr, node.goal)
+                members = [] if memberWeight is None else [(SMExpression(node.goal), memberWeight)]
+            elif members is None:
+                members = self.dart.getMembers([node.expr])[0]
+            elif node.goal is not None:
+                memberExpr = SMExpression(node.goal)
+                members = [(expr, credWeight) for (expr, credWeight) in members if expr == memberExpr]
+            if inclusions is None:
+                inclusions = self.dart.getInclusions([node.expr])[0]
+            for (memberExpr, credWeight) in members:
+                self.addNode(memberExpr, node, credWeight)
+                self.addEdge(memberExpr, node.expr, credWeight)
+            for (inclExpr, credWeight) in inclusions:
+                self.addNode(inclExpr, node, credWeight, hops=0 if isinstance(inclExpr, LIExpression) else 1)
+                self.addEdge(inclExpr, node.expr, credWeight)
+
+        elif isinstance(node.expr, LIExpression):
+            # I membri del ruolo P.r1 sono i principal tramite cui collegare i ruoli linkati: sono dunque richiesti tutti
+            linkingRole = SIExpression(node.expr.principal, node.expr.roleNameA)
+            linkingRoleNode = self.addNode(linkingRole, node, MAX_WEIGHT, True)
+            linkingRoleNode.attachMonitor(LinkingMonitor(node, self, self.dart))
+
+        elif isinstance(node.expr, IIExpression):
+            intersectedRoleA = SIExpression(node.expr.principalA, node.expr.roleNameA)
+            intersectedRoleB = SIExpression(node.expr.principalB, node.expr.roleNameB)
+            intersectedRoleNodeA = self.addNode(intersectedRoleA, node, hops=0)
+            intersectedRoleNodeB = self.addNode(intersectedRoleB, node, hops=0)
+            intersectionMonitor = IntersectionMonitor(node, self, self.dart)
+            intersectedRoleNodeA.attachMonitor(intersectionMonitor)
+            intersectedRoleNodeB.attachMonitor(intersectionMonitor)
+
+class SearchSession:
     """
-    Classe per l'interfacciamento verso il contratto DART on-chain.
+    Sessione di ricerca persistente a partire da un ruolo.
+
+    Il ProofGraph costruito dalla ricerca è mantenuto tra una interrogazione e l'altra:
+    le credenziali registrate successivamente sono inserite tramite addCredentials(),
+    che elabora solamente i nuovi nodi ed archi e propaga le sole soluzioni da essi interessate,
+    mentre le credenziali revocate o modificate sono gestite tramite removeCredentials() ed updateCredentials(),
+    che ricalcolano le sole soluzioni da esse derivate.
+
+    proofGraph: il ProofGraph della sessione
+    startingNode: il ProofNode rappresentante il ruolo di partenza
     """
 
-    def __init__(self, contractABI, contractAddress, w3):
+    def __init__(self, dart, role, batchSize=DEFAULT_BATCH_SIZE, propagation=RECURSIVE_PROPAGATION, proofGraph=None):
+        # Se fornito, proofGraph è il ProofGraph da cui riprendere la sessione, ad esempio caricato tramite loadProofGraph()
+        self.proofGraph = proofGraph if proofGraph is not None else ProofGraph(dart, propagation)
+        self.startingNode = self.proofGraph.addNode(role)
+        self.batchSize = batchSize
+        self.run()
+
+    def run(self):
+        # Elabora i nodi accodati e propaga le soluzioni in sospeso fino al raggiungimento di un punto fisso
+        while len(self.proofGraph.queue) != 0 or len(self.proofGraph.solutionsHeap) != 0:
+            self.proofGraph.expandFrontier(self.batchSize)
+            if len(self.proofGraph.queue) == 0:
+                self.proofGraph.propagate()
+
+    @property
+    def solutions(self):
         """
-        Crea una nuova istanza di interfacciamento verso un contratto DART on-chain.
-
-        :param buildArtifactPath: path all'artefatto json prodotto dalla compilazione del contratto DART tramite suite truffle
-        :param contractABI: array rappresentante l'ABI del contratto DART
-        :param w3: istanza di Web3 connesso ad un nodo della blockchain su cui è istanziato il contratto DART all'indirizzo fornito
+        L'insieme delle soluzioni attualmente trovate per il ruolo di partenza
         """
-        self.contract = w3.eth.contract(abi=contractABI, address=contractAddress)
-        self.w3 = w3
+        return self.startingNode.solutions
 
-    def newRole(self, roleName, tx={}):
+    def addCredentials(self, credentials):
         """
-        Richiedi la creazione di un nuovo ruolo
-        
-        :param roleName: stringa rappresentante un valore esadecimale valido (es: 0xabcd) identificativo del nuovo ruolo
-        :param tx: parametro opzionale contenente eventuali preferenze per la transazione
+        Aggiorna la sessione a seguito della registrazione delle credenziali Credential fornite,
+        restituendo infine l'insieme aggiornato delle soluzioni per il ruolo di partenza
         """
-        self.contract.functions.newRole(roleName).call(tx)
-        txHash = self.contract.functions.newRole(roleName).transact(tx)
-        self.w3.eth.waitForTransactionReceipt(txHash)
+        for credential in credentials:
+            self.proofGraph.addCredential(credential)
+        self.run()
+        return self.solutions
 
-    def addSimpleMember(self, assignedRolename, expression, weight, tx={}):
+    def removeCredentials(self, credentials):
         """
-        Richiedi l'inserimento di una nuova credenziale Simple Member per un proprio ruolo
-        
-        :param assignedRolename: il rolename dell'assigned role della credenziale
-        :param expression: la role expression SMExpression della credenziale
-        :param weight: valore di fiducia associato alla credenziale
-        :param tx: parametro opzionale contenente eventuali preferenze per la transazione
+        Aggiorna la sessione a seguito della revoca delle credenziali Credential fornite,
+        restituendo infine l'insieme aggiornato delle soluzioni per il ruolo di partenza.
+        Sono ricalcolate le sole soluzioni derivate dalle credenziali revocate
         """
-        self.contract.functions.addSimpleMember(assignedRolename, *expression, weight).call(tx)
-        txHash = self.contract.functions.addSimpleMember(assignedRolename, *expression, weight).transact(tx)
-        self.w3.eth.waitForTransactionReceipt(txHash)
+        self.proofGraph.removeCredentials(credentials)
+        self.run()
+        return self.solutions
 
-    def addSimpleInclusion(self, assignedRolename, expression, weight, tx={}):
+    def updateCredentials(self, credentials):
         """
-        Richiedi l'inserimento di una nuova credenziale Simple Inclusion per un proprio ruolo
-        
-        :param assignedRolename: il rolename dell'assigned role della credenziale
-        :param expression: la role expression SIExpression della credenziale
-        :param weight: valore di fiducia associato alla credenziale
-        :param tx: parametro opzionale contenente eventuali preferenze per la transazione
+        Aggiorna la sessione a seguito della modifica del valore di fiducia delle credenziali Credential fornite,
+        restituendo infine l'insieme aggiornato delle soluzioni per il ruolo di partenza.
+        Sono ricalcolate le sole soluzioni derivate dalle credenziali modificate
         """
-        self.contract.functions.addSimpleInclusion(assignedRolename, *expression, weight).call(tx)
-        txHash = self.contract.functions.addSimpleInclusion(assignedRolename, *expression, weight).transact(tx)
-        self.w3.eth.waitForTransactionReceipt(txHash)
+        self.proofGraph.updateCredentials(credentials)
+        self.run()
+        return self.solutions
 
-    def addLinkedInclusion(self, assignedRolename, expression, weight, tx={}):
+    def applyChanges(self, deltas):
         """
-        Richiedi l'inserimento di una nuova credenziale Linked Inclusion per un proprio ruolo
-        
-        :param assignedRolename: il rolename dell'assigned role della credenziale
-        :param expression: la role expression LIExpression della credenziale
-        :param weight: valore di fiducia associato alla credenziale
-        :param tx: parametro opzionale contenente eventuali preferenze per la transazione
+        Aggiorna la sessione a seguito delle alterazioni CredentialDelta fornite, nell'ordine in cui sono avvenute
+        (ad esempio ottenute tramite DART.getCredentialChanges()), restituendo infine l'insieme aggiornato
+        delle soluzioni per il ruolo di partenza. Le alterazioni consecutive della medesima operazione sono applicate
+        assieme, considerando per ciascuna credenziale solamente l'ultima; la creazione di un ruolo non altera le soluzioni
+        ed è dunque ignorata
         """
-        self.contract.functions.addLinkedInclusion(assignedRolename, *expression, weight).call(tx)
-        txHash = self.contract.functions.addLinkedInclusion(assignedRolename, *expression, weight).transact(tx)
-        self.w3.eth.waitForTransactionReceipt(txHash)
+        operations = {CREDENTIAL_ADDED: self.addCredentials, CREDENTIAL_REMOVED: self.removeCredentials,
+                      CREDENTIAL_UPDATED: self.updateCredentials}
+        for operation, group in groupby(deltas, key=lambda delta: delta.operation):
+            if operation in operations:
+                credentials = {(delta.credential.role, delta.credential.expr): delta.credential for delta in group}
+                operations[operation](list(credentials.values()))
+        return self.solutions
 
-    def addIntersectionInclusion(self, assignedRolename, expression, weight, tx={}):
+
+"""
+------------------------------------------------------------------------------------
+MOTORE DI RICERCA VETTORIALE
+------------------------------------------------------------------------------------
+"""
+
+class ArrayProofGraph:
+    """
+    Variante vettoriale del ProofGraph per la sola ricerca esaustiva con WEIGHT_OBJECTIVE.
+
+    Le espressioni dei nodi (SI/LI/II) ed i membri sono indicizzati da interi densi, e le soluzioni sono mantenute
+    in una matrice NumPy nodi x membri anziché da oggetti Solution. Le soluzioni sono calcolate come punto fisso
+    del semianello max-prodotto: ad ogni passo sono attraversati contemporaneamente tutti gli archi i cui nodi sorgente
+    hanno migliorato delle soluzioni al passo precedente, e per ciascun nodo destinazione è selezionata la migliore
+    soluzione entrante tramite una riduzione per segmenti sugli archi ordinati per destinazione (rappresentazione CSR).
+    Il valore di fiducia di ciascuna soluzione è calcolato con le stesse operazioni di ProofEdge.signSolution(),
+    dunque i valori ottenuti coincidono esattamente con quelli del ProofGraph.
+
+    Le inclusioni linkate ed intersecate seguono le regole di LinkingMonitor ed IntersectionMonitor:
+    i ruoli linkati sono collegati al termine di ciascun punto fisso, tramite verifiche di esistenza aggregate,
+    mentre le intersezioni sono calcolate ad ogni passo come minimo elemento per elemento tra le righe dei due ruoli.
+    Gli oggetti Solution, con i relativi ProofPath, sono costruiti solamente su richiesta (vedi solution()),
+    a partire dai predecessori registrati ad ogni miglioramento di una soluzione.
+
+    exprs: le espressioni dei nodi, indicizzate tramite exprIndex
+    members: gli indirizzi dei membri, indicizzati tramite memberIndex
+    queue: indici dei nodi da elaborare
+    memberCredentials: credenziali Simple Member (nodo, membro) -> peso, non ancora applicate a values
+    edgeFrom, edgeTo, edgeWeights: archi tra nodi; gli archi di collegamento hanno come peso la soluzione di supporto
+    edgeLinking, edgeMember: per gli archi di collegamento, il nodo ed il membro della soluzione di supporto (-1 altrimenti)
+    linkings: coppie (nodo LIExpression, nodo del relativo ruolo P.r1)
+    links: coppie (nodo LIExpression, membro) il cui collegamento è già stato richiesto
+    intersections: coppie (nodo del ruolo P1.r1, nodo del ruolo P2.r2) indicizzate per nodo IIExpression
+    existence: esito delle verifiche di esistenza dei ruoli linkati già eseguite
+    values: matrice dei valori di fiducia delle soluzioni (ARRAY_NO_SOLUTION se assenti)
+    preds: matrice dei predecessori delle soluzioni: l'indice dell'arco attraversato,
+           ARRAY_MEMBER_PRED per le credenziali Simple Member o ARRAY_INTERSECTION_PRED per le intersezioni
+    """
+
+    def __init__(self, dart):
+        if numpy is None:
+            raise ImportError("ArrayProofGraph requires numpy")
+        self.dart = dart
+        self.exprs = []
+        self.exprIndex = {}
+        self.expanded = []
+        self.members = []
+        self.memberIndex = {}
+        self.queue = deque()
+        self.memberCredentials = {}
+        self.memberWeights = {}
+        self.edgeFrom = []
+        self.edgeTo = []
+        self.edgeWeights = []
+        self.edgeLinking = []
+        self.edgeMember = []
+        self.linkings = []
+        self.links = set()
+        self.intersections = {}
+        self.existence = {}
+        self.values = numpy.full((0, 0), ARRAY_NO_SOLUTION)
+        self.preds = numpy.full((0, 0), ARRAY_MEMBER_PRED, dtype=numpy.int64)
+        # Archi già considerati da un punto fisso precedente
+        self.relaxedEdges = 0
+        # Oggetti ProofNode e ProofEdge e soluzioni già costruiti da solution()
+        self.proofNodes = {}
+        self.proofEdges = {}
+        self.builtSolutions = {}
+
+    def addNode(self, expr):
+        # Restituisce l'indice del nodo rappresentante expr, inserendolo ed accodandolo se non presente
+        index = self.exprIndex.get(expr)
+        if index is None:
+            index = len(self.exprs)
+            self.exprs.append(expr)
+            self.exprIndex[expr] = index
+            self.expanded.append(False)
+            self.queue.append(index)
+        return index
+
+    def addMember(self, member):
+        # Restituisce l'indice del membro member, inserendolo se non presente
+        index = self.memberIndex.get(member)
+        if index is None:
+            index = len(self.members)
+            self.members.append(member)
+            self.memberIndex[member] = index
+        return index
+
+    def addEdge(self, fromIndex, toIndex, weight, linking = -1, member = -1):
+        # Inserisce un arco tra i nodi di indice fromIndex e toIndex; per gli archi di collegamento,
+        # linking e member individuano la soluzione di supporto, il cui valore di fiducia determina il peso dell'arco
+        self.edgeFrom.append(fromIndex)
+        self.edgeTo.append(toIndex)
+        self.edgeWeights.append(weight)
+        self.edgeLinking.append(linking)
+        self.edgeMember.append(member)
+
+    def run(self, batchSize = DEFAULT_BATCH_SIZE):
+        # Alterna l'elaborazione di tutti i nodi raggiungibili, il calcolo del punto fisso delle soluzioni
+        # ed il collegamento dei ruoli linkati, fino a quando non sono più collegati nuovi ruoli
+        while True:
+            while len(self.queue) != 0:
+                self.expandFrontier(batchSize)
+            self.propagate()
+            if not self.linkRoles(batchSize):
+                break
+
+    def expandFrontier(self, batchSize = DEFAULT_BATCH_SIZE):
+        # Elabora tutti i nodi attualmente presenti nella coda, leggendo le credenziali dei ruoli SIExpression
+        # con una lettura aggregata dei membri ed una delle inclusioni ogni batchSize ruoli (vedi ProofGraph.expandFrontier())
+        frontier = [index for index in dict.fromkeys(self.queue) if not self.expanded[index]]
+        self.queue.clear()
+
+        roles = [self.exprs[index] for index in frontier if isinstance(self.exprs[index], SIExpression)]
+        credentials = {}
+        for i in range(0, len(roles), batchSize):
+            batch = roles[i:i+batchSize]
+            for role, members, inclusions in zip(batch, self.dart.getMembers(batch), self.dart.getInclusions(batch)):
+                credentials[role] = (members, inclusions)
+
+        for index in frontier:
+            self.expanded[index] = True
+            expr = self.exprs[index]
+            if isinstance(expr, SIExpression):
+                (members, inclusions) = credentials[expr]
+                for (memberExpr, credWeight) in members:
+                    member = self.addMember(memberExpr.member)
+                    self.memberCredentials[(index, member)] = credWeight
+                    self.memberWeights[(index, member)] = credWeight
+                for (inclExpr, credWeight) in inclusions:
+                    self.addEdge(self.addNode(inclExpr), index, credWeight)
+            elif isinstance(expr, LIExpression):
+                self.linkings.append((index, self.addNode(SIExpression(expr.principal, expr.roleNameA))))
+            elif isinstance(expr, IIExpression):
+                intersectedRoleA = self.addNode(SIExpression(expr.principalA, expr.roleNameA))
+                intersectedRoleB = self.addNode(SIExpression(expr.principalB, expr.roleNameB))
+                # Come per IntersectionMonitor, l'intersezione di un ruolo con se stesso non produce soluzioni
+                if intersectedRoleA != intersectedRoleB:
+                    self.intersections[index] = (intersectedRoleA, intersectedRoleB)
+
+    def linkRoles(self, batchSize = DEFAULT_BATCH_SIZE):
+        # Collega ai nodi LIExpression i ruoli linkati dei membri del relativo ruolo P.r1 non ancora collegati,
+        # verificandone l'esistenza con una lettura aggregata exprsExist() ogni batchSize ruoli.
+        # Restituisce True se è stato inserito almeno un nuovo arco
+        requested = []
+        for (index, linking) in self.linkings:
+            for member in numpy.flatnonzero(self.values[linking] != ARRAY_NO_SOLUTION).tolist():
+                if (index, member) not in self.links:
+                    self.links.add((index, member))
+                    requested.append((index, linking, member, SIExpression(self.members[member], self.exprs[index].roleNameB)))
+
+        linkedRoles = [linkedRole for linkedRole in dict.fromkeys(linkedRole for (_, _, _, linkedRole) in requested)
+                       if linkedRole not in self.existence]
+        for i in range(0, len(linkedRoles), batchSize):
+            batch = linkedRoles[i:i+batchSize]
+            self.existence.update(zip(batch, self.dart.exprsExist(batch)))
+
+        linked = False
+        for (index, linking, member, linkedRole) in requested:
+            if self.existence[linkedRole]:
+                self.addEdge(self.addNode(linkedRole), index, 0, linking, member)
+                linked = True
+        return linked
+
+    def resize(self):
+        # Estende le matrici values e preds ai nodi ed ai membri inseriti successivamente alla loro allocazione
+        (rows, cols) = self.values.shape
+        if rows == len(self.exprs) and cols == len(self.members):
+            return
+        values = numpy.full((len(self.exprs), len(self.members)), ARRAY_NO_SOLUTION)
+        values[:rows, :cols] = self.values
+        preds = numpy.full((len(self.exprs), len(self.members)), ARRAY_MEMBER_PRED, dtype=numpy.int64)
+        preds[:rows, :cols] = self.preds
+        self.values = values
+        self.preds = preds
+
+    def propagate(self):
+        # Calcola il punto fisso delle soluzioni a partire da quelle già presenti in values.
+        # Al primo passo sono considerati gli archi inseriti dopo il punto fisso precedente e quelli uscenti
+        # dai nodi con nuove credenziali Simple Member; ai passi successivi, gli archi uscenti dai nodi
+        # con soluzioni migliorate al passo precedente e gli archi di collegamento le cui soluzioni di supporto
+        # sono migliorate. Un passo che non migliora alcuna soluzione conclude il calcolo
+        self.resize()
+        values = self.values
+        preds = self.preds
+        active = numpy.zeros(len(self.exprs), dtype=bool)
+
+        if len(self.memberCredentials) != 0:
+            (rows, cols) = (numpy.array(keys) for keys in zip(*self.memberCredentials.keys()))
+            # Valore di fiducia di una soluzione di valore MAX_WEIGHT attraverso la credenziale (vedi ProofEdge.signSolution())
+            weights = (MAX_WEIGHT * numpy.array(list(self.memberCredentials.values()))) / MAX_WEIGHT
+            improved = weights > values[rows, cols]
+            values[rows[improved], cols[improved]] = weights[improved]
+            preds[rows[improved], cols[improved]] = ARRAY_MEMBER_PRED
+            active[rows[improved]] = True
+            self.memberCredentials.clear()
+
+        # Archi ordinati per nodo destinazione: ciascun nodo corrisponde ad un segmento contiguo
+        order = numpy.argsort(numpy.array(self.edgeTo, dtype=numpy.int64), kind='stable')
+        edgeFrom = numpy.array(self.edgeFrom, dtype=numpy.int64)[order]
+        edgeTo = numpy.array(self.edgeTo, dtype=numpy.int64)[order]
+        edgeWeights = numpy.array(self.edgeWeights, dtype=float)[order]
+        edgeLinking = numpy.array(self.edgeLinking, dtype=numpy.int64)[order]
+        edgeMember = numpy.array(self.edgeMember, dtype=numpy.int64)[order]
+        isLink = edgeLinking >= 0
+        fresh = order >= self.relaxedEdges
+        self.relaxedEdges = len(order)
+
+        intersections = numpy.array(list(self.intersections.keys()), dtype=numpy.int64)
+        intersectedA = numpy.array([sides[0] for sides in self.intersections.values()], dtype=numpy.int64)
+        intersectedB = numpy.array([sides[1] for sides in self.intersections.values()], dtype=numpy.int64)
+
+        while True:
+            newValues = values.copy()
+
+            selected = numpy.flatnonzero(fresh | active[edgeFrom] | (isLink & active[numpy.maximum(edgeLinking, 0)]))
+            fresh = numpy.zeros(len(order), dtype=bool)
+            if len(selected) != 0:
+                sources = edgeFrom[selected]
+                targets = edgeTo[selected]
+                weights = edgeWeights[selected]
+                links = isLink[selected]
+                weights[links] = values[edgeLinking[selected][links], edgeMember[selected][links]]
+                sourceValues = values[sources]
+                candidates = (sourceValues * weights[:, None]) / MAX_WEIGHT
+                candidates[(sourceValues == ARRAY_NO_SOLUTION) | (weights == ARRAY_NO_SOLUTION)[:, None]] = ARRAY_NO_SOLUTION
+                starts = numpy.flatnonzero(numpy.r_[True, targets[1:] != targets[:-1]])
+                segmentTargets = targets[starts]
+                newValues[segmentTargets] = numpy.maximum(newValues[segmentTargets], numpy.maximum.reduceat(candidates, starts, axis=0))
+
+            # Le intersezioni sono calcolate a partire dai valori del passo precedente, come per gli archi
+            sidesA = values[intersectedA]
+            sidesB = values[intersectedB]
+            joined = numpy.where((sidesA != ARRAY_NO_SOLUTION) & (sidesB != ARRAY_NO_SOLUTION),
+                                 numpy.minimum(sidesA, sidesB), ARRAY_NO_SOLUTION)
+            newValues[intersections] = numpy.maximum(newValues[intersections], joined)
+
+            improvedCells = newValues > values
+            if not improvedCells.any():
+                break
+
+            # Il predecessore di ciascuna soluzione migliorata è uno qualsiasi degli archi che la producono
+            if len(selected) != 0:
+                (edges, cols) = numpy.nonzero((candidates == newValues[targets]) & improvedCells[targets])
+                preds[targets[edges], cols] = order[selected[edges]]
+            (rows, cols) = numpy.nonzero((joined == newValues[intersections]) & improvedCells[intersections])
+            preds[intersections[rows], cols] = ARRAY_INTERSECTION_PRED
+
+            active = improvedCells.any(axis=1)
+            values[:] = newValues
+
+    def solutions(self, expr):
         """
-        Richiedi l'inserimento di una nuova credenziale Intersection Inclusion per un proprio ruolo
-        
-        :param assignedRolename: il rolename dell'assigned role della credenziale
-        :param expression: la role expression IIExpression della credenziale
-        :param weight: valore di fiducia associato alla credenziale
-        :param tx: parametro opzionale contenente eventuali preferenze per la transazione
+        Restituisce l'insieme delle soluzioni del nodo rappresentante expr, indicizzate per membro,
+        o None se qualcuna di esse non può essere ricostruita (vedi solution())
         """
-        self.contract.functions.addIntersectionInclusion(assignedRolename, *expression, weight).call(tx)
-        txHash = self.contract.functions.addIntersectionInclusion(assignedRolename, *expression, weight).transact(tx)
-        self.w3.eth.waitForTransactionReceipt(txHash)
+        index = self.exprIndex[expr]
+        solutions = {}
+        for member in numpy.flatnonzero(self.values[index] != ARRAY_NO_SOLUTION).tolist():
+            solution = self.solution(index, member)
+            if solution is None:
+                return None
+            solutions[self.members[member]] = solution
+        return solutions
+
+    def solution(self, index, member):
+        """
+        Costruisce la Solution del membro di indice member per il nodo di indice index, ripercorrendone i predecessori.
+
+        I predecessori di una soluzione rimangono quelli registrati al suo ultimo miglioramento, anche qualora
+        le soluzioni da cui deriva siano a loro volta migliorate senza che ciò ne aumenti il valore di fiducia:
+        il valore ricostruito non è quindi inferiore né, essendo quello di punto fisso, superiore a quello calcolato.
+        Gli arrotondamenti possono tuttavia, in casi degeneri, generare predecessori ciclici o valori ricostruiti differenti;
+        in tal caso è restituito None
+        """
+        built = self.builtSolutions
+        visiting = set()
+        stack = [(index, member)]
+        while len(stack) != 0:
+            cell = stack[-1]
+            if cell in built:
+                stack.pop()
+                continue
+            missing = [dependency for dependency in self.dependencies(*cell) if dependency not in built]
+            if len(missing) != 0:
+                if cell in visiting or any(dependency in visiting for dependency in missing):
+                    return None
+                visiting.add(cell)
+                stack.extend(missing)
+                continue
+            stack.pop()
+            visiting.discard(cell)
+            solution = self.buildSolution(*cell)
+            if solution.weight != self.values[cell]:
+                return None
+            built[cell] = solution
+        return built[(index, member)]
+
+    def dependencies(self, index, member):
+        # Restituisce le celle (nodo, membro) delle soluzioni da cui deriva la soluzione della cella fornita
+        pred = self.preds[index, member]
+        if pred == ARRAY_MEMBER_PRED:
+            return []
+        if pred == ARRAY_INTERSECTION_PRED:
+            (intersectedA, intersectedB) = self.intersections[index]
+            return [(intersectedA, member), (intersectedB, member)]
+        dependencies = [(self.edgeFrom[pred], member)]
+        if self.edgeLinking[pred] >= 0:
+            dependencies.append((self.edgeLinking[pred], self.edgeMember[pred]))
+        return dependencies
+
+    def buildSolution(self, index, member):
+        # Costruisce la Solution della cella fornita a partire da quelle, già costruite, da cui deriva
+        pred = self.preds[index, member]
+        if pred == ARRAY_MEMBER_PRED:
+            memberExpr = SMExpression(self.members[member])
+            edge = ProofEdge(self.proofNode(memberExpr), self.proofNode(self.exprs[index]), self.memberWeights[(index, member)])
+            return edge.signSolution(Solution(memberExpr.member, MAX_WEIGHT))
+        if pred == ARRAY_INTERSECTION_PRED:
+            (intersectedA, intersectedB) = self.intersections[index]
+            return intersectSolutions(self.builtSolutions[(intersectedA, member)], self.builtSolutions[(intersectedB, member)])
+        pred = int(pred)
+        edge = self.proofEdges.get(pred)
+        if edge is None:
+            fromNode = self.proofNode(self.exprs[self.edgeFrom[pred]])
+            toNode = self.proofNode(self.exprs[self.edgeTo[pred]])
+            if self.edgeLinking[pred] >= 0:
+                supportSolution = self.builtSolutions[(self.edgeLinking[pred], self.edgeMember[pred])]
+                edge = ProofEdge(fromNode, toNode, supportSolution.weight, supportSolution)
+            else:
+                edge = ProofEdge(fromNode, toNode, self.edgeWeights[pred])
+            self.proofEdges[pred] = edge
+        return edge.signSolution(self.builtSolutions[(self.edgeFrom[pred], member)])
+
+    def proofNode(self, expr):
+        # Restituisce il ProofNode, privo di soluzioni, rappresentante expr nei path delle soluzioni costruite
+        node = self.proofNodes.get(expr)
+        if node is None:
+            node = ProofNode(expr)
+            self.proofNodes[expr] = node
+        return node
+
+
+"""
+------------------------------------------------------------------------------------
+DART
+------------------------------------------------------------------------------------
+"""
 
-    # --------------------------------------------------------------------------------
-    # TODO: operazioni di rimozione di credenziali ed aggiornamento dei valori di fiducia
-    # --------------------------------------------------------------------------------
+def inclusionExpr(addrA, addrB, roleA, roleB):
+    """
+    Costruisce la role expression di una credenziale di inclusione a partire dai campi
+    della relativa Expression memorizzata dal contratto on-chain
+    """
+    roleA = Web3.toHex(roleA)
+    roleB = Web3.toHex(roleB)
+    if addrB != NULL_PRINCIPAL:
+        return IIExpression(addrA, roleA, addrB, roleB)
+    elif roleB != NULL_ROLENAME:
+        return LIExpression(addrA, roleA, roleB)
+    else:
+        return SIExpression(addrA, roleA)
+
+
+def credentialDelta(event):
+    """
+    Costruisce la CredentialDelta corrispondente ad un evento CredentialChanged del contratto on-chain
+    """
+    args = event['args']
+    operation = args['operation']
+    if operation == CREDENTIAL_NEW_ROLE:
+        expr = None
+    elif Web3.toHex(args['roleA']) == NULL_ROLENAME:
+        expr = SMExpression(args['addrA'])
+    else:
+        expr = inclusionExpr(args['addrA'], args['addrB'], args['roleA'], args['roleB'])
+    weight = None if operation == CREDENTIAL_REMOVED else args['weight']
+    return CredentialDelta(operation, Credential(args['principal'], Web3.toHex(args['rolename']), expr, weight), event['blockNumber'])
+
+
+def compileProof(solution):
+    """
+    Costruisce, a partire dal path di una Solution, la dimostrazione per il metodo di verifica on-chain:
+    la sequenza di coppie di identificativi (ruolo assegnato, role expression) delle credenziali attraversate.
+    Gli archi entranti in nodi LIExpression non corrispondono a credenziali memorizzate on-chain e sono dunque omessi.
+    Di una SolutionSummary è restituita la dimostrazione già costruita
+    """
+    if isinstance(solution, SolutionSummary):
+        return list(solution.proof)
+    proof = []
+    for edge in solution.path:
+        if not isinstance(edge.toNode.expr, LIExpression):
+            proof.append(edge.toNode.expr.id)
+            proof.append(edge.fromNode.expr.id)
+    return proof
+
+
+class DARTReader:
+    """
+    Interfaccia per una generica sorgente delle credenziali registrate sul contratto DART,
+    su cui è possibile eseguire il backward search algorithm.
+
+    Ogni sorgente deve fornire le operazioni di lettura exprExists(), getMembersCount(), getMember(),
+    getInclusionsCount() e getInclusion(), con la stessa semantica delle omonime funzioni del contratto on-chain.
+    Le letture aggregate exprsExist(), getMembers() e getInclusions() sono ricavate da queste ultime,
+    ma possono essere ridefinite dalle sorgenti in grado di eseguirle in modo più efficiente.
+
+    statsExporter: se diverso da None, funzione a cui è fornita la SearchStats di ciascuna ricerca eseguita,
+                   ad esempio per inoltrarne le metriche ad un sistema di monitoraggio
+    """
+
+    statsExporter = None
 
     def exprExists(self, expr):
-        """        
-        Restituisce True se l'espressione expr:Expression fornita risulta parte di almeno una credenziale
-        registrata sul contratto on-chain da parte di un qualsiasi principal
-        """
-        return self.contract.functions.exprExists(expr.id).call()
+        pass
 
     def getMembersCount(self, role):
-        """
-        Restituisce il numero di credenziali Simple Member aventi role:SIExpression come assigned role
-        """
-        return self.contract.functions.getMembersCount(role.id).call()
+        pass
 
     def getMember(self, role, memberIndex):
+        pass
+
+    def getInclusionsCount(self, role):
+        pass
+
+    def getInclusion(self, role, inclusionIndex):
+        pass
+
+    def exprsExist(self, exprs):
         """
-        Restituisce il memberIndex-esimo membro associato tramite credenziale Simple Member al ruolo role:SIExpression
+        Restituisce, per ciascuna espressione della lista exprs, l'esito della verifica exprExists()
         """
-        (address, weight) = self.contract.functions.getMember(role.id, memberIndex).call()
-        return (SMExpression(address), weight)
+        return [self.exprExists(expr) for expr in exprs]
 
-    def getInclusionsCount(self, role):
+    def getMembers(self, roles):
         """
-        Restituisce il numero di credenziali di inclusione (simple, linked, intersection)
-        aventi role:SIExpression come assigned role
+        Restituisce, per ciascun ruolo role:SIExpression della lista roles, la lista dei membri
+        associati tramite credenziale Simple Member nella forma di coppie (SMExpression, weight)
         """
-        return self.contract.functions.getInclusionsCount(role.id).call()
+        return [[self.getMember(role, i) for i in range(self.getMembersCount(role))] for role in roles]
 
-    def getInclusion(self, role, inclusionIndex):
+    def getInclusions(self, roles):
         """
-        Restituisce la inclusionIndex-esima credenziale di inclusione avente role:SIExpression come assigned role
+        Restituisce, per ciascun ruolo role:SIExpression della lista roles, la lista delle credenziali di inclusione
+        aventi tale ruolo come assigned role nella forma di coppie (Expression, weight)
         """
-        (addrA, addrB, roleA, roleB, weight) = self.contract.functions.getInclusion(role.id, inclusionIndex).call()
-        roleA = Web3.toHex(roleA)
-        roleB = Web3.toHex(roleB)
-        if addrB != NULL_PRINCIPAL:
-            return (IIExpression(addrA, roleA, addrB, roleB), weight)
-        elif roleB != NULL_ROLENAME:
-            return (LIExpression(addrA, roleA, roleB), weight)
-        else:
-            return (SIExpression(addrA, roleA), weight)
+        return [[self.getInclusion(role, i) for i in range(self.getInclusionsCount(role))] for role in roles]
 
-    def search(self, role):
+    def getMemberWeight(self, role, member):
+        """
+        Restituisce il valore di fiducia della credenziale Simple Member che associa member al ruolo role:SIExpression,
+        o None se tale credenziale non esiste
+        """
+        memberExpr = SMExpression(member)
+        for (expr, weight) in self.getMembers([role])[0]:
+            if expr == memberExpr:
+                return weight
+        return None
+
+    def search(self, role, batchSize=DEFAULT_BATCH_SIZE, propagation=RECURSIVE_PROPAGATION, withStats=False,
+               objective=WEIGHT_OBJECTIVE, minWeight=0, maxDepth=None, deferLinks=False, bulkJoins=False):
         """
         Esegue il backward search algorithm a partire dal ruolo role:SMExpression fornito,
-        restituendo infine l'insieme delle soluzioni trovate per tale ruolo
+        restituendo infine l'insieme delle soluzioni trovate per tale ruolo.
+
+        Il grafo è esplorato per frontiere: le credenziali di tutti i ruoli di una frontiera
+        sono lette con una lettura aggregata ogni batchSize ruoli.
+        La modalità di propagazione delle soluzioni è scelta tramite propagation (vedi ProofGraph):
+        con PRIORITY_PROPAGATION le soluzioni sono accettate senza ricorsione, in ordine di valore di fiducia decrescente,
+        e ciascun nodo accetta ogni membro al più una volta per frontiera, benché le frontiere successive possano
+        migliorarne la soluzione (vedi ProofGraph.propagate()).
+
+        Se withStats è True è restituita la coppia (soluzioni, SearchStats) con le statistiche della ricerca;
+        le statistiche sono raccolte anche se è impostato statsExporter, a cui sono fornite al termine della ricerca.
+
+        La soluzione restituita per ciascun membro è scelta in base all'obiettivo objective (vedi selectSolutions()),
+        tra le sole soluzioni con valore di fiducia non inferiore a minWeight: con WEIGHT_OBJECTIVE è la soluzione
+        con valore di fiducia maggiore, mentre gli altri obiettivi consentono di privilegiare dimostrazioni più economiche
+        da verificare on-chain a fronte di una ricerca più onerosa.
+        Le soluzioni con valore di fiducia inferiore a minWeight sono scartate già durante la ricerca, evitando di
+        elaborare i ruoli che non potrebbero fornire soluzioni sufficienti; maxDepth limita invece le soluzioni
+        a quelle con al più maxDepth passaggi di fiducia (vedi Solution.hops). La profondità di una soluzione è
+        il numero di deleghe tra principal lungo la catena di credenziali che collega il ruolo di partenza al membro:
+        una Simple Member A.a <- B conta un passaggio, una Simple Inclusion A.a <- B.b aggiunge un passaggio
+        a quelli di B.b, una Linked Inclusion A.a <- B.b.c somma, senza aggiungerne, i passaggi della soluzione di B.b
+        che individua il principal C e quelli di C.c, mentre una Intersection Inclusion A.a <- B.b ∩ C.c aggiunge
+        un passaggio al massimo tra quelli delle due soluzioni intersecate. Ad esempio, con A.trust <- B e B.trust <- C,
+        la credenziale A.trust <- A.trust.trust assegna C ad A.trust con due passaggi. Per ciascun membro è restituita
+        la soluzione con valore di fiducia maggiore tra quelle entro il limite, anche se ne esiste una più profonda
+        con valore di fiducia maggiore.
+
+        L'esistenza di ciascun ruolo linkato è verificata una sola volta per ricerca. Se deferLinks è True,
+        le verifiche di esistenza dei ruoli linkati raggiunti da ciascuna frontiera sono differite al termine
+        della frontiera ed eseguite con una lettura aggregata ogni batchSize ruoli.
+
+        Se bulkJoins è True, con WEIGHT_OBJECTIVE le Intersection Inclusion sono intersecate in blocco al termine
+        di ciascuna frontiera, per i soli membri le cui soluzioni sono nuove o migliorate, anziché alla notifica
+        di ciascuna soluzione (vedi ProofGraph.flushJoins()); sono così evitate le intersezioni ripetute dei membri
+        migliorati più volte nella stessa frontiera e la copia delle soluzioni dei ruoli intersecati
         """
-        proofGraph = ProofGraph()
+        stats = self.newStats(withStats)
+        start = perf_counter()
+        proofGraph = ProofGraph(self.instrumented(stats), propagation, stats=stats, objective=objective,
+                                minWeight=minWeight, maxDepth=maxDepth, deferLinks=deferLinks, bulkJoins=bulkJoins)
         startingNode = proofGraph.addNode(role)
         
-        while len(proofGraph.queue) != 0:
-            currNode = proofGraph.queue.popleft()
-
-            if isinstance(currNode.expr, SMExpression):
-                currNode.addSolution(Solution(currNode.expr.member, MAX_WEIGHT))
-
-            elif isinstance(currNode.expr, SIExpression):
-                nMembers = self.getMembersCount(currNode.expr)
-                for i in range(0, nMembers):
-                    (memberExpr, credWeight) = self.getMember(currNode.expr, i)
-                    proofGraph.addNode(memberExpr)
-                    proofGraph.addEdge(memberExpr, currNode.expr, credWeight)
-                nInclusions = self.getInclusionsCount(currNode.expr)
-                for i in range(0, nInclusions):
-                    (inclExpr, credWeight) = self.getInclusion(currNode.expr, i)
-                    proofGraph.addNode(inclExpr)
-                    proofGraph.addEdge(inclExpr, currNode.expr, credWeight)
-            
-            elif isinstance(currNode.expr, LIExpression):
-                linkingRole = SIExpression(currNode.expr.principal, currNode.expr.roleNameA)
-                linkingRoleNode = proofGraph.addNode(linkingRole)
-                linkingRoleNode.attachMonitor(LinkingMonitor(currNode, proofGraph, self))
-            
-            elif isinstance(currNode.expr, IIExpression):
-                intersectedRoleA = SIExpression(currNode.expr.principalA, currNode.expr.roleNameA)
-                intersectedRoleB = SIExpression(currNode.expr.principalB, currNode.expr.roleNameB)
-                intersectedRoleNodeA = proofGraph.addNode(intersectedRoleA)
-                intersectedRoleNodeB = proofGraph.addNode(intersectedRoleB)
-                intersectionMonitor = IntersectionMonitor(currNode, proofGraph, self)
-                intersectedRoleNodeA.attachMonitor(intersectionMonitor)
-                intersectedRoleNodeB.attachMonitor(intersectionMonitor)
+        while len(proofGraph.queue) != 0 or proofGraph.hasPendingLinks() or proofGraph.hasPendingJoins():
+            proofGraph.expandFrontier(batchSize)
+            if len(proofGraph.queue) == 0:
+                proofGraph.propagate()
 
-        return startingNode.solutions
+        return self.searchResult(self.rootSolutions(startingNode, objective, minWeight), stats, start, withStats)
 
-    def verifyProof(self, proof, stackSize, tx={}):
+    def searchMany(self, roles, batchSize=DEFAULT_BATCH_SIZE, propagation=RECURSIVE_PROPAGATION, withStats=False,
+                   objective=WEIGHT_OBJECTIVE, minWeight=0, maxDepth=None, deferLinks=False, bulkJoins=False):
         """
-        Richiedi l'esecuzione dell'algoritmo di verifica on-chain
+        Esegue il backward search algorithm a partire da tutti i ruoli della lista roles contemporaneamente,
+        restituendo un dizionario che associa a ciascun ruolo l'insieme delle soluzioni trovate (vedi search()).
 
-        :param proof: la sequenza di identificativi di espressioni che costituisce la dimostrazione
-        :param stackSize: dimensione suggerita della stack di elaborazione
-        :param tx: parametro opzionale contenente eventuali preferenze per la transazione
+        Tutti i ruoli di partenza condividono il medesimo ProofGraph: ogni ruolo raggiungibile da più ruoli
+        di partenza è letto ed espanso una sola volta, e le letture aggregate di ciascuna frontiera interessano
+        i ruoli raggiunti da tutti i ruoli di partenza.
+        Con withStats è restituita la coppia (dizionario, SearchStats) con le statistiche dell'intera ricerca
         """
-        res = self.contract.functions.verifyProof(proof, stackSize).call(tx)
-        return {'principal':res[0], 'rolename':Web3.toHex(res[1]), 'member':res[2], 'weight':res[3]}
+        stats = self.newStats(withStats)
+        start = perf_counter()
+        proofGraph = ProofGraph(self.instrumented(stats), propagation, stats=stats, objective=objective,
+                                minWeight=minWeight, maxDepth=maxDepth, deferLinks=deferLinks, bulkJoins=bulkJoins)
+        startingNodes = {role: proofGraph.addNode(role) for role in roles}
+
+        while len(proofGraph.queue) != 0 or proofGraph.hasPendingLinks() or proofGraph.hasPendingJoins():
+            proofGraph.expandFrontier(batchSize)
+            if len(proofGraph.queue) == 0:
+                proofGraph.propagate()
+
+        solutions = {role: self.rootSolutions(node, objective, minWeight) for role, node in startingNodes.items()}
+        return self.searchResult(solutions, stats, start, withStats)
+
+    def searchIter(self, role, batchSize=DEFAULT_BATCH_SIZE, propagation=RECURSIVE_PROPAGATION, minWeight=0, maxDepth=None):
+        """
+        Variante incrementale del metodo search(): generatore che restituisce ciascuna soluzione nuova o migliorata
+        del ruolo role:SIExpression non appena accettata dal nodo di partenza, dunque eventualmente più volte
+        per lo stesso membro con valori di fiducia crescenti.
+
+        I nodi sono elaborati a gruppi di al più batchSize, ciascuno letto con una lettura aggregata, così da
+        restituire le prime soluzioni senza attendere l'elaborazione di intere frontiere.
+        Interrompere l'iterazione interrompe la ricerca. Con PRIORITY_PROPAGATION le soluzioni sono propagate,
+        e dunque restituite, solamente al termine di ciascuna frontiera.
+        Per minWeight e maxDepth vedi search()
+        """
+        proofGraph = ProofGraph(self, propagation, minWeight=minWeight, maxDepth=maxDepth)
+        startingNode = proofGraph.addNode(role)
+        collector = CollectorMonitor(startingNode, proofGraph, self)
+        startingNode.attachMonitor(collector)
+
+        while len(proofGraph.queue) != 0 or len(proofGraph.solutionsHeap) != 0 or proofGraph.hasPendingLinks():
+            proofGraph.expandFrontier(batchSize, batchSize)
+            if len(proofGraph.queue) == 0:
+                proofGraph.propagate()
+            while len(collector.solutions) != 0:
+                solution = collector.solutions.popleft()
+                if solution.weight >= minWeight:
+                    yield solution
+
+    def searchMember(self, role, member, batchSize=DEFAULT_BATCH_SIZE):
+        """
+        Esegue una ricerca mirata a verificare l'assegnamento del ruolo role:SIExpression al membro member,
+        restituendo la Solution con valore di fiducia massimo per tale membro, o None se il ruolo non gli è assegnato.
+
+        Rispetto a search(), ogni ruolo fornisce le soluzioni del solo membro cercato (ad eccezione dei ruoli
+        i cui membri sono necessari a collegare le inclusioni linkate) e sono elaborati solamente i nodi il cui
+        valore di fiducia massimo raggiungibile (bound) supera quello della soluzione già trovata: la ricerca termina
+        non appena nessun nodo rimanente può produrre una soluzione migliore.
+        I nodi elaborabili sono elaborati in blocco, in ordine di bound decrescente, con una lettura aggregata
+        ogni batchSize ruoli; le verifiche di esistenza dei ruoli linkati sono differite al termine di ciascun blocco.
+        Le soluzioni sono propagate per priorità al termine di ciascun blocco, così che ogni nodo accetti
+        la soluzione di ciascun membro al più una volta per blocco; i blocchi successivi possono migliorarla
+        """
+        member = Web3.toChecksumAddress(member)
+        proofGraph = ProofGraph(self, PRIORITY_PROPAGATION, goal=member, deferLinks=True)
+        startingNode = proofGraph.addNode(role)
+
+        nodesHeap = []
+        nodesCounter = count()
+        while True:
+            while len(proofGraph.queue) != 0:
+                node = proofGraph.queue.popleft()
+                heapq.heappush(nodesHeap, (-node.bound, next(nodesCounter), node))
+
+            best = startingNode.solutions[member].weight if member in startingNode.solutions else None
+            frontier = {}
+            while len(nodesHeap) != 0 and (best is None or -nodesHeap[0][0] > best):
+                (_, _, node) = heapq.heappop(nodesHeap)
+                if not node.expanded:
+                    frontier[node] = None
+            if len(frontier) == 0 and not proofGraph.hasPendingLinks():
+                break
+            proofGraph.expandNodes(list(frontier), batchSize)
+            proofGraph.propagate()
+
+        return startingNode.solutions.get(member)
+
+    def searchSession(self, role, batchSize=DEFAULT_BATCH_SIZE, propagation=RECURSIVE_PROPAGATION):
+        """
+        Esegue il backward search algorithm a partire dal ruolo role:SIExpression fornito,
+        restituendo una SearchSession aggiornabile a seguito della registrazione di nuove credenziali
+        """
+        return SearchSession(self, role, batchSize, propagation)
+
+    async def searchAsync(self, role, concurrency=DEFAULT_CONCURRENCY, batchSize=DEFAULT_BATCH_SIZE, propagation=RECURSIVE_PROPAGATION, withStats=False,
+                          objective=WEIGHT_OBJECTIVE, minWeight=0, maxDepth=None):
+        """
+        Variante asincrona del metodo search(), restituente il medesimo insieme di soluzioni.
+
+        I nodi di ciascuna frontiera sono espansi contemporaneamente: le letture, comprese le verifiche
+        di esistenza dei ruoli linkati, sono eseguite su un pool di concurrency thread, con al più
+        concurrency letture in corso; ogni lettura aggregata interessa al più batchSize ruoli
+        """
+        stats = self.newStats(withStats)
+        start = perf_counter()
+        proofGraph = ProofGraph(self.instrumented(stats), propagation, stats=stats, objective=objective,
+                                minWeight=minWeight, maxDepth=maxDepth, deferLinks=True)
+        startingNode = proofGraph.addNode(role)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while len(proofGraph.queue) != 0 or proofGraph.hasPendingLinks():
+                await proofGraph.expandFrontierAsync(executor, concurrency, batchSize)
+                if len(proofGraph.queue) == 0:
+                    proofGraph.propagate()
+
+        return self.searchResult(self.rootSolutions(startingNode, objective, minWeight), stats, start, withStats)
+
+    def searchArrays(self, role, batchSize=DEFAULT_BATCH_SIZE):
+        """
+        Variante del metodo search() eseguita tramite il motore vettoriale ArrayProofGraph, restituente
+        i medesimi valori di fiducia (le dimostrazioni possono differire tra soluzioni di pari valore di fiducia).
+        Adatta a policy di grandi dimensioni, in cui l'elaborazione del ProofGraph prevale sulle letture.
+
+        Se NumPy non è disponibile, o se in casi degeneri le soluzioni non possono essere ricostruite
+        dal motore vettoriale (vedi ArrayProofGraph.solution()), la ricerca è eseguita tramite search()
+        """
+        if numpy is None:
+            return self.search(role, batchSize)
+        arrayProofGraph = ArrayProofGraph(self)
+        arrayProofGraph.addNode(role)
+        arrayProofGraph.run(batchSize)
+        solutions = arrayProofGraph.solutions(role)
+        if solutions is None:
+            return self.search(role, batchSize)
+        return solutions
+
+    def rootSolutions(self, startingNode, objective, minWeight):
+        # Restituisce le soluzioni del ruolo di partenza selezionate in base all'obiettivo ed al valore di fiducia minimo
+        if objective != WEIGHT_OBJECTIVE:
+            return selectSolutions(startingNode.fronts, objective, minWeight)
+        if minWeight > 0:
+            return {member: solution for member, solution in startingNode.solutions.items() if solution.weight >= minWeight}
+        return startingNode.solutions
+
+    def newStats(self, withStats):
+        # Restituisce una nuova SearchStats se le statistiche della ricerca sono richieste o da esportare, None altrimenti
+        if withStats or self.statsExporter is not None:
+            return SearchStats()
+        return None
+
+    def instrumented(self, stats):
+        # Restituisce la sorgente delle letture della ricerca, strumentata se le statistiche sono raccolte
+        return self if stats is None else InstrumentedReader(self, stats)
+
+    def searchResult(self, solutions, stats, start, withStats):
+        # Completa le statistiche della ricerca, esportandole se previsto, e restituisce il risultato della ricerca
+        if stats is not None:
+            stats.totalTime = perf_counter() - start
+            if self.statsExporter is not None:
+                self.statsExporter(stats)
+        return (solutions, stats) if withStats else solutions
+
+
+class SearchStats:
+    """
+    Statistiche di esecuzione di una ricerca.
+
+    calls: numero di letture eseguite, per funzione di lettura
+    latency: tempo complessivo in secondi trascorso nelle letture, per funzione di lettura
+    histograms: istogrammi delle latenze delle letture, per funzione di lettura; l'i-esimo elemento conta le letture
+                di durata non superiore a LATENCY_BUCKETS[i] (e superiore al precedente), l'ultimo le letture più lente
+    nodesExpanded: numero di nodi elaborati, per tipo di espressione
+    edgesAdded: numero di archi inseriti o aggiornati nel grafo
+    solutionsAccepted: numero di soluzioni accettate dai nodi
+    solutionsRejected: numero di soluzioni scartate dai nodi poiché non migliori di quelle già possedute
+    solutionsPruned: numero di soluzioni scartate poiché con valore di fiducia inferiore al minimo richiesto
+    linkingNotifications: numero di notifiche ricevute dai LinkingMonitor
+    intersectionNotifications: numero di notifiche ricevute dalle IntersectionMonitor
+    totalTime: durata complessiva in secondi della ricerca
+    readTime: tempo in secondi durante il quale almeno una lettura era in corso, ovvero la durata dell'unione degli intervalli
+              delle letture; a differenza di readLatency, le letture eseguite contemporaneamente (vedi searchAsync()) sono contate una sola volta
+    cacheHit: True se il risultato della ricerca è stato ottenuto dalla cache delle ricerche
+    """
+
+    def __init__(self):
+        self.calls = {}
+        self.latency = {}
+        self.histograms = {}
+        self.nodesExpanded = {}
+        self.edgesAdded = 0
+        self.solutionsAccepted = 0
+        self.solutionsRejected = 0
+        self.solutionsPruned = 0
+        self.linkingNotifications = 0
+        self.intersectionNotifications = 0
+        self.totalTime = 0
+        self.readTime = 0
+        self.cacheHit = False
+        self.lock = Lock()
+        self.activeReads = 0
+        self.readsStart = 0
+
+    def startCall(self):
+        # Registra l'inizio di una lettura, restituendone l'istante di inizio.
+        # L'istante in cui nessuna lettura risulta in corso apre un nuovo intervallo di readTime
+        start = perf_counter()
+        with self.lock:
+            if self.activeReads == 0:
+                self.readsStart = start
+            self.activeReads += 1
+        return start
+
+    def recordCall(self, function, start):
+        # Registra la conclusione di una lettura iniziata all'istante start (vedi startCall());
+        # le letture possono essere eseguite contemporaneamente da più thread
+        end = perf_counter()
+        elapsed = end - start
+        bucket = 0
+        while bucket < len(LATENCY_BUCKETS) and elapsed > LATENCY_BUCKETS[bucket]:
+            bucket += 1
+        with self.lock:
+            self.activeReads -= 1
+            if self.activeReads == 0:
+                self.readTime += end - self.readsStart
+            self.calls[function] = self.calls.get(function, 0) + 1
+            self.latency[function] = self.latency.get(function, 0) + elapsed
+            if function not in self.histograms:
+                self.histograms[function] = [0] * (len(LATENCY_BUCKETS) + 1)
+            self.histograms[function][bucket] += 1
+
+    def nodeExpanded(self, node):
+        exprType = type(node.expr).__name__
+        self.nodesExpanded[exprType] = self.nodesExpanded.get(exprType, 0) + 1
+
+    @property
+    def readLatency(self):
+        """
+        Somma delle latenze in secondi di tutte le letture; nelle ricerche con letture contemporanee
+        può superare totalTime, e non rappresenta dunque il tempo trascorso in attesa delle letture (vedi readTime)
+        """
+        return sum(self.latency.values())
+
+    @property
+    def graphTime(self):
+        """
+        Tempo in secondi della ricerca durante il quale nessuna lettura era in corso, ovvero trascorso nell'elaborazione del grafo
+        """
+        return max(self.totalTime - self.readTime, 0)
+
+    def asDict(self):
+        """
+        Restituisce le statistiche nella forma di un dizionario serializzabile (es: in JSON)
+        """
+        return {
+            'calls': dict(self.calls),
+            'latency': dict(self.latency),
+            'histograms': {function: list(histogram) for function, histogram in self.histograms.items()},
+            'latencyBuckets': list(LATENCY_BUCKETS),
+            'nodesExpanded': dict(self.nodesExpanded),
+            'edgesAdded': self.edgesAdded,
+            'solutionsAccepted': self.solutionsAccepted,
+            'solutionsRejected': self.solutionsRejected,
+            'solutionsPruned': self.solutionsPruned,
+            'linkingNotifications': self.linkingNotifications,
+            'intersectionNotifications': self.intersectionNotifications,
+            'totalTime': self.totalTime,
+            'readLatency': self.readLatency,
+            'readTime': self.readTime,
+            'graphTime': self.graphTime,
+            'cacheHit': self.cacheHit
+        }
+
+
+class InstrumentedReader:
+    """
+    Intermediario verso una sorgente DARTReader che registra in una SearchStats numero e latenza delle letture
+    richieste dal backward search algorithm. Ogni altro attributo è delegato alla sorgente
+    """
+
+    READ_FUNCTIONS = {
+        'exprExists', 'exprsExist', 'getMembersCount', 'getMember', 'getMemberWeight',
+        'getInclusionsCount', 'getInclusion', 'getMembers', 'getInclusions'
+    }
+
+    def __init__(self, dart, stats):
+        self.dart = dart
+        self.stats = stats
+
+    def __getattr__(self, name):
+        attr = getattr(self.dart, name)
+        if name not in InstrumentedReader.READ_FUNCTIONS:
+            return attr
+
+        def timedRead(*args):
+            start = self.stats.startCall()
+            try:
+                return attr(*args)
+            finally:
+                self.stats.recordCall(name, start)
+        return timedRead
+
+
+class SearchCache:
+    """
+    Cache LRU dei risultati del backward search algorithm.
+
+    Ciascun risultato è indicizzato dal ruolo di partenza e dal numero del blocco su cui sono state eseguite
+    tutte le letture della ricerca: l'avanzamento della blockchain invalida dunque automaticamente i risultati.
+    Le Solution memorizzate mantengono, tramite i propri path, il riferimento all'intero ProofGraph della ricerca
+    che le ha prodotte: ciascun risultato occupa dunque la memoria di un ProofGraph finché non viene scartato,
+    e maxSize va scelto di conseguenza.
+
+    maxSize: numero massimo di risultati mantenuti, oltre il quale sono scartati i meno recentemente utilizzati
+    ttl: tempo in secondi dopo il quale un risultato è scartato (None per non porre alcun limite)
+    """
+
+    def __init__(self, maxSize=DEFAULT_SEARCH_CACHE_SIZE, ttl=DEFAULT_SEARCH_CACHE_TTL):
+        self.maxSize = maxSize
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, key):
+        # Restituisci il risultato associato a key, o None se assente o scaduto
+        with self.lock:
+            if key not in self.entries:
+                return None
+            (timestamp, value) = self.entries[key]
+            if self.ttl is not None and monotonic() - timestamp > self.ttl:
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        # Inserisci il risultato value associato a key, scartando se necessario il meno recentemente utilizzato
+        with self.lock:
+            self.entries[key] = (monotonic(), value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxSize:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+class DART(DARTReader):
+    """
+    Classe per l'interfacciamento verso il contratto DART on-chain.
+
+    Tutte le letture sono eseguite sul blocco blockIdentifier (default: 'latest');
+    un'istanza vincolata ad un determinato blocco è ottenibile tramite il metodo atBlock()
+    """
+
+    def __init__(self, contractABI, contractAddress, w3, searchCache=None):
+        """
+        Crea una nuova istanza di interfacciamento verso un contratto DART on-chain.
+
+        :param buildArtifactPath: path all'artefatto json prodotto dalla compilazione del contratto DART tramite suite truffle
+        :param contractABI: array rappresentante l'ABI del contratto DART
+        :param w3: istanza di Web3 connesso ad un nodo della blockchain su cui è istanziato il contratto DART all'indirizzo fornito
+        :param searchCache: SearchCache in cui memorizzare i risultati delle ricerche (default: None, nessuna cache)
+        """
+        self.contract = w3.eth.contract(abi=contractABI, address=contractAddress)
+        self.w3 = w3
+        self.blockIdentifier = 'latest'
+        self.searchCache = searchCache
+
+    def atBlock(self, blockIdentifier):
+        """
+        Restituisce una copia dell'istanza le cui letture sono eseguite sul blocco blockIdentifier
+        """
+        pinned = copy(self)
+        pinned.blockIdentifier = blockIdentifier
+        return pinned
+
+    def getBlockNumber(self):
+        """
+        Restituisce il numero del blocco su cui sono eseguite le letture
+        """
+        if isinstance(self.blockIdentifier, int):
+            return self.blockIdentifier
+        elif self.blockIdentifier == 'latest':
+            return self.w3.eth.blockNumber
+        else:
+            return self.w3.eth.getBlock(self.blockIdentifier)['number']
+
+    def newRole(self, roleName, tx={}):
+        """
+        Richiedi la creazione di un nuovo ruolo
+        
+        :param roleName: stringa rappresentante un valore esadecimale valido (es: 0xabcd) identificativo del nuovo ruolo
+        :param tx: parametro opzionale contenente eventuali preferenze per la transazione
+        """
+        self.contract.functions.newRole(roleName).call(tx)
+        txHash = self.contract.functions.newRole(roleName).transact(tx)
+        self.w3.eth.waitForTransactionReceipt(txHash)
+
+    def addSimpleMember(self, assignedRolename, expression, weight, tx={}):
+        """
+        Richiedi l'inserimento di una nuova credenziale Simple Member per un proprio ruolo
+        
+        :param assignedRolename: il rolename dell'assigned role della credenziale
+        :param expression: la role expression SMExpression della credenziale
+        :param weight: valore di fiducia associato alla credenziale
+        :param tx: parametro opzionale contenente eventuali preferenze per la transazione
+        :return: la Credential registrata
+        """
+        self.contract.functions.addSimpleMember(assignedRolename, *expression, weight).call(tx)
+        txHash = self.contract.functions.addSimpleMember(assignedRolename, *expression, weight).transact(tx)
+        self.w3.eth.waitForTransactionReceipt(txHash)
+        return Credential(tx.get('from', self.w3.eth.defaultAccount), assignedRolename, expression, weight)
+
+    def addSimpleInclusion(self, assignedRolename, expression, weight, tx={}):
+        """
+        Richiedi l'inserimento di una nuova credenziale Simple Inclusion per un proprio ruolo
+        
+        :param assignedRolename: il rolename dell'assigned role della credenziale
+        :param expression: la role expression SIExpression della credenziale
+        :param weight: valore di fiducia associato alla credenziale
+        :param tx: parametro opzionale contenente eventuali preferenze per la transazione
+        :return: la Credential registrata
+        """
+        self.contract.functions.addSimpleInclusion(assignedRolename, *expression, weight).call(tx)
+        txHash = self.contract.functions.addSimpleInclusion(assignedRolename, *expression, weight).transact(tx)
+        self.w3.eth.waitForTransactionReceipt(txHash)
+        return Credential(tx.get('from', self.w3.eth.defaultAccount), assignedRolename, expression, weight)
+
+    def addLinkedInclusion(self, assignedRolename, expression, weight, tx={}):
+        """
+        Richiedi l'inserimento di una nuova credenziale Linked Inclusion per un proprio ruolo
+        
+        :param assignedRolename: il rolename dell'assigned role della credenziale
+        :param expression: la role expression LIExpression della credenziale
+        :param weight: valore di fiducia associato alla credenziale
+        :param tx: parametro opzionale contenente eventuali preferenze per la transazione
+        :return: la Credential registrata
+        """
+        self.contract.functions.addLinkedInclusion(assignedRolename, *expression, weight).call(tx)
+        txHash = self.contract.functions.addLinkedInclusion(assignedRolename, *expression, weight).transact(tx)
+        self.w3.eth.waitForTransactionReceipt(txHash)
+        return Credential(tx.get('from', self.w3.eth.defaultAccount), assignedRolename, expression, weight)
+
+    def addIntersectionInclusion(self, assignedRolename, expression, weight, tx={}):
+        """
+        Richiedi l'inserimento di una nuova credenziale Intersection Inclusion per un proprio ruolo
+        
+        :param assignedRolename: il rolename dell'assigned role della credenziale
+        :param expression: la role expression IIExpression della credenziale
+        :param weight: valore di fiducia associato alla credenziale
+        :param tx: parametro opzionale contenente eventuali preferenze per la transazione
+        :return: la Credential registrata
+        """
+        self.contract.functions.addIntersectionInclusion(assignedRolename, *expression, weight).call(tx)
+        txHash = self.contract.functions.addIntersectionInclusion(assignedRolename, *expression, weight).transact(tx)
+        self.w3.eth.waitForTransactionReceipt(txHash)
+        return Credential(tx.get('from', self.w3.eth.defaultAccount), assignedRolename, expression, weight)
+
+    def removeSimpleMember(self, assignedRolename, expression, tx={}):
+        """
+        Richiedi la rimozione di una credenziale Simple Member registrata per un proprio ruolo
+        
+        :param assignedRolename: il rolename dell'assigned role della credenziale
+        :param expression: la role expression SMExpression della credenziale
+        :param tx: parametro opzionale contenente eventuali preferenze per la transazione
+        :return: la Credential rimossa, con valore di fiducia None
+        """
+        self.contract.functions.removeSimpleMember(assignedRolename, *expression).call(tx)
+        txHash = self.contract.functions.removeSimpleMember(assignedRolename, *expression).transact(tx)
+        self.w3.eth.waitForTransactionReceipt(txHash)
+        return Credential(tx.get('from', self.w3.eth.defaultAccount), assignedRolename, expression, None)
+
+    def updateSimpleMember(self, assignedRolename, expression, newWeight, tx={}):
+        """
+        Richiedi l'aggiornamento del valore di fiducia di una credenziale Simple Member registrata per un proprio ruolo
+        
+        :param assignedRolename: il rolename dell'assigned role della credenziale
+        :param expression: la role expression SMExpression della credenziale
+        :param newWeight: nuovo valore di fiducia associato alla credenziale
+        :param tx: parametro opzionale contenente eventuali preferenze per la transazione
+        :return: la Credential aggiornata
+        """
+        self.contract.functions.updateSimpleMember(assignedRolename, *expression, newWeight).call(tx)
+        txHash = self.contract.functions.updateSimpleMember(assignedRolename, *expression, newWeight).transact(tx)
+        self.w3.eth.waitForTransactionReceipt(txHash)
+        return Credential(tx.get('from', self.w3.eth.defaultAccount), assignedRolename, expression, newWeight)
+
+    def removeSimpleInclusion(self, assignedRolename, expression, tx={}):
+        """
+        Richiedi la rimozione di una credenziale Simple Inclusion registrata per un proprio ruolo
+        
+        :param assignedRolename: il rolename dell'assigned role della credenziale
+        :param expression: la role expression SIExpression della credenziale
+        :param tx: parametro opzionale contenente eventuali preferenze per la transazione
+        :return: la Credential rimossa, con valore di fiducia None
+        """
+        self.contract.functions.removeSimpleInclusion(assignedRolename, expression.id).call(tx)
+        txHash = self.contract.functions.removeSimpleInclusion(assignedRolename, expression.id).transact(tx)
+        self.w3.eth.waitForTransactionReceipt(txHash)
+        return Credential(tx.get('from', self.w3.eth.defaultAccount), assignedRolename, expression, None)
+
+    def updateSimpleInclusion(self, assignedRolename, expression, newWeight, tx={}):
+        """
+        Richiedi l'aggiornamento del valore di fiducia di una credenziale Simple Inclusion registrata per un proprio ruolo
+        
+        :param assignedRolename: il rolename dell'assigned role della credenziale
+        :param expression: la role expression SIExpression della credenziale
+        :param newWeight: nuovo valore di fiducia associato alla credenziale
+        :param tx: parametro opzionale contenente eventuali preferenze per la transazione
+        :return: la Credential aggiornata
+        """
+        self.contract.functions.updateSimpleInclusion(assignedRolename, expression.id, newWeight).call(tx)
+        txHash = self.contract.functions.updateSimpleInclusion(assignedRolename, expression.id, newWeight).transact(tx)
+        self.w3.eth.waitForTransactionReceipt(txHash)
+        return Credential(tx.get('from', self.w3.eth.defaultAccount), assignedRolename, expression, newWeight)
+
+    def removeLinkedInclusion(self, assignedRolename, expression, tx={}):
+        """
+        Richiedi la rimozione di una credenziale Linked Inclusion registrata per un proprio ruolo
+        
+        :param assignedRolename: il rolename dell'assigned role della credenziale
+        :param expression: la role expression LIExpression della credenziale
+        :param tx: parametro opzionale contenente eventuali preferenze per la transazione
+        :return: la Credential rimossa, con valore di fiducia None
+        """
+        self.contract.functions.removeLinkedInclusion(assignedRolename, expression.id).call(tx)
+        txHash = self.contract.functions.removeLinkedInclusion(assignedRolename, expression.id).transact(tx)
+        self.w3.eth.waitForTransactionReceipt(txHash)
+        return Credential(tx.get('from', self.w3.eth.defaultAccount), assignedRolename, expression, None)
+
+    def updateLinkedInclusion(self, assignedRolename, expression, newWeight, tx={}):
+        """
+        Richiedi l'aggiornamento del valore di fiducia di una credenziale Linked Inclusion registrata per un proprio ruolo
+        
+        :param assignedRolename: il rolename dell'assigned role della credenziale
+        :param expression: la role expression LIExpression della credenziale
+        :param newWeight: nuovo valore di fiducia associato alla credenziale
+        :param tx: parametro opzionale contenente eventuali preferenze per la transazione
+        :return: la Credential aggiornata
+        """
+        self.contract.functions.updateLinkedInclusion(assignedRolename, expression.id, newWeight).call(tx)
+        txHash = self.contract.functions.updateLinkedInclusion(assignedRolename, expression.id, newWeight).transact(tx)
+        self.w3.eth.waitForTransactionReceipt(txHash)
+        return Credential(tx.get('from', self.w3.eth.defaultAccount), assignedRolename, expression, newWeight)
+
+    def removeIntersectionInclusion(self, assignedRolename, expression, tx={}):
+        """
+        Richiedi la rimozione di una credenziale Intersection Inclusion registrata per un proprio ruolo
+        
+        :param assignedRolename: il rolename dell'assigned role della credenziale
+        :param expression: la role expression IIExpression della credenziale
+        :param tx: parametro opzionale contenente eventuali preferenze per la transazione
+        :return: la Credential rimossa, con valore di fiducia None
+        """
+        self.contract.functions.removeIntersectionInclusion(assignedRolename, expression.id).call(tx)
+        txHash = self.contract.functions.removeIntersectionInclusion(assignedRolename, expression.id).transact(tx)
+        self.w3.eth.waitForTransactionReceipt(txHash)
+        return Credential(tx.get('from', self.w3.eth.defaultAccount), assignedRolename, expression, None)
+
+    def updateIntersectionInclusion(self, assignedRolename, expression, newWeight, tx={}):
+        """
+        Richiedi l'aggiornamento del valore di fiducia di una credenziale Intersection Inclusion registrata per un proprio ruolo
+        
+        :param assignedRolename: il rolename dell'assigned role della credenziale
+        :param expression: la role expression IIExpression della credenziale
+        :param newWeight: nuovo valore di fiducia associato alla credenziale
+        :param tx: parametro opzionale contenente eventuali preferenze per la transazione
+        :return: la Credential aggiornata
+        """
+        self.contract.functions.updateIntersectionInclusion(assignedRolename, expression.id, newWeight).call(tx)
+        txHash = self.contract.functions.updateIntersectionInclusion(assignedRolename, expression.id, newWeight).transact(tx)
+        self.w3.eth.waitForTransactionReceipt(txHash)
+        return Credential(tx.get('from', self.w3.eth.defaultAccount), assignedRolename, expression, newWeight)
+
+    def credentialFunction(self, credential):
+        # Restituisce la chiamata al contratto che registra la credenziale fornita
+        if isinstance(credential.expr, SMExpression):
+            return self.contract.functions.addSimpleMember(credential.roleName, *credential.expr, credential.weight)
+        elif isinstance(credential.expr, SIExpression):
+            return self.contract.functions.addSimpleInclusion(credential.roleName, *credential.expr, credential.weight)
+        elif isinstance(credential.expr, LIExpression):
+            return self.contract.functions.addLinkedInclusion(credential.roleName, *credential.expr, credential.weight)
+        elif isinstance(credential.expr, IIExpression):
+            return self.contract.functions.addIntersectionInclusion(credential.roleName, *credential.expr, credential.weight)
+        else:
+            raise ValueError(f"unsupported credential expression: {credential.expr}")
+
+    def submitPipelined(self, requests, dryRun, tx):
+        # Invia consecutivamente le transazioni delle coppie (sender, chiamata) in requests, assegnando localmente
+        # i nonce di ciascun sender, e ne raccoglie le ricevute solamente al termine dell'invio.
+        # Restituisce, per ciascuna richiesta, la coppia (ricevuta, errore)
+        nonces = {}
+        txHashes = []
+        errors = []
+        for (sender, function) in requests:
+            txHash = None
+            error = None
+            try:
+                if sender not in nonces:
+                    nonces[sender] = self.w3.eth.getTransactionCount(sender, 'pending')
+                currTx = dict(tx, **{'from': sender, 'nonce': nonces[sender]})
+                if dryRun:
+                    function.call(currTx)
+                txHash = function.transact(currTx)
+                nonces[sender] += 1
+            except Exception as e:
+                error = str(e)
+            txHashes.append(txHash)
+            errors.append(error)
+
+        results = []
+        for (txHash, error) in zip(txHashes, errors):
+            receipt = None
+            if txHash is not None:
+                try:
+                    receipt = self.w3.eth.waitForTransactionReceipt(txHash)
+                    if receipt['status'] == 0:
+                        error = 'transaction reverted'
+                except Exception as e:
+                    error = str(e)
+            results.append((receipt, error))
+        return results
+
+    def loadPolicy(self, credentials, roles=[], dryRun=False, tx={}):
+        """
+        Richiedi la creazione dei ruoli roles e la registrazione delle credenziali credentials in blocco.
+        Le transazioni di ciascuna fase sono inviate consecutivamente senza attenderne la conferma, assegnando
+        localmente i nonce di ciascun principal; le ricevute sono raccolte al termine dell'invio.
+        I ruoli sono creati, e le relative ricevute attese, prima della registrazione delle credenziali.
+        Una richiesta fallita non interrompe il caricamento: l'errore è riportato nel relativo risultato
+
+        :param credentials: le Credential da registrare, ciascuna inviata dal principal del proprio assigned role
+        :param roles: i ruoli SIExpression da creare, ciascuno inviato dal principal del ruolo
+        :param dryRun: se True, ciascuna transazione è preceduta dalla relativa chiamata di prova
+        :param tx: parametro opzionale contenente eventuali preferenze comuni alle transazioni (es: gas)
+        :return: la coppia (risultati ruoli, risultati credenziali), dove ciascun risultato è nella forma
+                 {'request': ruolo o credenziale, 'receipt': ricevuta della transazione, 'error': None o messaggio d'errore}
+        """
+        roleRequests = [(role.principal, self.contract.functions.newRole(role.roleName)) for role in roles]
+        roleResults = self.submitPipelined(roleRequests, dryRun, tx)
+
+        credRequests = [(credential.principal, self.credentialFunction(credential)) for credential in credentials]
+        credResults = self.submitPipelined(credRequests, dryRun, tx)
+
+        return ([{'request': role, 'receipt': receipt, 'error': error} for (role, (receipt, error)) in zip(roles, roleResults)],
+                [{'request': credential, 'receipt': receipt, 'error': error} for (credential, (receipt, error)) in zip(credentials, credResults)])
+
+    def exprExists(self, expr):
+        """        
+        Restituisce True se l'espressione expr:Expression fornita risulta parte di almeno una credenziale
+        registrata sul contratto on-chain da parte di un qualsiasi principal
+        """
+        return self.contract.functions.exprExists(expr.id).call(block_identifier=self.blockIdentifier)
+
+    def exprsExist(self, exprs):
+        """
+        Restituisce, per ciascuna espressione della lista exprs, l'esito della verifica exprExists().
+        Tutte le espressioni sono verificate tramite una singola chiamata al contratto on-chain
+        """
+        return self.contract.functions.exprsExist([expr.id for expr in exprs]).call(block_identifier=self.blockIdentifier)
+
+    def getMembersCount(self, role):
+        """
+        Restituisce il numero di credenziali Simple Member aventi role:SIExpression come assigned role
+        """
+        return self.contract.functions.getMembersCount(role.id).call(block_identifier=self.blockIdentifier)
+
+    def getMember(self, role, memberIndex):
+        """
+        Restituisce il memberIndex-esimo membro associato tramite credenziale Simple Member al ruolo role:SIExpression
+        """
+        (address, weight) = self.contract.functions.getMember(role.id, memberIndex).call(block_identifier=self.blockIdentifier)
+        return (SMExpression(address), weight)
+
+    def getMemberWeight(self, role, member):
+        """
+        Restituisce il valore di fiducia della credenziale Simple Member che associa member al ruolo role:SIExpression,
+        o None se tale credenziale non esiste
+        """
+        (exists, weight) = self.contract.functions.getMemberWeight(role.id, member).call(block_identifier=self.blockIdentifier)
+        return weight if exists else None
+
+    def getInclusionsCount(self, role):
+        """
+        Restituisce il numero di credenziali di inclusione (simple, linked, intersection)
+        aventi role:SIExpression come assigned role
+        """
+        return self.contract.functions.getInclusionsCount(role.id).call(block_identifier=self.blockIdentifier)
+
+    def getInclusion(self, role, inclusionIndex):
+        """
+        Restituisce la inclusionIndex-esima credenziale di inclusione avente role:SIExpression come assigned role
+        """
+        (addrA, addrB, roleA, roleB, weight) = self.contract.functions.getInclusion(role.id, inclusionIndex).call(block_identifier=self.blockIdentifier)
+        return (inclusionExpr(addrA, addrB, roleA, roleB), weight)
+
+    def getMembers(self, roles):
+        """
+        Restituisce, per ciascun ruolo role:SIExpression della lista roles, la lista dei membri
+        associati tramite credenziale Simple Member nella forma di coppie (SMExpression, weight).
+        Tutti i ruoli sono letti tramite una singola chiamata al contratto on-chain
+        """
+        res = self.contract.functions.getMembers([role.id for role in roles]).call(block_identifier=self.blockIdentifier)
+        return [[(SMExpression(address), weight) for (address, weight) in roleMembers] for roleMembers in res]
+
+    def getInclusions(self, roles):
+        """
+        Restituisce, per ciascun ruolo role:SIExpression della lista roles, la lista delle credenziali di inclusione
+        aventi tale ruolo come assigned role nella forma di coppie (Expression, weight).
+        Tutti i ruoli sono letti tramite una singola chiamata al contratto on-chain
+        """
+        res = self.contract.functions.getInclusions([role.id for role in roles]).call(block_identifier=self.blockIdentifier)
+        return [[(inclusionExpr(addrA, addrB, roleA, roleB), weight) for (addrA, addrB, roleA, roleB, weight) in roleInclusions]
+                for roleInclusions in res]
+
+    def search(self, role, batchSize=DEFAULT_BATCH_SIZE, propagation=RECURSIVE_PROPAGATION, useCache=True, withStats=False,
+               objective=WEIGHT_OBJECTIVE, minWeight=0, maxDepth=None, deferLinks=False, bulkJoins=False):
+        """
+        Esegue il backward search algorithm a partire dal ruolo role:SIExpression fornito (vedi DARTReader.search()).
+
+        Tutte le letture della ricerca sono eseguite sul medesimo blocco, ovvero l'ultimo blocco al momento della chiamata
+        se l'istanza non è vincolata ad un blocco specifico. Se useCache è True ed all'istanza è associata una searchCache,
+        il risultato è memorizzato in quest'ultima e da essa restituito alle successive ricerche dello stesso ruolo sul medesimo blocco.
+        Per withStats, objective, minWeight, maxDepth, deferLinks e bulkJoins vedi DARTReader.search()
+        """
+        start = perf_counter()
+        pinned = self.atBlock(self.getBlockNumber())
+        key = (role.id, pinned.blockIdentifier, propagation, objective, minWeight, maxDepth)
+        if useCache and self.searchCache is not None:
+            solutions = self.searchCache.get(key)
+            if solutions is not None:
+                return self.cachedResult(dict(solutions), start, withStats)
+
+        result = DARTReader.search(pinned, role, batchSize, propagation, withStats, objective, minWeight, maxDepth, deferLinks, bulkJoins)
+        if useCache and self.searchCache is not None:
+            self.searchCache.put(key, dict(result[0] if withStats else result))
+        return result
+
+    def searchMany(self, roles, batchSize=DEFAULT_BATCH_SIZE, propagation=RECURSIVE_PROPAGATION, useCache=True, withStats=False,
+                   objective=WEIGHT_OBJECTIVE, minWeight=0, maxDepth=None, deferLinks=False, bulkJoins=False):
+        """
+        Esegue il backward search algorithm a partire da tutti i ruoli della lista roles su un unico ProofGraph
+        (vedi DARTReader.searchMany()), con le medesime garanzie di search() sul blocco delle letture.
+        Se useCache è True, i ruoli le cui soluzioni sono già presenti in searchCache non sono ricercati,
+        e le soluzioni di ciascuno dei rimanenti sono memorizzate in searchCache come da search()
+        """
+        start = perf_counter()
+        pinned = self.atBlock(self.getBlockNumber())
+        keys = {role: (role.id, pinned.blockIdentifier, propagation, objective, minWeight, maxDepth) for role in roles}
+        cached = {}
+        if useCache and self.searchCache is not None:
+            for role, key in keys.items():
+                solutions = self.searchCache.get(key)
+                if solutions is not None:
+                    cached[role] = dict(solutions)
+
+        missing = [role for role in keys if role not in cached]
+        if len(missing) == 0:
+            return self.cachedResult(cached, start, withStats)
+
+        result = DARTReader.searchMany(pinned, missing, batchSize, propagation, withStats, objective, minWeight, maxDepth, deferLinks, bulkJoins)
+        searched = result[0] if withStats else result
+        if useCache and self.searchCache is not None:
+            for role, solutions in searched.items():
+                self.searchCache.put(keys[role], dict(solutions))
+        searched.update(cached)
+        return result
+
+    def searchIter(self, role, batchSize=DEFAULT_BATCH_SIZE, propagation=RECURSIVE_PROPAGATION, minWeight=0, maxDepth=None):
+        """
+        Variante incrementale del metodo search() (vedi DARTReader.searchIter()).
+        Tutte le letture sono eseguite sul medesimo blocco, ovvero l'ultimo blocco al momento della chiamata
+        se l'istanza non è vincolata ad un blocco specifico; i risultati non sono memorizzati in searchCache
+        """
+        pinned = self.atBlock(self.getBlockNumber())
+        yield from DARTReader.searchIter(pinned, role, batchSize, propagation, minWeight, maxDepth)
+
+    def searchMember(self, role, member, batchSize=DEFAULT_BATCH_SIZE):
+        """
+        Esegue una ricerca mirata al membro member (vedi DARTReader.searchMember()).
+        Tutte le letture sono eseguite sul medesimo blocco, ovvero l'ultimo blocco al momento della chiamata
+        se l'istanza non è vincolata ad un blocco specifico; i risultati non sono memorizzati in searchCache
+        """
+        pinned = self.atBlock(self.getBlockNumber())
+        return DARTReader.searchMember(pinned, role, member, batchSize)
+
+    def searchArrays(self, role, batchSize=DEFAULT_BATCH_SIZE):
+        """
+        Variante del metodo search() eseguita tramite il motore vettoriale (vedi DARTReader.searchArrays()).
+        Tutte le letture sono eseguite sul medesimo blocco, ovvero l'ultimo blocco al momento della chiamata
+        se l'istanza non è vincolata ad un blocco specifico; i risultati non sono memorizzati in searchCache
+        """
+        pinned = self.atBlock(self.getBlockNumber())
+        return DARTReader.searchArrays(pinned, role, batchSize)
+
+    async def searchAsync(self, role, concurrency=DEFAULT_CONCURRENCY, batchSize=DEFAULT_BATCH_SIZE, propagation=RECURSIVE_PROPAGATION, useCache=True, withStats=False,
+                          objective=WEIGHT_OBJECTIVE, minWeight=0, maxDepth=None):
+        """
+        Variante asincrona del metodo search(), con le medesime garanzie sul blocco delle letture e sull'uso di searchCache
+        """
+        start = perf_counter()
+        pinned = self.atBlock(self.getBlockNumber())
+        key = (role.id, pinned.blockIdentifier, propagation, objective, minWeight, maxDepth)
+        if useCache and self.searchCache is not None:
+            solutions = self.searchCache.get(key)
+            if solutions is not None:
+                return self.cachedResult(dict(solutions), start, withStats)
+
+        result = await DARTReader.searchAsync(pinned, role, concurrency, batchSize, propagation, withStats, objective, minWeight, maxDepth)
+        if useCache and self.searchCache is not None:
+            self.searchCache.put(key, dict(result[0] if withStats else result))
+        return result
+
+    def cachedResult(self, solutions, start, withStats):
+        # Restituisce il risultato di una ricerca ottenuto dalla cache, con le relative statistiche se previste
+        stats = self.newStats(withStats)
+        if stats is not None:
+            stats.cacheHit = True
+        return self.searchResult(solutions, stats, start, withStats)
+
+    def getCredentialChanges(self, fromBlock, toBlock=None, roles=None, blockRange=DEFAULT_LOG_BLOCK_RANGE):
+        """
+        Restituisce, nell'ordine in cui sono avvenute, le CredentialDelta delle alterazioni delle credenziali registrate
+        tra i blocchi fromBlock e toBlock compresi (default: il blocco su cui sono eseguite le letture).
+        Le alterazioni sono lette dagli eventi CredentialChanged del contratto tramite richieste eth_getLogs,
+        ciascuna relativa ad al più blockRange blocchi; se roles è fornito, sono richieste le sole alterazioni
+        delle credenziali aventi come assigned role uno dei ruoli SIExpression della lista
+        """
+        if toBlock is None:
+            toBlock = self.getBlockNumber()
+        if roles is not None and len(roles) == 0:
+            return []
+        argumentFilters = None if roles is None else {'assignedRoleId': [role.id for role in roles]}
+
+        deltas = []
+        for startBlock in range(fromBlock, toBlock + 1, blockRange):
+            events = self.contract.events.CredentialChanged.getLogs(argument_filters=argumentFilters, fromBlock=startBlock,
+                                                                     toBlock=min(startBlock + blockRange - 1, toBlock))
+            deltas += [credentialDelta(event) for event in events]
+        return deltas
+
+    def verifyProof(self, proof, stackSize, tx={}):
+        """
+        Richiedi l'esecuzione dell'algoritmo di verifica on-chain
+
+        :param proof: la sequenza di identificativi di espressioni che costituisce la dimostrazione
+        :param stackSize: dimensione suggerita della stack di elaborazione
+        :param tx: parametro opzionale contenente eventuali preferenze per la transazione
+        """
+        res = self.contract.functions.verifyProof(proof, stackSize).call(tx, self.blockIdentifier)
+        return {'principal':res[0], 'rolename':Web3.toHex(res[1]), 'member':res[2], 'weight':res[3]}
+
+    def verifyProofs(self, solutions, batchSize=DEFAULT_BATCH_SIZE, concurrency=DEFAULT_CONCURRENCY, tx={},
+                     batchLength=DEFAULT_VERIFY_BATCH_LENGTH):
+        """
+        Richiedi la verifica on-chain delle dimostrazioni di più soluzioni.
+        Le dimostrazioni sono suddivise in lotti di al più batchSize elementi e, salvo le dimostrazioni più lunghe
+        che costituiscono da sole un lotto, di al più batchLength identificativi complessivi, ciascuno verificato con
+        una singola chiamata al contratto; fino a concurrency lotti sono verificati concorrentemente.
+        Un lotto la cui chiamata fallisce, ad esempio poiché eccede il limite di gas delle eth_call del nodo,
+        è suddiviso in due metà verificate separatamente.
+        Restituisce, nell'ordine di solutions, le coppie (risultato, gas) dove risultato è nella forma
+        restituita da verifyProof e gas è il gas di esecuzione di checkProof per la singola dimostrazione,
+        misurato nel contratto: esclude dunque il costo base della transazione, i calldata e la decodifica ABI
+        inclusi invece dalla stima estimateGas di una transazione verifyProof
+
+        :param solutions: le Solution o SolutionSummary di cui verificare le dimostrazioni
+        :param batchSize: numero massimo di dimostrazioni verificate per chiamata
+        :param concurrency: numero massimo di chiamate in corso contemporaneamente
+        :param tx: parametro opzionale contenente eventuali preferenze per la transazione
+        :param batchLength: numero massimo complessivo di identificativi delle dimostrazioni verificate per chiamata
+        """
+        batches = []
+        batchProofs, batchStackSizes, currLength = [], [], 0
+        for solution in solutions:
+            proof = compileProof(solution)
+            if len(batchProofs) == batchSize or (len(batchProofs) != 0 and currLength + len(proof) > batchLength):
+                batches.append((batchProofs, batchStackSizes))
+                batchProofs, batchStackSizes, currLength = [], [], 0
+            batchProofs.append(proof)
+            batchStackSizes.append(solution.reqStackSize)
+            currLength += len(proof)
+        if len(batchProofs) != 0:
+            batches.append((batchProofs, batchStackSizes))
+
+        def verifyBatch(batch):
+            (proofs, stackSizes) = batch
+            try:
+                return self.contract.functions.verifyProofs(proofs, stackSizes).call(tx, self.blockIdentifier)
+            except (ContractLogicError, ValueError):
+                if len(proofs) == 1:
+                    raise
+                half = len(proofs) // 2
+                (resultsA, gasA) = verifyBatch((proofs[:half], stackSizes[:half]))
+                (resultsB, gasB) = verifyBatch((proofs[half:], stackSizes[half:]))
+                return (list(resultsA) + list(resultsB), list(gasA) + list(gasB))
+
+        results = []
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for (batchResults, batchGas) in executor.map(verifyBatch, batches):
+                for (res, gas) in zip(batchResults, batchGas):
+                    results.append(({'principal':res[0], 'rolename':Web3.toHex(res[1]), 'member':res[2], 'weight':res[3]}, gas))
+        return results
+
+
+class CredentialSubscriber:
+    """
+    Sottoscrizione alle alterazioni delle credenziali registrate su un contratto DART on-chain.
+
+    Ogni invocazione di poll() restituisce le sole alterazioni avvenute nei blocchi successivi all'ultimo blocco
+    già esaminato, così che una cache off-chain possa invalidare o aggiornare esattamente i ruoli interessati
+    (ad esempio tramite SearchSession.applyChanges()) al costo di una interrogazione dei log.
+
+    dart: l'istanza DART di interfacciamento al contratto on-chain
+    lastBlock: l'ultimo blocco esaminato
+    roles: se diverso da None, la lista dei ruoli SIExpression di cui seguire le alterazioni
+    """
+
+    def __init__(self, dart, fromBlock=0, roles=None, blockRange=DEFAULT_LOG_BLOCK_RANGE):
+        self.dart = dart
+        self.lastBlock = fromBlock - 1
+        self.roles = roles
+        self.blockRange = blockRange
+
+    def poll(self, toBlock=None):
+        """
+        Restituisce le CredentialDelta delle alterazioni avvenute dall'ultima invocazione fino al blocco toBlock
+        (default: l'ultimo blocco)
+        """
+        if toBlock is None:
+            toBlock = self.dart.w3.eth.blockNumber
+        if toBlock <= self.lastBlock:
+            return []
+        deltas = self.dart.getCredentialChanges(self.lastBlock + 1, toBlock, self.roles, self.blockRange)
+        self.lastBlock = toBlock
+        return deltas
+
+
+"""
+------------------------------------------------------------------------------------
+RICERCA PARALLELA
+------------------------------------------------------------------------------------
+"""
+
+class SolutionSummary:
+    """
+    Record di dati compatto e serializzabile rappresentante una Solution, privo dei riferimenti al ProofGraph.
+
+    member: l'indirizzo del principal oggetto della soluzione
+    weight: il valore di fiducia associato alla soluzione
+    proof: tupla degli identificativi di espressioni che costituisce la dimostrazione on-chain (vedi compileProof())
+    reqStackSize: dimensione della stack sufficiente affinché la soluzione possa essere verificata on-chain
+    """
+
+    __slots__ = ('member', 'weight', 'proof', 'reqStackSize')
+
+    def __init__(self, member, weight, proof, reqStackSize):
+        self.member = member
+        self.weight = weight
+        self.proof = proof
+        self.reqStackSize = reqStackSize
+
+
+def summarizeSolution(solution):
+    """
+    Restituisce la SolutionSummary di solution
+    """
+    return SolutionSummary(solution.member, solution.weight, tuple(bytes(exprId) for exprId in compileProof(solution)), solution.reqStackSize)
+
+
+def summarizeSolutions(solutions):
+    # Restituisce l'insieme di soluzioni di un ruolo con le Solution sostituite dalle relative SolutionSummary,
+    # preservando le liste di soluzioni restituite con PARETO_OBJECTIVE
+    return {member: [summarizeSolution(frontSolution) for frontSolution in solution] if isinstance(solution, list) else summarizeSolution(solution)
+            for member, solution in solutions.items()}
+
+
+# Sorgente delle credenziali del processo corrente, creata da initSearchWorker()
+searchWorkerReader = None
+
+
+def initSearchWorker(readerFactory):
+    # Inizializza un processo della ricerca parallela, creandone la sorgente delle credenziali
+    global searchWorkerReader
+    searchWorkerReader = readerFactory()
+
+
+def searchWorker(roles, options):
+    # Esegue nel processo corrente la ricerca dei ruoli roles su un unico ProofGraph, restituendone le soluzioni riassunte
+    solutions = searchWorkerReader.searchMany(roles, **options)
+    return [summarizeSolutions(solutions[role]) for role in roles]
+
+
+def searchParallel(readerFactory, roles, workers=None, chunkSize=DEFAULT_PARALLEL_CHUNK_SIZE, batchSize=DEFAULT_BATCH_SIZE,
+                   propagation=RECURSIVE_PROPAGATION, objective=WEIGHT_OBJECTIVE, minWeight=0, maxDepth=None):
+    """
+    Esegue il backward search algorithm a partire da ciascun ruolo della lista roles, distribuendo i ruoli
+    su un pool di workers processi (default: uno per processore), restituendo un dizionario che associa
+    a ciascun ruolo l'insieme delle soluzioni trovate nella forma di SolutionSummary.
+
+    Ciascun processo crea la propria sorgente DARTReader invocando readerFactory, che deve dunque essere
+    serializzabile (ad esempio una funzione definita a livello di modulo), ad esempio per aprire la propria
+    connessione Web3 o costruire il proprio backend locale.
+    I ruoli sono assegnati ai processi a gruppi di chunkSize, ciascuno ricercato su un unico ProofGraph
+    (vedi DARTReader.searchMany()); per gli altri parametri vedi DARTReader.search()
+    """
+    roles = list(dict.fromkeys(roles))
+    chunks = [roles[i:i+chunkSize] for i in range(0, len(roles), chunkSize)]
+    options = {'batchSize': batchSize, 'propagation': propagation, 'objective': objective,
+               'minWeight': minWeight, 'maxDepth': maxDepth}
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=initSearchWorker, initargs=(readerFactory,)) as executor:
+        for chunk, chunkResults in zip(chunks, executor.map(searchWorker, chunks, [options] * len(chunks))):
+            results.update(zip(chunk, chunkResults))
+    return results
+
+
+"""
+------------------------------------------------------------------------------------
+SERIALIZZAZIONE DEL PROOFGRAPH
+------------------------------------------------------------------------------------
+"""
+
+# Formato binario di un'immagine del ProofGraph (vedi saveProofGraph()). Tutti i valori sono little-endian,
+# i riferimenti ad altri record sono indici interi (IMAGE_NO_INDEX o -1 in assenza di riferimento)
+IMAGE_MAGIC = b'DARTPG02'
+# magic, modalità di propagazione, numero di indirizzi, espressioni, archi, path, soluzioni e collegamenti scartati
+IMAGE_HEADER = struct.Struct('<8sB3xIIIIII')
+# indirizzo in forma esadecimale con checksum, privo del prefisso 0x
+IMAGE_ADDRESS = struct.Struct('<40s')
+# tipo, identificativo, indirizzo e rolename A, indirizzo e rolename B, flag
+IMAGE_EXPRESSION = struct.Struct('<B32sI2sI2sB')
+# nodo sorgente, nodo destinazione, peso, supportSolution, signedPath, 1 se l'arco è tra gli archi uscenti del nodo sorgente
+IMAGE_EDGE = struct.Struct('<IIdiIB')
+# arco (path di un singolo arco), path concatenati left e right, numero di archi
+IMAGE_PATH = struct.Struct('<iiiI')
+# membro, valore di fiducia, path, reqStackSize, proofLength, hops
+IMAGE_SOLUTION = struct.Struct('<IdiIII')
+# ruolo linkato, nodo LIExpression del LinkingMonitor, soluzione
+IMAGE_MISSING_LINK = struct.Struct('<III')
+IMAGE_INDEX = struct.Struct('<I')
+IMAGE_NO_INDEX = 0xFFFFFFFF
+
+IMAGE_EXPR_TYPES = (SMExpression, SIExpression, LIExpression, IIExpression)
+IMAGE_PROPAGATIONS = (RECURSIVE_PROPAGATION, PRIORITY_PROPAGATION)
+
+# Flag delle espressioni dell'immagine
+IMAGE_NODE = 1
+IMAGE_EXPANDED = 2
+IMAGE_EXISTENCE_KNOWN = 4
+IMAGE_EXISTS = 8
+
+
+def saveProofGraph(proofGraph, path):
+    """
+    Salva il ProofGraph fornito, comprese le soluzioni dei nodi, nel file path in un formato binario compatto,
+    ricaricabile tramite loadProofGraph() o consultabile in sola lettura tramite ProofGraphImage.
+
+    Le espressioni sono memorizzate, ordinate per identificativo, come record di lunghezza fissa contenenti tipo,
+    identificativo e campi (questi ultimi come indici in una tabella di indirizzi); archi, soluzioni e ProofPath
+    come record di indici interi. I ProofPath condivisi tra più soluzioni sono memorizzati una sola volta.
+    Possono essere salvati solamente i grafi di ricerche esaustive con WEIGHT_OBJECTIVE giunti ad un punto fisso
+    """
+    if proofGraph.objective != WEIGHT_OBJECTIVE or proofGraph.boundsTracking:
+        raise ValueError("only exhaustive searches with objective " + WEIGHT_OBJECTIVE + " can be saved")
+    if (len(proofGraph.queue) != 0 or len(proofGraph.solutionsHeap) != 0 or proofGraph.hasPendingLinks()
+            or proofGraph.hasPendingJoins()):
+        raise ValueError("the proof graph has not reached a fixpoint")
+
+    # Sono memorizzati, oltre agli archi uscenti dei nodi, gli archi sostituiti ancora attraversati dal path di qualche soluzione
+    solutions, solutionIndexes = [], {}
+    edges, edgeIndexes = [], {}
+    paths, pathIndexes = [], {}
+    pendingSolutions = []
+
+    def solutionIndex(solution):
+        if id(solution) not in solutionIndexes:
+            solutionIndexes[id(solution)] = len(solutions)
+            solutions.append(solution)
+            pendingSolutions.append(solution)
+        return solutionIndexes[id(solution)]
+
+    def edgeIndex(edge):
+        if id(edge) not in edgeIndexes:
+            edgeIndexes[id(edge)] = len(edges)
+            edges.append(edge)
+            if edge.supportSolution is not None:
+                solutionIndex(edge.supportSolution)
+            pathIndex(edge.signedPath)
+        return edgeIndexes[id(edge)]
+
+    def pathIndex(proofPath):
+        # I path sono memorizzati in ordine posticipato, così che ogni path segua i path da esso concatenati
+        if proofPath.length == 0:
+            return -1
+        stack = [(proofPath, False)]
+        while len(stack) != 0:
+            (currPath, visited) = stack.pop()
+            if id(currPath) in pathIndexes:
+                continue
+            if currPath.edge is None and not visited:
+                stack.append((currPath, True))
+                stack.append((currPath.right, False))
+                stack.append((currPath.left, False))
+                continue
+            pathIndexes[id(currPath)] = len(paths)
+            paths.append(currPath)
+            if currPath.edge is not None:
+                edgeIndex(currPath.edge)
+        return pathIndexes[id(proofPath)]
+
+    for node in proofGraph.nodes.values():
+        for solution in node.solutions.values():
+            solutionIndex(solution)
+        for edge in node.outEdges.values():
+            edgeIndex(edge)
+    for missingLinks in proofGraph.missingLinks.values():
+        for (_, solution) in missingLinks:
+            solutionIndex(solution)
+    while len(pendingSolutions) != 0:
+        pathIndex(pendingSolutions.pop().path)
+
+    exprs = sorted(proofGraph.nodes.keys() | proofGraph.missingLinks.keys() | proofGraph.existence.keys(), key=lambda expr: bytes(expr.id))
+    exprIndexes = {expr: i for i, expr in enumerate(exprs)}
+    addresses = list(dict.fromkeys([tuple(expr)[0] for expr in exprs] + [expr.principalB for expr in exprs if isinstance(expr, IIExpression)]
+                                   + [solution.member for solution in solutions]))
+    addressIndexes = {address: i for i, address in enumerate(addresses)}
+
+    missingLinks = [(exprIndexes[linkedRole], exprIndexes[monitor.destNode.expr], solutionIndexes[id(solution)])
+                    for linkedRole, links in proofGraph.missingLinks.items() for (monitor, solution) in links]
+
+    data = [IMAGE_HEADER.pack(IMAGE_MAGIC, IMAGE_PROPAGATIONS.index(proofGraph.propagation), len(addresses), len(exprs),
+                              len(edges), len(paths), len(solutions), len(missingLinks))]
+    data += [IMAGE_ADDRESS.pack(address[2:].encode('ascii')) for address in addresses]
+    for expr in exprs:
+        fields = tuple(expr)
+        node = proofGraph.nodes.get(expr)
+        flags = 0 if node is None else IMAGE_NODE | (IMAGE_EXPANDED if node.expanded else 0)
+        if expr in proofGraph.existence:
+            flags |= IMAGE_EXISTENCE_KNOWN | (IMAGE_EXISTS if proofGraph.existence[expr] else 0)
+        data.append(IMAGE_EXPRESSION.pack(
+            IMAGE_EXPR_TYPES.index(type(expr)), bytes(expr.id),
+            addressIndexes[fields[0]], bytes(HexBytes(fields[1])) if len(fields) > 1 else b'\x00\x00',
+            addressIndexes[fields[2]] if len(fields) > 3 else IMAGE_NO_INDEX,
+            bytes(HexBytes(fields[-1])) if len(fields) > 2 else b'\x00\x00', flags))
+    for edge in edges:
+        data.append(IMAGE_EDGE.pack(
+            exprIndexes[edge.fromNode.expr], exprIndexes[edge.toNode.expr], edge.weight,
+            -1 if edge.supportSolution is None else solutionIndexes[id(edge.supportSolution)],
+            pathIndexes[id(edge.signedPath)], edge.fromNode.outEdges.get(edge.toNode) is edge))
+    for proofPath in paths:
+        if proofPath.edge is not None:
+            data.append(IMAGE_PATH.pack(edgeIndexes[id(proofPath.edge)], -1, -1, 1))
+        else:
+            data.append(IMAGE_PATH.pack(-1, pathIndexes[id(proofPath.left)], pathIndexes[id(proofPath.right)], proofPath.length))
+    for solution in solutions:
+        data.append(IMAGE_SOLUTION.pack(addressIndexes[solution.member], solution.weight,
+                                        -1 if solution.path.length == 0 else pathIndexes[id(solution.path)],
+                                        solution.reqStackSize, solution.proofLength, solution.hops))
+
+    # Soluzioni di ciascuna espressione, come sequenza di offset seguita dalla sequenza degli indici delle soluzioni
+    nodeSolutions = [[solutionIndexes[id(solution)] for solution in proofGraph.nodes[expr].solutions.values()]
+                     if expr in proofGraph.nodes else [] for expr in exprs]
+    offset = 0
+    for indexes in [[]] + nodeSolutions:
+        offset += len(indexes)
+        data.append(IMAGE_INDEX.pack(offset))
+    data += [IMAGE_INDEX.pack(index) for indexes in nodeSolutions for index in indexes]
+    data += [IMAGE_MISSING_LINK.pack(*missingLink) for missingLink in missingLinks]
+
+    with open(path, 'wb') as f:
+        f.write(b''.join(data))
+
+
+class ProofGraphImage:
+    """
+    Accesso in sola lettura ad un'immagine del ProofGraph prodotta da saveProofGraph(), mappata in memoria.
+
+    I record sono decodificati solamente al momento della richiesta: più processi possono dunque consultare
+    le soluzioni dei ruoli di un medesimo file condividendone un'unica copia in memoria, senza ricostruire il grafo.
+    Il ProofGraph completo è ricostruibile tramite toProofGraph()
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, propagation, self.addressesCount, self.exprsCount, self.edgesCount, self.pathsCount,
+         self.solutionsCount, self.missingLinksCount) = IMAGE_HEADER.unpack_from(self.buffer, 0)
+        if magic != IMAGE_MAGIC:
+            self.buffer.close()
+            raise ValueError("not a proof graph image: " + str(path))
+        self.propagation = IMAGE_PROPAGATIONS[propagation]
+
+        self.addressesOffset = IMAGE_HEADER.size
+        self.exprsOffset = self.addressesOffset + self.addressesCount * IMAGE_ADDRESS.size
+        self.edgesOffset = self.exprsOffset + self.exprsCount * IMAGE_EXPRESSION.size
+        self.pathsOffset = self.edgesOffset + self.edgesCount * IMAGE_EDGE.size
+        self.solutionsOffset = self.pathsOffset + self.pathsCount * IMAGE_PATH.size
+        self.nodeSolutionsOffset = self.solutionsOffset + self.solutionsCount * IMAGE_SOLUTION.size
+        self.solutionIndexesOffset = self.nodeSolutionsOffset + (self.exprsCount + 1) * IMAGE_INDEX.size
+        self.missingLinksOffset = self.solutionIndexesOffset + self.index(self.exprsCount) * IMAGE_INDEX.size
+
+    def close(self):
+        self.buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def index(self, i):
+        # Restituisce l'offset i-esimo della sequenza delle soluzioni delle espressioni
+        return IMAGE_INDEX.unpack_from(self.buffer, self.nodeSolutionsOffset + i * IMAGE_INDEX.size)[0]
+
+    def address(self, i):
+        return '0x' + IMAGE_ADDRESS.unpack_from(self.buffer, self.addressesOffset + i * IMAGE_ADDRESS.size)[0].decode('ascii')
+
+    def exprRecord(self, i):
+        return IMAGE_EXPRESSION.unpack_from(self.buffer, self.exprsOffset + i * IMAGE_EXPRESSION.size)
+
+    def expression(self, i):
+        """
+        Restituisce l'i-esima espressione dell'immagine, senza ricalcolarne l'identificativo
+        """
+        (exprType, exprId, addrA, roleA, addrB, roleB, _) = self.exprRecord(i)
+        exprType = IMAGE_EXPR_TYPES[exprType]
+        if exprType is SMExpression:
+            fields = (self.address(addrA),)
+        elif exprType is SIExpression:
+            fields = (self.address(addrA), Web3.toHex(roleA))
+        elif exprType is LIExpression:
+            fields = (self.address(addrA), Web3.toHex(roleA), Web3.toHex(roleB))
+        else:
+            fields = (self.address(addrA), Web3.toHex(roleA), self.address(addrB), Web3.toHex(roleB))
+        expr = object.__new__(exprType)
+        for name, value in zip(exprType.__slots__, fields):
+            setattr(expr, name, value)
+        expr.setId(HexBytes(exprId))
+        return expr
+
+    def exprIndex(self, expr):
+        """
+        Restituisce l'indice dell'espressione expr nell'immagine, o None se assente, tramite ricerca binaria
+        """
+        exprId = bytes(expr.id)
+        low, high = 0, self.exprsCount
+        while low < high:
+            middle = (low + high) // 2
+            offset = self.exprsOffset + middle * IMAGE_EXPRESSION.size + 1
+            middleId = self.buffer[offset:offset+32]
+            if middleId < exprId:
+                low = middle + 1
+            elif middleId > exprId:
+                high = middle
+            else:
+                return middle
+        return None
+
+    def solutions(self, role):
+        """
+        Restituisce l'insieme delle soluzioni del ruolo role:SIExpression memorizzate nell'immagine,
+        nella forma di SolutionSummary, o None se il ruolo non è un nodo del grafo
+        """
+        i = self.exprIndex(role)
+        if i is None or not self.exprRecord(i)[6] & IMAGE_NODE:
+            return None
+        result = {}
+        for j in range(self.index(i), self.index(i + 1)):
+            solutionIndex = IMAGE_INDEX.unpack_from(self.buffer, self.solutionIndexesOffset + j * IMAGE_INDEX.size)[0]
+            (member, weight, path, reqStackSize, _, _) = IMAGE_SOLUTION.unpack_from(self.buffer, self.solutionsOffset + solutionIndex * IMAGE_SOLUTION.size)
+            member = self.address(member)
+            result[member] = SolutionSummary(member, weight, self.proof(path), reqStackSize)
+        return result
+
+    def proof(self, path):
+        # Costruisce la dimostrazione on-chain corrispondente al path di indice path (vedi compileProof())
+        proof = []
+        stack = [path] if path != -1 else []
+        while len(stack) != 0:
+            (edge, left, right, _) = IMAGE_PATH.unpack_from(self.buffer, self.pathsOffset + stack.pop() * IMAGE_PATH.size)
+            if edge == -1:
+                stack.append(right)
+                stack.append(left)
+                continue
+            (fromNode, toNode, _, _, _, _) = IMAGE_EDGE.unpack_from(self.buffer, self.edgesOffset + edge * IMAGE_EDGE.size)
+            toRecord = self.exprRecord(toNode)
+            if IMAGE_EXPR_TYPES[toRecord[0]] is not LIExpression:
+                proof.append(toRecord[1])
+                proof.append(self.exprRecord(fromNode)[1])
+        return tuple(proof)
+
+    def toProofGraph(self, dart=None):
+        """
+        Ricostruisce il ProofGraph memorizzato nell'immagine, comprensivo di archi, soluzioni e monitor,
+        le cui eventuali letture successive sono eseguite sulla sorgente dart
+        """
+        proofGraph = ProofGraph(dart, self.propagation)
+        exprs = [self.expression(i) for i in range(self.exprsCount)]
+        nodes = [None] * self.exprsCount
+        for i, expr in enumerate(exprs):
+            flags = self.exprRecord(i)[6]
+            if flags & IMAGE_NODE:
+                nodes[i] = ProofNode(expr, proofGraph)
+                nodes[i].expanded = bool(flags & IMAGE_EXPANDED)
+                proofGraph.nodes[expr] = nodes[i]
+            if flags & IMAGE_EXISTENCE_KNOWN:
+                proofGraph.existence[expr] = bool(flags & IMAGE_EXISTS)
+
+        # Archi e path si riferiscono reciprocamente: gli archi sono dunque creati vuoti e completati in seguito
+        edges = [object.__new__(ProofEdge) for _ in range(self.edgesCount)]
+        paths = []
+        for i in range(self.pathsCount):
+            (edge, left, right, _) = IMAGE_PATH.unpack_from(self.buffer, self.pathsOffset + i * IMAGE_PATH.size)
+            paths.append(ProofPath(edges[edge]) if edge != -1 else ProofPath(left=paths[left], right=paths[right]))
+        addresses = [self.address(i) for i in range(self.addressesCount)]
+        solutions = []
+        for i in range(self.solutionsCount):
+            (member, weight, path, reqStackSize, proofLength, hops) = IMAGE_SOLUTION.unpack_from(self.buffer, self.solutionsOffset + i * IMAGE_SOLUTION.size)
+            solutions.append(Solution(addresses[member], weight, EMPTY_PATH if path == -1 else paths[path], reqStackSize, proofLength, hops))
+
+        for i, edge in enumerate(edges):
+            (fromNode, toNode, weight, supportSolution, signedPath, live) = IMAGE_EDGE.unpack_from(self.buffer, self.edgesOffset + i * IMAGE_EDGE.size)
+            edge.fromNode = nodes[fromNode]
+            edge.toNode = nodes[toNode]
+            edge.weight = weight
+            edge.supportSolution = None if supportSolution == -1 else solutions[supportSolution]
+            edge.signedPath = paths[signedPath]
+            edge.signedProofLength = (0 if isinstance(edge.toNode.expr, LIExpression) else 1) + (
+                0 if edge.supportSolution is None else edge.supportSolution.proofLength)
+            if edge.supportSolution is None:
+                edge.signedHops = 0 if isinstance(edge.fromNode.expr, LIExpression) else 1
+            else:
+                edge.signedHops = edge.supportSolution.hops
+            if live:
+                edge.fromNode.outEdges[edge.toNode] = edge
+
+        for i, node in enumerate(nodes):
+            if node is not None:
+                for j in range(self.index(i), self.index(i + 1)):
+                    solution = solutions[IMAGE_INDEX.unpack_from(self.buffer, self.solutionIndexesOffset + j * IMAGE_INDEX.size)[0]]
+                    node.solutions[solution.member] = solution
+                node.solutionsState = len(node.solutions)
+
+        # I monitor sono ricreati senza notifiche, con le soluzioni già note dei nodi monitorati
+        linkingMonitors = {}
+        for node in nodes:
+            if node is None or not node.expanded:
+                continue
+            if isinstance(node.expr, LIExpression):
+                linkingMonitors[node] = LinkingMonitor(node, proofGraph, dart)
+                proofGraph.nodes[SIExpression(node.expr.principal, node.expr.roleNameA)].monitors.append(linkingMonitors[node])
+            elif isinstance(node.expr, IIExpression):
+                # Come da IntersectionMonitor.notify(), le soluzioni di un ruolo intersecato con sé stesso sono memorizzate in solutionsA
+                intersectionMonitor = IntersectionMonitor(node, proofGraph, dart)
+                intersectionMonitor.solutionsA.update(proofGraph.nodes[intersectionMonitor.roleA].solutions)
+                if intersectionMonitor.roleB != intersectionMonitor.roleA:
+                    intersectionMonitor.solutionsB.update(proofGraph.nodes[intersectionMonitor.roleB].solutions)
+                proofGraph.nodes[intersectionMonitor.roleA].monitors.append(intersectionMonitor)
+                proofGraph.nodes[intersectionMonitor.roleB].monitors.append(intersectionMonitor)
+
+        for i in range(self.missingLinksCount):
+            (linkedRole, destNode, solution) = IMAGE_MISSING_LINK.unpack_from(self.buffer, self.missingLinksOffset + i * IMAGE_MISSING_LINK.size)
+            proofGraph.missingLinks.setdefault(exprs[linkedRole], []).append((linkingMonitors[nodes[destNode]], solutions[solution]))
+        return proofGraph
+
+
+def loadProofGraph(path, dart=None):
+    """
+    Ricostruisce il ProofGraph salvato nel file path tramite saveProofGraph(),
+    le cui eventuali letture successive sono eseguite sulla sorgente dart
+    """
+    with ProofGraphImage(path) as image:
+        return image.toProofGraph(dart)
+
+
+"""
+------------------------------------------------------------------------------------
+MIRROR LOCALE
+------------------------------------------------------------------------------------
+"""
+
+# Funzioni del contratto DART che alterano le credenziali del ruolo individuato dal mittente e dal primo argomento
+DART_WRITE_FUNCTIONS = {
+    'newRole',
+    'addSimpleMember', 'removeSimpleMember', 'updateSimpleMember',
+    'addSimpleInclusion', 'removeSimpleInclusion', 'updateSimpleInclusion',
+    'addLinkedInclusion', 'removeLinkedInclusion', 'updateLinkedInclusion',
+    'addIntersectionInclusion', 'removeIntersectionInclusion', 'updateIntersectionInclusion'
+}
+
+class DARTMirror(DARTReader):
+    """
+    Replica locale e persistente (su database SQLite) delle credenziali registrate su un contratto DART on-chain.
+
+    La replica è allineata esplicitamente tramite il metodo sync(), il quale esamina unicamente i blocchi
+    successivi all'ultimo blocco già sincronizzato e rilegge dal contratto le sole credenziali dei ruoli
+    interessati da eventi CredentialChanged o, per i contratti che non li emettono, da transazioni verso il contratto stesso.
+    Le operazioni di lettura, e dunque il backward search algorithm, sono eseguite interamente sulla replica locale
+    """
+
+    def __init__(self, dart, path=':memory:', fromBlock=0):
+        """
+        Crea, o riapre se già esistente, una replica locale delle credenziali di un contratto DART on-chain
+
+        :param dart: istanza DART di interfacciamento al contratto on-chain da replicare
+        :param path: path del database SQLite in cui memorizzare la replica (default: database in memoria)
+        :param fromBlock: blocco a partire dal quale esaminare la blockchain alla prima sincronizzazione,
+                          tipicamente il blocco di deployment del contratto
+        """
+        self.dart = dart
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value);
+            CREATE TABLE IF NOT EXISTS roles (id BLOB PRIMARY KEY, principal TEXT, roleName TEXT);
+            CREATE TABLE IF NOT EXISTS members (role BLOB, idx INTEGER, member TEXT, weight INTEGER, PRIMARY KEY (role, idx));
+            CREATE TABLE IF NOT EXISTS inclusions (role BLOB, idx INTEGER, expr BLOB, addrA TEXT, addrB TEXT, roleA BLOB, roleB BLOB,
+                                                   weight INTEGER, PRIMARY KEY (role, idx));
+            CREATE INDEX IF NOT EXISTS inclusionsExpr ON inclusions (expr);
+        """)
+        self.db.execute("INSERT OR IGNORE INTO meta VALUES ('contract', ?)", (dart.contract.address,))
+        self.db.execute("INSERT OR IGNORE INTO meta VALUES ('lastBlock', ?)", (fromBlock - 1,))
+        self.db.commit()
+        if self.db.execute("SELECT value FROM meta WHERE key = 'contract'").fetchone()[0] != dart.contract.address:
+            raise ValueError("the mirror database at " + path + " belongs to a different DART contract")
+
+    @property
+    def lastBlock(self):
+        """
+        Numero dell'ultimo blocco incluso nella replica locale
+        """
+        return self.db.execute("SELECT value FROM meta WHERE key = 'lastBlock'").fetchone()[0]
+
+    def sync(self, toBlock=None, batchSize=DEFAULT_BATCH_SIZE, useLogs=True):
+        """
+        Allinea la replica locale allo stato del contratto on-chain fino al blocco toBlock (default: ultimo blocco).
+        Se useLogs è True sono letti, tramite eth_getLogs, gli eventi CredentialChanged emessi nei blocchi non ancora
+        sincronizzati; altrimenti, per i contratti privi di tali eventi, sono esaminate tutte le transazioni verso il contratto
+        contenute in tali blocchi. Le credenziali dei ruoli interessati sono quindi rilette dal contratto tramite letture aggregate.
+        L'esame delle transazioni presenta due limiti: richiede una lettura getBlock, con le transazioni complete,
+        per ciascun blocco successivo all'ultima sincronizzazione, ed individua le sole scritture eseguite da transazioni
+        dirette al contratto, ignorando quelle eseguite tramite chiamate interne da parte di altri contratti,
+        le cui credenziali non sono dunque aggiornate nella replica.
+        Restituisce l'insieme dei ruoli SIExpression aggiornati
+        """
+        w3 = self.dart.w3
+        contract = self.dart.contract
+        if toBlock is None:
+            toBlock = w3.eth.blockNumber
+
+        changedRoles = set()
+        if useLogs:
+            if toBlock > self.lastBlock:
+                changedRoles = {delta.credential.role for delta in self.dart.getCredentialChanges(self.lastBlock + 1, toBlock)}
+        else:
+            for blockNumber in range(self.lastBlock + 1, toBlock + 1):
+                block = w3.eth.getBlock(blockNumber, full_transactions=True)
+                for tx in block.transactions:
+                    if tx['to'] != contract.address:
+                        continue
+                    (function, args) = contract.decode_function_input(tx['input'])
+                    if function.fn_name in DART_WRITE_FUNCTIONS:
+                        # Ogni funzione di scrittura opera sulle credenziali di un ruolo locale del mittente
+                        roleName = args['_rolename'] if function.fn_name == 'newRole' else args['_assignedRolename']
+                        changedRoles.add(SIExpression(tx['from'], Web3.toHex(roleName)))
+
+        # Rileggi le credenziali dei ruoli interessati sul blocco toBlock
+        dart = self.dart.atBlock(toBlock)
+        roles = list(changedRoles)
+        for i in range(0, len(roles), batchSize):
+            batch = roles[i:i+batchSize]
+            for role, members, inclusions in zip(batch, dart.getMembers(batch), dart.getInclusions(batch)):
+                self.storeRole(role, dart.exprExists(role), members, inclusions)
+
+        self.db.execute("UPDATE meta SET value = ? WHERE key = 'lastBlock'", (toBlock,))
+        self.db.commit()
+        return changedRoles
+
+    def storeRole(self, role, exists, members, inclusions):
+        # Sostituisci nella replica le credenziali aventi role come assigned role con quelle fornite
+        self.db.execute("DELETE FROM roles WHERE id = ?", (bytes(role.id),))
+        self.db.execute("DELETE FROM members WHERE role = ?", (bytes(role.id),))
+        self.db.execute("DELETE FROM inclusions WHERE role = ?", (bytes(role.id),))
+        if exists:
+            self.db.execute("INSERT INTO roles VALUES (?, ?, ?)", (bytes(role.id), role.principal, role.roleName))
+        self.db.executemany("INSERT INTO members VALUES (?, ?, ?, ?)",
+                            [(bytes(role.id), idx, memberExpr.member, weight) for idx, (memberExpr, weight) in enumerate(members)])
+        self.db.executemany("INSERT INTO inclusions VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                            [(bytes(role.id), idx, bytes(inclExpr.id), *self.exprFields(inclExpr), weight) for idx, (inclExpr, weight) in enumerate(inclusions)])
+
+    def exprFields(self, expr):
+        # Restituisce i campi (addrA, addrB, roleA, roleB) con cui il contratto memorizza l'espressione expr
+        if isinstance(expr, IIExpression):
+            return (expr.principalA, expr.principalB, bytes(HexBytes(expr.roleNameA)), bytes(HexBytes(expr.roleNameB)))
+        elif isinstance(expr, LIExpression):
+            return (expr.principal, NULL_PRINCIPAL, bytes(HexBytes(expr.roleNameA)), bytes(HexBytes(expr.roleNameB)))
+        else:
+            return (expr.principal, NULL_PRINCIPAL, bytes(HexBytes(expr.roleName)), bytes(HexBytes(NULL_ROLENAME)))
+
+    def exprExists(self, expr):
+        """
+        Restituisce True se l'espressione expr:Expression fornita risulta parte di almeno una credenziale
+        presente nella replica locale
+        """
+        if isinstance(expr, SIExpression):
+            return self.db.execute("SELECT 1 FROM roles WHERE id = ?", (bytes(expr.id),)).fetchone() is not None
+        return self.db.execute("SELECT 1 FROM inclusions WHERE expr = ?", (bytes(expr.id),)).fetchone() is not None
+
+    def getMembersCount(self, role):
+        return self.db.execute("SELECT COUNT(*) FROM members WHERE role = ?", (bytes(role.id),)).fetchone()[0]
+
+    def getMember(self, role, memberIndex):
+        (member, weight) = self.db.execute("SELECT member, weight FROM members WHERE role = ? AND idx = ?",
+                                           (bytes(role.id), memberIndex)).fetchone()
+        return (SMExpression(member), weight)
+
+    def getMemberWeight(self, role, member):
+        res = self.db.execute("SELECT weight FROM members WHERE role = ? AND member = ?", (bytes(role.id), member)).fetchone()
+        return None if res is None else res[0]
+
+    def getInclusionsCount(self, role):
+        return self.db.execute("SELECT COUNT(*) FROM inclusions WHERE role = ?", (bytes(role.id),)).fetchone()[0]
+
+    def getInclusion(self, role, inclusionIndex):
+        (addrA, addrB, roleA, roleB, weight) = self.db.execute("SELECT addrA, addrB, roleA, roleB, weight FROM inclusions WHERE role = ? AND idx = ?",
+                                                               (bytes(role.id), inclusionIndex)).fetchone()
+        return (inclusionExpr(addrA, addrB, roleA, roleB), weight)
+
+    def getMembers(self, roles):
+        return [[(SMExpression(member), weight) for (member, weight)
+                    in self.db.execute("SELECT member, weight FROM members WHERE role = ? ORDER BY idx", (bytes(role.id),))]
+                for role in roles]
+
+    def getInclusions(self, roles):
+        return [[(inclusionExpr(addrA, addrB, roleA, roleB), weight) for (addrA, addrB, roleA, roleB, weight)
+                    in self.db.execute("SELECT addrA, addrB, roleA, roleB, weight FROM inclusions WHERE role = ? ORDER BY idx", (bytes(role.id),))]
+                for role in roles]
+
+
+"""
+------------------------------------------------------------------------------------
+BACKEND LOCALE
+------------------------------------------------------------------------------------
+"""
+
+# Identificativi di ciascun tipo di role expression memorizzata nell'exprPool, come definiti dal contratto on-chain
+EXPR_NC = 0
+EXPR_SI = 1
+EXPR_LI = 2
+EXPR_II = 3
+
+# Messaggi d'errore del contratto on-chain per le operazioni su credenziali di inclusione di tipo errato
+INCLUSION_TYPE_ERRORS = {
+    EXPR_SI: "not a simple inclusion",
+    EXPR_LI: "not a linked inclusion",
+    EXPR_II: "not an intersection inclusion"
+}
+
+class WeightedSet:
+    """
+    Insieme di elementi pesati con la stessa semantica delle librerie on-chain WAddressSet e WBytes32Set:
+    gli elementi sono mantenuti in una lista, indicizzata da una mappa elemento -> posizione (a partire da 1),
+    e la rimozione di un elemento vi sposta l'ultimo elemento della lista
+    """
+
+    __slots__ = ('map', 'list')
+
+    def __init__(self):
+        self.map = {}
+        self.list = []
+
+    def insert(self, data, weight):
+        pointer = self.map.get(data, 0)
+        if pointer != 0:
+            if self.list[pointer - 1][1] < weight:
+                self.list[pointer - 1] = (data, weight)
+                return True
+            else:
+                return False
+        self.list.append((data, weight))
+        self.map[data] = len(self.list)
+        return True
+
+    def update(self, data, weight):
+        pointer = self.map.get(data, 0)
+        if pointer == 0:
+            raise ContractLogicError("execution reverted: entry not found")
+        self.list[pointer - 1] = (data, weight)
+
+    def remove(self, data):
+        pointerToRemove = self.map.get(data, 0)
+        if pointerToRemove == 0:
+            raise ContractLogicError("execution reverted: entry not found")
+        lastEntry = self.list[-1]
+        if pointerToRemove != len(self.list):
+            self.list[pointerToRemove - 1] = lastEntry
+            self.map[lastEntry[0]] = pointerToRemove
+        self.list.pop()
+        del self.map[data]
+
+    def size(self):
+        return len(self.list)
+
+    def getPointer(self, data):
+        return self.map.get(data, 0)
+
+    def get(self, index):
+        return self.list[index]
+
+
+class ExprRecord:
+    """
+    Record di dati rappresentante una role expression memorizzata nell'exprPool del contratto on-chain
+    """
+
+    __slots__ = ('exprType', 'refCount', 'addrA', 'roleA', 'addrB', 'roleB', 'inclusions')
+
+    def __init__(self):
+        self.exprType = EXPR_NC
+        self.refCount = 0
+        self.addrA = NULL_PRINCIPAL
+        self.roleA = HexBytes(NULL_ROLENAME)
+        self.addrB = NULL_PRINCIPAL
+        self.roleB = HexBytes(NULL_ROLENAME)
+        self.inclusions = WeightedSet()
+
+
+class LocalDART(DARTReader):
+    """
+    Implementazione in memoria del contratto DART, utilizzabile in luogo del contratto on-chain per simulazioni
+    e stime di capacità senza alcuna blockchain.
+
+    Le credenziali sono memorizzate con la stessa organizzazione del contratto (exprPool e members, indicizzati
+    dagli identificativi calcolati come da packExpr) e le operazioni di scrittura ne replicano i controlli,
+    sollevando ContractLogicError con gli stessi messaggi d'errore. Come per DART, il mittente di ciascuna
+    operazione di scrittura è indicato dal campo 'from' del parametro tx
+    """
+
+    def __init__(self, defaultAccount=NULL_PRINCIPAL):
+        """
+        Crea un'istanza priva di ruoli e credenziali
+
+        :param defaultAccount: mittente delle operazioni di scrittura il cui parametro tx non specifica il campo 'from'
+        """
+        self.defaultAccount = defaultAccount
+        self.exprPool = {}
+        self.members = {}
+
+    def getRecord(self, exprId):
+        # Restituisce il record dell'exprPool associato all'identificativo fornito, creandolo se assente
+        if exprId not in self.exprPool:
+            self.exprPool[exprId] = ExprRecord()
+        return self.exprPool[exprId]
+
+    def getLocalRole(self, assignedRolename, tx):
+        # Restituisce il record del ruolo locale del mittente, verificandone l'esistenza
+        localRole = self.exprPool.get(SIExpression(self.sender(tx), assignedRolename).id)
+        if localRole is None or localRole.exprType != EXPR_SI:
+            raise ContractLogicError("execution reverted: local role does not exists")
+        return localRole
+
+    def sender(self, tx):
+        return Web3.toChecksumAddress(tx.get('from', self.defaultAccount))
+
+    def roleExists(self, principal, roleName):
+        record = self.exprPool.get(SIExpression(principal, roleName).id)
+        return record is not None and record.exprType == EXPR_SI
+
+    def removeInclusion(self, assignedRolename, expression, exprType, tx):
+        # Rimuove una credenziale di inclusione, rilasciando l'espressione se non più referenziata
+        localRole = self.getLocalRole(assignedRolename, tx)
+        expr = self.exprPool.get(expression.id)
+        if expr is None or expr.exprType != exprType:
+            raise ContractLogicError("execution reverted: " + INCLUSION_TYPE_ERRORS[exprType])
+        localRole.inclusions.remove(expression.id)
+        if exprType != EXPR_SI:
+            expr.refCount -= 1
+            if expr.refCount == 0:
+                del self.exprPool[expression.id]
+
+    def updateInclusion(self, assignedRolename, expression, exprType, newWeight, tx):
+        # Aggiorna il valore di fiducia di una credenziale di inclusione
+        localRole = self.getLocalRole(assignedRolename, tx)
+        expr = self.exprPool.get(expression.id)
+        if expr is None or expr.exprType != exprType:
+            raise ContractLogicError("execution reverted: " + INCLUSION_TYPE_ERRORS[exprType])
+        localRole.inclusions.update(expression.id, newWeight)
+
+    def newRole(self, roleName, tx={}):
+        if HexBytes(roleName) == HexBytes(NULL_ROLENAME):
+            raise ContractLogicError("execution reverted: invalid rolename")
+        sender = self.sender(tx)
+        expr = self.getRecord(SIExpression(sender, roleName).id)
+        if expr.exprType != EXPR_NC:
+            raise ContractLogicError("execution reverted: local role already exists")
+        expr.exprType = EXPR_SI
+        expr.addrA = sender
+        expr.roleA = HexBytes(roleName)
+
+    def addSimpleMember(self, assignedRolename, expression, weight, tx={}):
+        self.getLocalRole(assignedRolename, tx)
+        roleId = SIExpression(self.sender(tx), assignedRolename).id
+        self.members.setdefault(roleId, WeightedSet()).insert(Web3.toChecksumAddress(expression.member), weight)
+        return Credential(self.sender(tx), assignedRolename, expression, weight)
+
+    def addSimpleInclusion(self, assignedRolename, expression, weight, tx={}):
+        localRole = self.getLocalRole(assignedRolename, tx)
+        if not self.roleExists(expression.principal, expression.roleName):
+            raise ContractLogicError("execution reverted: remote role does not exists")
+        localRole.inclusions.insert(expression.id, weight)
+        return Credential(self.sender(tx), assignedRolename, expression, weight)
+
+    def addLinkedInclusion(self, assignedRolename, expression, weight, tx={}):
+        localRole = self.getLocalRole(assignedRolename, tx)
+        if not self.roleExists(expression.principal, expression.roleNameA):
+            raise ContractLogicError("execution reverted: remote role does not exists")
+        linkedExpr = self.getRecord(expression.id)
+        if linkedExpr.exprType == EXPR_NC:
+            linkedExpr.exprType = EXPR_LI
+            linkedExpr.addrA = Web3.toChecksumAddress(expression.principal)
+            linkedExpr.roleA = HexBytes(expression.roleNameA)
+            linkedExpr.roleB = HexBytes(expression.roleNameB)
+        linkedExpr.refCount += 1
+        localRole.inclusions.insert(expression.id, weight)
+        return Credential(self.sender(tx), assignedRolename, expression, weight)
+
+    def addIntersectionInclusion(self, assignedRolename, expression, weight, tx={}):
+        localRole = self.getLocalRole(assignedRolename, tx)
+        if not self.roleExists(expression.principalA, expression.roleNameA):
+            raise ContractLogicError("execution reverted: first remote role does not exists")
+        if not self.roleExists(expression.principalB, expression.roleNameB):
+            raise ContractLogicError("execution reverted: second remote role does not exists")
+        intersectionExpr = self.getRecord(expression.id)
+        if intersectionExpr.exprType == EXPR_NC:
+            # I campi di IIExpression sono già ordinati come da contratto on-chain
+            intersectionExpr.exprType = EXPR_II
+            intersectionExpr.addrA = Web3.toChecksumAddress(expression.principalA)
+            intersectionExpr.roleA = HexBytes(expression.roleNameA)
+            intersectionExpr.addrB = Web3.toChecksumAddress(expression.principalB)
+            intersectionExpr.roleB = HexBytes(expression.roleNameB)
+        intersectionExpr.refCount += 1
+        localRole.inclusions.insert(expression.id, weight)
+        return Credential(self.sender(tx), assignedRolename, expression, weight)
+
+    def removeSimpleMember(self, assignedRolename, expression, tx={}):
+        self.getLocalRole(assignedRolename, tx)
+        roleId = SIExpression(self.sender(tx), assignedRolename).id
+        self.members.setdefault(roleId, WeightedSet()).remove(Web3.toChecksumAddress(expression.member))
+        return Credential(self.sender(tx), assignedRolename, expression, None)
+
+    def updateSimpleMember(self, assignedRolename, expression, newWeight, tx={}):
+        self.getLocalRole(assignedRolename, tx)
+        roleId = SIExpression(self.sender(tx), assignedRolename).id
+        self.members.setdefault(roleId, WeightedSet()).update(Web3.toChecksumAddress(expression.member), newWeight)
+        return Credential(self.sender(tx), assignedRolename, expression, newWeight)
+
+    def removeSimpleInclusion(self, assignedRolename, expression, tx={}):
+        self.removeInclusion(assignedRolename, expression, EXPR_SI, tx)
+        return Credential(self.sender(tx), assignedRolename, expression, None)
+
+    def updateSimpleInclusion(self, assignedRolename, expression, newWeight, tx={}):
+        self.updateInclusion(assignedRolename, expression, EXPR_SI, newWeight, tx)
+        return Credential(self.sender(tx), assignedRolename, expression, newWeight)
+
+    def removeLinkedInclusion(self, assignedRolename, expression, tx={}):
+        self.removeInclusion(assignedRolename, expression, EXPR_LI, tx)
+        return Credential(self.sender(tx), assignedRolename, expression, None)
+
+    def updateLinkedInclusion(self, assignedRolename, expression, newWeight, tx={}):
+        self.updateInclusion(assignedRolename, expression, EXPR_LI, newWeight, tx)
+        return Credential(self.sender(tx), assignedRolename, expression, newWeight)
+
+    def removeIntersectionInclusion(self, assignedRolename, expression, tx={}):
+        self.removeInclusion(assignedRolename, expression, EXPR_II, tx)
+        return Credential(self.sender(tx), assignedRolename, expression, None)
+
+    def updateIntersectionInclusion(self, assignedRolename, expression, newWeight, tx={}):
+        self.updateInclusion(assignedRolename, expression, EXPR_II, newWeight, tx)
+        return Credential(self.sender(tx), assignedRolename, expression, newWeight)
+
+    def exprExists(self, expr):
+        record = self.exprPool.get(expr.id)
+        return record is not None and record.exprType != EXPR_NC
+
+    def getMembersCount(self, role):
+        return self.members[role.id].size() if role.id in self.members else 0
+
+    def getMember(self, role, memberIndex):
+        (member, weight) = self.members[role.id].get(memberIndex)
+        return (SMExpression(member), weight)
+
+    def getMemberWeight(self, role, member):
+        roleMembers = self.members.get(role.id)
+        pointer = 0 if roleMembers is None else roleMembers.getPointer(Web3.toChecksumAddress(member))
+        return None if pointer == 0 else roleMembers.get(pointer - 1)[1]
+
+    def getInclusionsCount(self, role):
+        return self.exprPool[role.id].inclusions.size() if role.id in self.exprPool else 0
+
+    def getInclusion(self, role, inclusionIndex):
+        (exprId, weight) = self.exprPool[role.id].inclusions.get(inclusionIndex)
+        expr = self.exprPool[exprId]
+        return (inclusionExpr(expr.addrA, expr.addrB, expr.roleA, expr.roleB), weight)
+
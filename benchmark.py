@@ -0,0 +1,252 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import tracemalloc
+from statistics import median
+from time import perf_counter, strftime
+from DART import *
+
+# -----------------------------------------------------
+
+parser = argparse.ArgumentParser(description='Esegui il benchmark del backward search algorithm sugli scenari del paper ICDCS, su backend locale LocalDART. Con i parametri di default l\'esecuzione richiede circa 6 minuti su un singolo core, dominati dallo scenario WoT attivo con 200 partecipanti.')
+parser.add_argument('--epapers', type=int, nargs='*',
+                        default=[100, 200, 400, 800],
+                        help="numeri di principal da registrare come studenti e membri EOrg nello scenario EPapers (default: 100 200 400 800)")
+parser.add_argument('--universities', type=int,
+                        default=10,
+                        help="numero di università su cui smistare gli studenti nello scenario EPapers (default: 10)")
+parser.add_argument('--wot', type=int, nargs='*',
+                        default=[25, 50, 100, 200],
+                        help="numeri di partecipanti al web of trust negli scenari WoT attivo e passivo (default: 25 50 100 200)")
+parser.add_argument('--repeat', type=int,
+                        default=3,
+                        help="numero di ripetizioni di ciascuna ricerca per la misura del tempo di esecuzione (default: 3)")
+parser.add_argument('--propagation', type=str,
+                        default=PRIORITY_PROPAGATION, choices=[RECURSIVE_PROPAGATION, PRIORITY_PROPAGATION],
+                        help=f"modalità di propagazione delle soluzioni; la propagazione ricorsiva può eccedere il limite di ricorsione "
+                             f"sugli scenari WoT più grandi (default: {PRIORITY_PROPAGATION})")
+parser.add_argument('--output', type=str,
+                        default='benchmark.json',
+                        help="path del file JSON in cui salvare i risultati (default: benchmark.json)")
+args = parser.parse_args()
+
+# -----------------------------------------------------
+
+class CountingDART(LocalDART):
+    """
+    LocalDART che conta le letture richieste dal backward search algorithm,
+    ciascuna corrispondente ad una chiamata RPC nel caso del contratto on-chain
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    def exprExists(self, expr):
+        self.reads += 1
+        return super().exprExists(expr)
+
+    def getMembersCount(self, role):
+        self.reads += 1
+        return super().getMembersCount(role)
+
+    def getMember(self, role, memberIndex):
+        self.reads += 1
+        return super().getMember(role, memberIndex)
+
+    def getMemberWeight(self, role, member):
+        self.reads += 1
+        return super().getMemberWeight(role, member)
+
+    def getInclusionsCount(self, role):
+        self.reads += 1
+        return super().getInclusionsCount(role)
+
+    def getInclusion(self, role, inclusionIndex):
+        self.reads += 1
+        return super().getInclusion(role, inclusionIndex)
+
+    def exprsExist(self, exprs):
+        # Le letture aggregate corrispondono ad una singola chiamata al contratto on-chain
+        self.reads += 1
+        return [LocalDART.exprExists(self, expr) for expr in exprs]
+
+    def getMembers(self, roles):
+        # Le letture aggregate corrispondono ad una singola chiamata al contratto on-chain
+        self.reads += 1
+        return [[LocalDART.getMember(self, role, i) for i in range(LocalDART.getMembersCount(self, role))] for role in roles]
+
+    def getInclusions(self, roles):
+        self.reads += 1
+        return [[LocalDART.getInclusion(self, role, i) for i in range(LocalDART.getInclusionsCount(self, role))] for role in roles]
+
+
+# Genera indirizzi deterministici per i principal degli scenari
+def principal(i):
+    return Web3.toChecksumAddress('0x' + format(i + 1, '040x'))
+
+RN = {
+    'canAccess': '0x000a',
+    'member': '0x000c',
+    'university': '0x000d',
+    'student': '0x000e',
+    'trust': '0x200a'
+}
+
+
+def epapersPolicy(nEligibles, nUniversities):
+    # Istanzia la policy del test scenario A (EPapers), come da test_epapers.py
+    d = CountingDART()
+    EPapers, EOrg, StateA = principal(0), principal(1), principal(2)
+    eligibles = [principal(3 + i) for i in range(nEligibles)]
+    universities = [principal(3 + nEligibles + i) for i in range(nUniversities)]
+
+    d.newRole(RN['canAccess'], {'from': EPapers})
+    d.newRole(RN['student'], {'from': EOrg})
+    d.newRole(RN['member'], {'from': EOrg})
+    d.newRole(RN['university'], {'from': EOrg})
+    d.newRole(RN['university'], {'from': StateA})
+    for uniAddr in universities:
+        d.newRole(RN['student'], {'from': uniAddr})
+    for idx, principalAddr in enumerate(eligibles):
+        d.addSimpleMember(RN['member'], SMExpression(principalAddr), 100, {'from': EOrg})
+        d.addSimpleMember(RN['student'], SMExpression(principalAddr), 100, {'from': universities[idx % nUniversities]})
+    for uniAddr in universities:
+        d.addSimpleMember(RN['university'], SMExpression(uniAddr), 100, {'from': StateA})
+    d.addSimpleInclusion(RN['university'], SIExpression(StateA, RN['university']), 100, {'from': EOrg})
+    d.addLinkedInclusion(RN['student'], LIExpression(EOrg, RN['university'], RN['student']), 100, {'from': EOrg})
+    d.addIntersectionInclusion(RN['canAccess'], IIExpression(EOrg, RN['student'], EOrg, RN['member']), 50, {'from': EPapers})
+    return d, SIExpression(EPapers, RN['canAccess'])
+
+
+def wotPolicy(nPartecipants, active):
+    # Istanzia la policy del test scenario B (web of trust), come da test_wot_active.py e test_wot_passive.py,
+    # restituendo il ruolo trust dell'ultimo partecipante
+    d = CountingDART()
+    accounts = [principal(i) for i in range(nPartecipants)]
+    d.newRole(RN['trust'], {'from': accounts[0]})
+    for i in range(1, nPartecipants):
+        d.newRole(RN['trust'], {'from': accounts[i]})
+        d.addLinkedInclusion(RN['trust'], LIExpression(accounts[i], RN['trust'], RN['trust']), 80, {'from': accounts[i]})
+        d.addSimpleMember(RN['trust'], SMExpression(accounts[i-1]), 100, {'from': accounts[i]})
+        if active:
+            d.addSimpleMember(RN['trust'], SMExpression(accounts[i]), 100, {'from': accounts[i-1]})
+    return d, SIExpression(accounts[-1], RN['trust'])
+
+
+def runBenchmark(scenario, size, measure, *measureArgs):
+    # Esegue la misura measure sulla policy dello scenario.
+    # Un errore durante la misura è registrato nel risultato dello scenario, così da non interrompere i successivi
+    try:
+        return measure(scenario, size, *measureArgs)
+    except Exception as e:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        return {
+            'scenario': scenario,
+            'size': size,
+            'error': f"{type(e).__name__}: {e}"
+        }
+
+
+def measureSearch(scenario, size, d, role):
+    # Esegue la ricerca sulla policy fornita, misurandone tempi, letture, memoria e dimensioni del ProofGraph
+    times = []
+    for _ in range(args.repeat):
+        start = perf_counter()
+        d.search(role, propagation=args.propagation)
+        times.append(perf_counter() - start)
+
+    tracemalloc.start()
+    d.reads = 0
+    session = d.searchSession(role, propagation=args.propagation)
+    (_, peakMemory) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    proofGraph = session.proofGraph
+    stackSizes = [solution.reqStackSize for solution in session.solutions.values()]
+    return {
+        'scenario': scenario,
+        'size': size,
+        'wallTimeMin': min(times),
+        'wallTimeMedian': median(times),
+        'reads': d.reads,
+        'peakMemory': peakMemory,
+        'nodes': len(proofGraph.nodes),
+        'edges': sum(len(node.outEdges) for node in proofGraph.nodes.values()),
+        'solutions': sum(len(node.solutions) for node in proofGraph.nodes.values()),
+        'rootSolutions': len(session.solutions),
+        'maxStackSize': max(stackSizes, default=0),
+        'meanStackSize': sum(stackSizes) / len(stackSizes) if len(stackSizes) != 0 else 0
+    }
+
+
+def measureMemberSearch(scenario, size, d, role, member):
+    # Esegue la ricerca mirata al membro member sulla policy fornita, misurandone tempi e letture,
+    # da confrontare con quelli della ricerca completa del medesimo scenario
+    times = []
+    for _ in range(args.repeat):
+        start = perf_counter()
+        d.searchMember(role, member)
+        times.append(perf_counter() - start)
+
+    d.reads = 0
+    solution = d.searchMember(role, member)
+    return {
+        'scenario': scenario,
+        'size': size,
+        'wallTimeMin': min(times),
+        'wallTimeMedian': median(times),
+        'reads': d.reads,
+        'weight': None if solution is None else solution.weight
+    }
+
+
+def saveResults(results):
+    # Salva i risultati raccolti finora, così che un'interruzione non comporti la perdita delle misure già eseguite
+    with open(args.output, 'w') as f:
+        json.dump({
+            'revision': revision,
+            'timestamp': timestamp,
+            'python': platform.python_version(),
+            'propagation': args.propagation,
+            'repeat': args.repeat,
+            'universities': args.universities,
+            'results': results
+        }, f, indent=2)
+
+
+def gitRevision():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+# -----------------------------------------------------
+
+revision = gitRevision()
+timestamp = strftime('%Y-%m-%dT%H:%M:%S')
+results = []
+for nEligibles in args.epapers:
+    d, role = epapersPolicy(nEligibles, args.universities)
+    results.append(runBenchmark('epapers', nEligibles, measureSearch, d, role))
+    print(results[-1])
+    # Ricerca mirata ad uno studente idoneo
+    results.append(runBenchmark('epapers_member', nEligibles, measureMemberSearch, d, role, principal(3)))
+    print(results[-1])
+    saveResults(results)
+for active in (True, False):
+    scenario = 'wot_active' if active else 'wot_passive'
+    for nPartecipants in args.wot:
+        d, role = wotPolicy(nPartecipants, active)
+        results.append(runBenchmark(scenario, nPartecipants, measureSearch, d, role))
+        print(results[-1])
+        # Ricerca mirata al partecipante a cui l'ultimo partecipante assegna direttamente il ruolo trust
+        results.append(runBenchmark(scenario + '_member', nPartecipants, measureMemberSearch, d, role, principal(nPartecipants - 2)))
+        print(results[-1])
+        saveResults(results)
+
+saveResults(results)
+print(f"Results saved to {args.output}")
@@ -24,6 +24,12 @@ contract DART {
     bytes1 constant EXPR_LI = 0x02;
     bytes1 constant EXPR_II = 0x03;
 
+    // Definisci le costanti identificative di ciascuna operazione sulle credenziali notificata tramite CredentialChanged
+    uint8 constant OP_NEW_ROLE = 0;
+    uint8 constant OP_ADD = 1;
+    uint8 constant OP_REMOVE = 2;
+    uint8 constant OP_UPDATE = 3;
+
     // Definisci la struttura dati per rappresentare le role expressions
     struct Expression {
         bytes1 exprType;
@@ -54,6 +60,24 @@ contract DART {
     mapping(bytes32 => Expression) exprPool;
     mapping(bytes32 => WAddressSet.Set) members;
 
+    // Evento emesso ad ogni alterazione di una credenziale avente come assigned role il ruolo assignedRoleId (principal.rolename).
+    // exprId ed i campi addrA, roleA, addrB, roleB identificano la role expression della credenziale (per le Simple Member,
+    // addrA è il membro ed i rolename sono nulli; per la creazione di un ruolo, la role expression è il ruolo stesso);
+    // weight è il nuovo valore di fiducia della credenziale, nullo per le rimozioni
+    event CredentialChanged(bytes32 indexed assignedRoleId, bytes32 indexed exprId, uint8 indexed operation,
+                            address principal, bytes2 rolename, address addrA, bytes2 roleA, address addrB, bytes2 roleB, uint8 weight);
+
+    function memberChanged(bytes2 _rolename, address _member, uint8 _weight, uint8 _operation) internal {
+        emit CredentialChanged(packExpr(msg.sender, _rolename), bytes32(bytes20(_member)), _operation,
+                               msg.sender, _rolename, _member, NULL_ROLENAME, NULL_PRINCIPAL, NULL_ROLENAME, _weight);
+    }
+
+    function inclusionChanged(bytes2 _rolename, bytes32 _exprId, uint8 _weight, uint8 _operation) internal {
+        Expression storage expr = exprPool[_exprId];
+        emit CredentialChanged(packExpr(msg.sender, _rolename), _exprId, _operation,
+                               msg.sender, _rolename, expr.addrA, expr.roleA, expr.addrB, expr.roleB, _weight);
+    }
+
     modifier rolenameNotNull(bytes2 _rolename) {
         require(_rolename != 0x00, "invalid rolename");
         _;
@@ -68,6 +92,7 @@ contract DART {
         expr.exprType = EXPR_SI;
         expr.addrA = msg.sender;
         expr.roleA = _rolename;
+        inclusionChanged(_rolename, packExpr(msg.sender, _rolename), 0, OP_NEW_ROLE);
     }
 
     function addSimpleMember(bytes2 _assignedRolename, address _member, uint8 _weight)
@@ -76,7 +101,9 @@ contract DART {
         bytes32 exprId = packExpr(msg.sender, _assignedRolename);
         require(exprPool[exprId].exprType == EXPR_SI, "local role does not exists");
 
-        return members[exprId].insert(_member, _weight);
+        bool inserted = members[exprId].insert(_member, _weight);
+        if(inserted) memberChanged(_assignedRolename, _member, _weight, OP_ADD);
+        return inserted;
     }
 
     function removeSimpleMember(bytes2 _assignedRolename, address _member)
@@ -86,6 +113,7 @@ contract DART {
         require(exprPool[exprId].exprType == EXPR_SI, "local role does not exists");
 
         members[exprId].remove(_member);
+        memberChanged(_assignedRolename, _member, 0, OP_REMOVE);
     }
 
     function updateSimpleMember(bytes2 _assignedRolename, address _member, uint8 _newWeight)
@@ -95,6 +123,7 @@ contract DART {
         require(exprPool[exprId].exprType == EXPR_SI, "local role does not exists");
 
         members[exprId].update(_member, _newWeight);
+        memberChanged(_assignedRolename, _member, _newWeight, OP_UPDATE);
     }
 
     function addSimpleInclusion(bytes2 _assignedRolename, address _principal, bytes2 _rolename, uint8 _weight)
@@ -107,7 +136,9 @@ contract DART {
         Expression storage remoteRole = exprPool[remoteRoleId];
         require(remoteRole.exprType == EXPR_SI, "remote role does not exists");
 
-        return (localRole.inclusions.insert(remoteRoleId, _weight), remoteRoleId);
+        bool inserted = localRole.inclusions.insert(remoteRoleId, _weight);
+        if(inserted) inclusionChanged(_assignedRolename, remoteRoleId, _weight, OP_ADD);
+        return (inserted, remoteRoleId);
     }
 
     function removeSimpleInclusion(bytes2 _assignedRolename, bytes32 _exprId)
@@ -119,6 +150,7 @@ contract DART {
 
         require(exprPool[_exprId].exprType == EXPR_SI, "not a simple inclusion");
         localRole.inclusions.remove(_exprId);
+        inclusionChanged(_assignedRolename, _exprId, 0, OP_REMOVE);
     }
 
     function updateSimpleInclusion(bytes2 _assignedRolename, bytes32 _exprId, uint8 _newWeight)
@@ -130,6 +162,7 @@ contract DART {
 
         require(exprPool[_exprId].exprType == EXPR_SI, "not a simple inclusion");
         localRole.inclusions.update(_exprId, _newWeight);
+        inclusionChanged(_assignedRolename, _exprId, _newWeight, OP_UPDATE);
     }
 
     function addLinkedInclusion(bytes2 _assignedRolename, address _principal, bytes2 _firstRolename, bytes2 _secondRolename, uint8 _weight)
@@ -150,7 +183,9 @@ contract DART {
         }
         linkedExpr.refCount++;
 
-        return (localRole.inclusions.insert(linkedExprId, _weight), linkedExprId);
+        bool inserted = localRole.inclusions.insert(linkedExprId, _weight);
+        if(inserted) inclusionChanged(_assignedRolename, linkedExprId, _weight, OP_ADD);
+        return (inserted, linkedExprId);
     }
 
     function removeLinkedInclusion(bytes2 _assignedRolename, bytes32 _exprId)
@@ -162,6 +197,7 @@ contract DART {
         Expression storage expr = exprPool[_exprId];
         require(expr.exprType == EXPR_LI, "not a linked inclusion");
         localRole.inclusions.remove(_exprId);
+        inclusionChanged(_assignedRolename, _exprId, 0, OP_REMOVE);
         expr.refCount--;
         if(expr.refCount == 0) delete exprPool[_exprId];
     }
@@ -174,6 +210,7 @@ contract DART {
 
         require(exprPool[_exprId].exprType == EXPR_LI, "not a linked inclusion");
         localRole.inclusions.update(_exprId, _newWeight);
+        inclusionChanged(_assignedRolename, _exprId, _newWeight, OP_UPDATE);
     }
     
     function addIntersectionInclusion(bytes2 _assignedRolename, address _firstPrincipal, bytes2 _firstRolename,
@@ -203,7 +240,9 @@ contract DART {
         }
         intersectionExpr.refCount++;
 
-        return localRole.inclusions.insert(intersectionExprId, _weight);
+        bool inserted = localRole.inclusions.insert(intersectionExprId, _weight);
+        if(inserted) inclusionChanged(_assignedRolename, intersectionExprId, _weight, OP_ADD);
+        return inserted;
     }
 
     function removeIntersectionInclusion(bytes2 _assignedRolename, bytes32 _exprId)
@@ -215,6 +254,7 @@ contract DART {
         Expression storage expr = exprPool[_exprId];
         require(expr.exprType == EXPR_II, "not an intersection inclusion");
         localRole.inclusions.remove(_exprId);
+        inclusionChanged(_assignedRolename, _exprId, 0, OP_REMOVE);
         expr.refCount--;
         if(expr.refCount == 0) delete exprPool[_exprId];
     }
@@ -227,6 +267,7 @@ contract DART {
 
         require(exprPool[_exprId].exprType == EXPR_II, "not an intersection inclusion");
         localRole.inclusions.update(_exprId, _newWeight);
+        inclusionChanged(_assignedRolename, _exprId, _newWeight, OP_UPDATE);
     }
 
     // ----------------------------------------------------- //
@@ -243,6 +284,26 @@ contract DART {
     }
 
     function verifyProof(bytes32[] calldata _proof, uint _stackSize) external view returns (Solution memory) {
+        return checkProof(_proof, _stackSize);
+    }
+
+    function verifyProofs(bytes32[][] calldata _proofs, uint[] calldata _stackSizes) external view
+        returns (Solution[] memory results, uint[] memory gasUsed)
+    {
+        require(_proofs.length == _stackSizes.length, "proofs and stack sizes length mismatch");
+
+        results = new Solution[](_proofs.length);
+        gasUsed = new uint[](_proofs.length);
+
+        // Verifica ciascuna dimostrazione, misurandone il gas consumato
+        for(uint k = 0; k < _proofs.length; k++) {
+            uint gasStart = gasleft();
+            results[k] = checkProof(_proofs[k], _stackSizes[k]);
+            gasUsed[k] = gasStart - gasleft();
+        }
+    }
+
+    function checkProof(bytes32[] calldata _proof, uint _stackSize) internal view returns (Solution memory) {
         Solution[] memory solStack = new Solution[](_stackSize);
         uint i;
         uint j;
@@ -376,6 +437,12 @@ contract DART {
         return exprPool[_exprId].exprType != EXPR_NC;
     }
 
+    function exprsExist(bytes32[] calldata _exprIds) external view returns(bool[] memory result) {
+        result = new bool[](_exprIds.length);
+        for(uint i = 0; i < _exprIds.length; i++)
+            result[i] = exprPool[_exprIds[i]].exprType != EXPR_NC;
+    }
+
     function getMembersCount(bytes32 _roleId) external view returns(uint) {
         return members[_roleId].size();
     }
@@ -384,6 +451,13 @@ contract DART {
         return members[_roleId].get(index);
     }
 
+    function getMemberWeight(bytes32 _roleId, address _member) external view returns(bool, uint8) {
+        uint memberPointer = members[_roleId].getPointer(_member);
+        if(memberPointer == 0)
+            return (false, 0);
+        return (true, members[_roleId].getWeight(memberPointer - 1));
+    }
+
     function getInclusionsCount(bytes32 _roleId) external view returns(uint) {
         return exprPool[_roleId].inclusions.size();
     }
@@ -398,5 +472,55 @@ contract DART {
 
         return (expr.addrA, expr.addrB, expr.roleA, expr.roleB, weight);
     }
- 
+
+    // ----------------------------------------------------- //
+
+    // Definisci le strutture dati restituite dalle letture aggregate delle credenziali
+    struct MemberEntry {
+        address member;
+        uint8 weight;
+    }
+
+    struct InclusionEntry {
+        address addrA;
+        address addrB;
+        bytes2 roleA;
+        bytes2 roleB;
+        uint8 weight;
+    }
+
+    function getMembers(bytes32[] calldata _roleIds) external view returns(MemberEntry[][] memory result) {
+        result = new MemberEntry[][](_roleIds.length);
+
+        for(uint i = 0; i < _roleIds.length; i++) {
+            WAddressSet.Set storage roleMembers = members[_roleIds[i]];
+            uint n = roleMembers.size();
+
+            result[i] = new MemberEntry[](n);
+            for(uint j = 0; j < n; j++)
+                (result[i][j].member, result[i][j].weight) = roleMembers.get(j);
+        }
+    }
+
+    function getInclusions(bytes32[] calldata _roleIds) external view returns(InclusionEntry[][] memory result) {
+        result = new InclusionEntry[][](_roleIds.length);
+
+        for(uint i = 0; i < _roleIds.length; i++) {
+            WBytes32Set.Set storage roleInclusions = exprPool[_roleIds[i]].inclusions;
+            uint n = roleInclusions.size();
+
+            result[i] = new InclusionEntry[](n);
+            for(uint j = 0; j < n; j++) {
+                bytes32 exprId;
+                (exprId, result[i][j].weight) = roleInclusions.get(j);
+
+                Expression storage expr = exprPool[exprId];
+                result[i][j].addrA = expr.addrA;
+                result[i][j].addrB = expr.addrB;
+                result[i][j].roleA = expr.roleA;
+                result[i][j].roleB = expr.roleB;
+            }
+        }
+    }
+
 }
\ No newline at end of file
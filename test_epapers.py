@@ -86,28 +86,36 @@ def expr2str(expr):
 # Registra ruoli e credenziali per istanziare la policy di test EPapers
 print("Loading policy... ", end='')
 
-d.newRole(RN['canAccess'], {'from': PR['EPapers']})
-d.newRole(RN['student'], {'from': PR['EOrg']})
-d.newRole(RN['member'], {'from': PR['EOrg']})
-d.newRole(RN['university'], {'from': PR['EOrg']})
-d.newRole(RN['university'], {'from': PR['StateA']})
+roles = [
+    SIExpression(PR['EPapers'], RN['canAccess']),
+    SIExpression(PR['EOrg'], RN['student']),
+    SIExpression(PR['EOrg'], RN['member']),
+    SIExpression(PR['EOrg'], RN['university']),
+    SIExpression(PR['StateA'], RN['university'])
+]
 for uniAddr in addressesOfUniversities:
-    d.newRole(RN['student'], {'from': uniAddr})
+    roles.append(SIExpression(uniAddr, RN['student']))
 
+credentials = []
 for idx, principalAddr in enumerate(addressesOfEligibles):
     # Registra il principal a EOrg.member
-    d.addSimpleMember(RN['member'], SMExpression(principalAddr), 100, {'from': PR['EOrg']})
+    credentials.append(Credential(PR['EOrg'], RN['member'], SMExpression(principalAddr), 100))
     # Registra il principal come studente di una delle università
-    d.addSimpleMember(RN['student'], SMExpression(principalAddr), 100, {'from': addressesOfUniversities[idx % len(addressesOfUniversities)]})
+    credentials.append(Credential(addressesOfUniversities[idx % len(addressesOfUniversities)], RN['student'], SMExpression(principalAddr), 100))
 for uniAddr in addressesOfUniversities:
     # StateA.university ←− Uni_X
-    d.addSimpleMember(RN['university'], SMExpression(uniAddr), 100, {'from': PR['StateA']})
+    credentials.append(Credential(PR['StateA'], RN['university'], SMExpression(uniAddr), 100))
 # EOrg.university ←− StateA.university
-d.addSimpleInclusion(RN['university'], SIExpression(PR['StateA'], RN['university']), 100, {'from': PR['EOrg']})
+credentials.append(Credential(PR['EOrg'], RN['university'], SIExpression(PR['StateA'], RN['university']), 100))
 # EOrg.student ←− EOrg.university.student
-d.addLinkedInclusion(RN['student'], LIExpression(PR['EOrg'], RN['university'], RN['student']), 100, {'from': PR['EOrg']})
+credentials.append(Credential(PR['EOrg'], RN['student'], LIExpression(PR['EOrg'], RN['university'], RN['student']), 100))
 # EPapers.canAccess ←− EOrg.member ∩ EOrg.student
-d.addIntersectionInclusion(RN['canAccess'], IIExpression(PR['EOrg'], RN['student'], PR['EOrg'], RN['member']), 50, {'from': PR['EPapers']})
+credentials.append(Credential(PR['EPapers'], RN['canAccess'], IIExpression(PR['EOrg'], RN['student'], PR['EOrg'], RN['member']), 50))
+
+(roleResults, credResults) = d.loadPolicy(credentials, roles)
+for res in roleResults + credResults:
+    if res['error'] is not None:
+        print(f"ERROR: unable to load {res['request']}: {res['error']}")
 
 print("Done")
 
@@ -119,27 +127,28 @@ solutions = d.search(SIExpression(PR['EPapers'], RN['canAccess']))
 print(f"Found solutions: {len(solutions)}")
 
 # Per ciascun membro trovato, costruiscine la dimostrazione per il metodo di verifica on-chain sulla base dei paths nelle soluzioni
-for idx, currSol in enumerate(solutions.values()):
+# e verificale on-chain in blocco
+verifResults = d.verifyProofs(list(solutions.values()))
+for idx, (currSol, (verifRes, checkGas)) in enumerate(zip(solutions.values(), verifResults)):
     print(f'\nSolution #{idx+1}: member={INV_PR[currSol.member]}, weight={currSol.weight}')
     proofStrs = []
-    proof = []
     for currEdge in currSol.path:
         if not isinstance(currEdge.toNode.expr, LIExpression):
             proofStrs.append(expr2str(currEdge.toNode.expr) + ' ←- ' + expr2str(currEdge.fromNode.expr))
-            proof.append(currEdge.toNode.expr.id)
-            proof.append(currEdge.fromNode.expr.id)
 
-    # Verifica la dimostrazione on-chain
+    # Mostra l'esito della verifica on-chain
     print('On-chain verification proof:')
     pprint(proofStrs)
 
-    verifGas = d.contract.functions.verifyProof(proof, currSol.reqStackSize).estimateGas()
-    verifRes = d.verifyProof(proof, currSol.reqStackSize)
     if verifRes['principal'] != PR['EPapers'] or verifRes['rolename'] != RN['canAccess'] or verifRes['member'] != currSol.member:
         print("ERROR: invalid proof for current solution!")
     else:
         verifRes['principal'] = INV_PR[verifRes['principal']]
         verifRes['rolename'] = INV_RN[verifRes['rolename']]
         verifRes['member'] = INV_PR[verifRes['member']]
+    # Il gas di verifica è stimato, come nelle misure di riferimento, per una transazione verifyProof completa;
+    # verifyProofs misura invece il solo gas di esecuzione di checkProof, privo del costo base e dei calldata
+    verifGas = d.contract.functions.verifyProof(compileProof(currSol), currSol.reqStackSize).estimateGas()
     print(f'On-chain verification gas: {verifGas}')
+    print(f'In-contract execution gas (checkProof): {checkGas}')
     print(f'On-chain verification result: {verifRes}')
\ No newline at end of file
@@ -0,0 +1,239 @@
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+from DART import *
+
+# -----------------------------------------------------
+
+parser = argparse.ArgumentParser(description='Esegui i controlli di regressione del backward search algorithm su policy casuali, tramite il backend locale LocalDART.')
+parser.add_argument('--seeds', type=int,
+                        default=100,
+                        help="numero di policy casuali generate (default: 100)")
+parser.add_argument('--principals', type=int,
+                        default=12,
+                        help="numero di principal di ciascuna policy (default: 12)")
+parser.add_argument('--roles', type=int,
+                        default=10,
+                        help="numero di ruoli di ciascuna policy (default: 10)")
+parser.add_argument('--max-depth', dest='max_depth', type=int,
+                        default=6,
+                        help="profondità massima, in passaggi di fiducia, dei controlli di maxDepth (default: 6)")
+args = parser.parse_args()
+
+ROLENAMES = ['0x0001', '0x0002']
+TOLERANCE = 1e-9
+
+failures = 0
+
+def check(condition, description):
+    # Registra l'esito di un controllo, riportando quelli falliti
+    global failures
+    if not condition:
+        failures += 1
+        print(f"FAILED: {description}")
+
+def weights(solutions):
+    return {member: solution.weight for member, solution in solutions.items()}
+
+def sameWeights(a, b):
+    return a.keys() == b.keys() and all(abs(a[member] - b[member]) <= TOLERANCE for member in a)
+
+# -----------------------------------------------------
+
+# Generazione delle policy casuali
+
+def principal(i):
+    return Web3.toChecksumAddress('0x' + format(i + 1, '040x'))
+
+def randomPolicy(seed):
+    # Restituisce i ruoli (principal, rolename) di una policy casuale e le relative credenziali Credential,
+    # al più una per ciascuna coppia (assigned role, role expression)
+    rnd = random.Random(seed)
+    principals = [principal(i) for i in range(args.principals)]
+    roles = list(dict.fromkeys((rnd.choice(principals), rnd.choice(ROLENAMES)) for _ in range(args.roles)))
+    credentials = {}
+    for (p, r) in roles:
+        for _ in range(rnd.randint(0, 3)):
+            expr = SMExpression(rnd.choice(principals))
+            credentials[(p, r, expr)] = Credential(p, r, expr, rnd.randint(1, MAX_WEIGHT))
+        for _ in range(rnd.randint(0, 2)):
+            k = rnd.random()
+            (q, s) = rnd.choice(roles)
+            if k < 0.5:
+                expr = SIExpression(q, s)
+            elif k < 0.8:
+                expr = LIExpression(q, s, rnd.choice(ROLENAMES))
+            else:
+                (q2, s2) = rnd.choice(roles)
+                expr = IIExpression(q, s, q2, s2)
+            credentials[(p, r, expr)] = Credential(p, r, expr, rnd.randint(1, MAX_WEIGHT))
+    return roles, list(credentials.values())
+
+def credentialKind(credential):
+    return {SMExpression: 'SimpleMember', SIExpression: 'SimpleInclusion',
+            LIExpression: 'LinkedInclusion', IIExpression: 'IntersectionInclusion'}[type(credential.expr)]
+
+def addCredential(dart, credential):
+    getattr(dart, 'add' + credentialKind(credential))(credential.roleName, credential.expr, credential.weight, {'from': credential.principal})
+
+def removeCredential(dart, credential):
+    getattr(dart, 'remove' + credentialKind(credential))(credential.roleName, credential.expr, {'from': credential.principal})
+
+def updateCredential(dart, credential):
+    getattr(dart, 'update' + credentialKind(credential))(credential.roleName, credential.expr, credential.weight, {'from': credential.principal})
+
+def loadPolicy(roles, credentials):
+    d = LocalDART()
+    for (p, r) in roles:
+        d.newRole(r, {'from': p})
+    for credential in credentials:
+        addCredential(d, credential)
+    return d
+
+# -----------------------------------------------------
+
+# Valori di fiducia attesi entro maxDepth passaggi di fiducia, calcolati per punto fisso sul numero di passaggi
+
+def bestWithinHops(credentials, maxHops):
+    # best[k][role] associa a ciascun membro il valore di fiducia massimo delle soluzioni di role con al più k passaggi:
+    # una Simple Member conta un passaggio, Simple ed Intersection Inclusion ne aggiungono uno,
+    # una Linked Inclusion somma i passaggi della soluzione di supporto e del ruolo linkato
+    best = [{} for _ in range(maxHops + 1)]
+    for k in range(1, maxHops + 1):
+        for credential in credentials:
+            out = best[k].setdefault(credential.role, {})
+            def offer(member, weight):
+                if weight > out.get(member, -1):
+                    out[member] = weight
+            expr = credential.expr
+            if isinstance(expr, SMExpression):
+                offer(expr.member, credential.weight)
+            elif isinstance(expr, SIExpression):
+                for member, weight in best[k-1].get(expr, {}).items():
+                    offer(member, (weight * credential.weight) / MAX_WEIGHT)
+            elif isinstance(expr, LIExpression):
+                for supportHops in range(1, k):
+                    for linked, supportWeight in best[supportHops].get(SIExpression(expr.principal, expr.roleNameA), {}).items():
+                        for member, weight in best[k - supportHops].get(SIExpression(linked, expr.roleNameB), {}).items():
+                            offer(member, (((weight * supportWeight) / MAX_WEIGHT) * credential.weight) / MAX_WEIGHT)
+            else:
+                roleA = SIExpression(expr.principalA, expr.roleNameA)
+                roleB = SIExpression(expr.principalB, expr.roleNameB)
+                if roleA == roleB:
+                    continue
+                solutionsA = best[k-1].get(roleA, {})
+                solutionsB = best[k-1].get(roleB, {})
+                for member in solutionsA.keys() & solutionsB.keys():
+                    offer(member, (min(solutionsA[member], solutionsB[member]) * credential.weight) / MAX_WEIGHT)
+    return best
+
+# -----------------------------------------------------
+
+def checkModes(seed, d, role, reference):
+    # Le varianti della ricerca restituiscono i medesimi valori di fiducia della ricerca ricorsiva
+    tag = f"seed {seed}, role {role.principal[-4:]}.{role.roleName}"
+    check(sameWeights(weights(d.search(role, propagation=PRIORITY_PROPAGATION)), reference), f"{tag}: priority propagation")
+    check(sameWeights(weights(d.search(role, deferLinks=True)), reference), f"{tag}: deferLinks")
+    check(sameWeights(weights(d.search(role, bulkJoins=True)), reference), f"{tag}: bulkJoins")
+    check(sameWeights(weights(d.search(role, propagation=PRIORITY_PROPAGATION, deferLinks=True, bulkJoins=True)), reference),
+          f"{tag}: priority propagation with deferLinks and bulkJoins")
+    check(sameWeights(weights(asyncio.run(d.searchAsync(role, batchSize=2))), reference), f"{tag}: searchAsync")
+    check(sameWeights(weights(d.searchArrays(role)), reference), f"{tag}: searchArrays")
+    check(sameWeights(weights(d.searchMany([role])[role]), reference), f"{tag}: searchMany")
+
+    streamed = {}
+    for solution in d.searchIter(role, batchSize=2):
+        streamed[solution.member] = max(solution.weight, streamed.get(solution.member, 0))
+    check(sameWeights(streamed, reference), f"{tag}: searchIter")
+
+    for minWeight in (10, 50):
+        expected = {member: weight for member, weight in reference.items() if weight >= minWeight}
+        check(sameWeights(weights(d.search(role, minWeight=minWeight)), expected), f"{tag}: minWeight {minWeight}")
+
+    for i in range(args.principals):
+        member = principal(i)
+        solution = d.searchMember(role, member)
+        if member in reference:
+            check(solution is not None and abs(solution.weight - reference[member]) <= TOLERANCE, f"{tag}: searchMember {member[-4:]}")
+        else:
+            check(solution is None, f"{tag}: searchMember {member[-4:]} (not a member)")
+
+def checkDepth(seed, d, role, best):
+    # Le ricerche limitate da maxDepth restituiscono, per ciascun membro, il valore di fiducia massimo entro il limite
+    for maxDepth in range(0, args.max_depth + 1):
+        expected = best[maxDepth].get(role, {})
+        for propagation in (RECURSIVE_PROPAGATION, PRIORITY_PROPAGATION):
+            solutions = d.search(role, propagation=propagation, maxDepth=maxDepth)
+            check(sameWeights(weights(solutions), expected) and all(solution.hops <= maxDepth for solution in solutions.values()),
+                  f"seed {seed}, role {role.principal[-4:]}.{role.roleName}: maxDepth {maxDepth} with {propagation} propagation")
+
+def checkSession(seed, roles, credentials):
+    # Una sessione aggiornata tramite inserimenti, rimozioni e modifiche delle credenziali restituisce le stesse soluzioni
+    # di una nuova ricerca; lo stesso vale per la sessione ripresa dal relativo ProofGraph salvato su file
+    rnd = random.Random(seed)
+    credentials = list(credentials)
+    rnd.shuffle(credentials)
+    split = rnd.randint(0, len(credentials))
+    d = loadPolicy(roles, credentials[:split])
+    role = SIExpression(*rnd.choice(roles))
+    tag = f"seed {seed}, session on {role.principal[-4:]}.{role.roleName}"
+
+    session = d.searchSession(role)
+    for credential in credentials[split:]:
+        addCredential(d, credential)
+    check(sameWeights(weights(session.addCredentials(credentials[split:])), weights(d.search(role))), f"{tag}: addCredentials")
+
+    for step in range(4):
+        if len(credentials) == 0:
+            break
+        credential = rnd.choice(credentials)
+        if rnd.random() < 0.5:
+            credentials.remove(credential)
+            removeCredential(d, credential)
+            solutions = session.removeCredentials([credential])
+            operation = 'removeCredentials'
+        else:
+            credential.weight = rnd.randint(1, MAX_WEIGHT)
+            updateCredential(d, credential)
+            solutions = session.updateCredentials([credential])
+            operation = 'updateCredentials'
+        check(sameWeights(weights(solutions), weights(d.search(role))), f"{tag}: {operation} (step {step})")
+
+    (fd, path) = tempfile.mkstemp(suffix='.bin')
+    os.close(fd)
+    try:
+        saveProofGraph(session.proofGraph, path)
+        with ProofGraphImage(path) as image:
+            check(sameWeights(weights(image.solutions(role) or {}), weights(session.solutions)), f"{tag}: image solutions")
+        resumed = SearchSession(d, role, proofGraph=loadProofGraph(path, d))
+        check(sameWeights(weights(resumed.solutions), weights(session.solutions)), f"{tag}: image round-trip")
+        if len(credentials) != 0:
+            credential = rnd.choice(credentials)
+            credentials.remove(credential)
+            removeCredential(d, credential)
+            check(sameWeights(weights(resumed.removeCredentials([credential])), weights(d.search(role))), f"{tag}: resumed session update")
+    finally:
+        os.remove(path)
+
+# -----------------------------------------------------
+
+print(f"Running regression checks on {args.seeds} random policies... ", end='', flush=True)
+for seed in range(args.seeds):
+    roles, credentials = randomPolicy(seed)
+    d = loadPolicy(roles, credentials)
+    best = bestWithinHops(credentials, args.max_depth)
+    for (p, r) in roles[:4]:
+        role = SIExpression(p, r)
+        reference = weights(d.search(role))
+        checkModes(seed, d, role, reference)
+        checkDepth(seed, d, role, best)
+    checkSession(seed, roles, credentials)
+print("Done")
+
+if failures != 0:
+    print(f"{failures} checks failed")
+    sys.exit(1)
+print("All checks passed")
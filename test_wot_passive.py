@@ -91,22 +91,19 @@ for i in range(1, nPartecipants):
     print(f"Found solutions: {len(solutions)}")
 
     # Per ciascun membro trovato, costruiscine la dimostrazione per il metodo di verifica on-chain sulla base dei paths nelle soluzioni
-    for idx, currSol in enumerate(solutions.values()):
+    # e verificale on-chain in blocco
+    verifResults = d.verifyProofs(list(solutions.values()))
+    for idx, (currSol, (verifRes, checkGas)) in enumerate(zip(solutions.values(), verifResults)):
         print(f'\nSolution #{idx+1}: member={INV_PR[currSol.member]}, weight={currSol.weight}')
         proofStrs = []
-        proof = []
         for currEdge in currSol.path:
             if not isinstance(currEdge.toNode.expr, LIExpression):
                 proofStrs.append(expr2str(currEdge.toNode.expr) + ' ←- ' + expr2str(currEdge.fromNode.expr))
-                proof.append(currEdge.toNode.expr.id)
-                proof.append(currEdge.fromNode.expr.id)
 
-        # Verifica la dimostrazione on-chain
+        # Mostra l'esito della verifica on-chain
         print('Constructed verification proof:')
         pprint(proofStrs)
         print(f'Required stack size: {currSol.reqStackSize}')
-        verifGas = d.contract.functions.verifyProof(proof, currSol.reqStackSize).estimateGas()
-        verifRes = d.verifyProof(proof, currSol.reqStackSize)
         if verifRes['principal'] != accounts[i] or verifRes['rolename'] != RN['trust'] or verifRes['member'] != currSol.member or verifRes['weight'] != int(currSol.weight):
             print("ERROR: invalid proof for current solution!")
         else:
@@ -114,5 +111,9 @@ for i in range(1, nPartecipants):
             verifRes['rolename'] = INV_RN[verifRes['rolename']]
             verifRes['member'] = INV_PR[verifRes['member']]
         
+        # Il gas di verifica è stimato, come nelle misure di riferimento, per una transazione verifyProof completa;
+        # verifyProofs misura invece il solo gas di esecuzione di checkProof, privo del costo base e dei calldata
+        verifGas = d.contract.functions.verifyProof(compileProof(currSol), currSol.reqStackSize).estimateGas()
         print(f'On-chain verification gas: {verifGas}')
+        print(f'In-contract execution gas (checkProof): {checkGas}')
         print(f'On-chain verification result: {verifRes}')